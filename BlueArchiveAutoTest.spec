@@ -13,15 +13,26 @@ PyInstaller를 사용하여 GUI 테스트 러너를 단일 실행 파일로 패
 
 from PyInstaller.utils.hooks import collect_data_files, collect_submodules
 import os
+import sys
+import subprocess
 
 block_cipher = None
 
 # 프로젝트 루트 경로
 project_root = os.path.abspath('.')
 
+# 템플릿 번들 생성 (템플릿 PNG를 미리 디코딩/스케일링한 메모리 맵 배열)
+subprocess.run(
+    [sys.executable, os.path.join(project_root, 'tools', 'build_template_bundle.py')],
+    check=True
+)
+
 # 데이터 파일 수집
 datas = [
     ('assets/templates', 'assets/templates'),  # 템플릿 이미지
+    ('assets/glyphs', 'assets/glyphs'),  # 숫자 글리프 세트
+    ('assets/template_bundle.npy', 'assets'),  # 템플릿 번들
+    ('assets/template_bundle.json', 'assets'),  # 템플릿 번들 인덱스
     ('config', 'config'),  # 설정 파일
     ('src', 'src'),  # 소스 코드 (동적 임포트 대응)
     ('tests', 'tests'),  # 테스트 스크립트
@@ -18,7 +18,9 @@ else:
 # 디렉토리 경로
 ASSETS_DIR = PROJECT_ROOT / "assets"
 TEMPLATES_DIR = ASSETS_DIR / "templates"
+GLYPHS_DIR = ASSETS_DIR / "glyphs"  # 숫자 글리프 세트 (tools/build_glyph_set.py로 생성)
 LOGS_DIR = PROJECT_ROOT / "logs"
+CACHE_DIR = PROJECT_ROOT / "cache"
 
 # 해상도 설정 파일
 SETTINGS_FILE = PROJECT_ROOT / "config" / "display_settings.json"
@@ -76,16 +78,102 @@ UI_DIR = RESOLUTION_DIR / "ui"
 TEMPLATE_MATCHING_CONFIDENCE = 0.8  # 신뢰도 임계값
 TEMPLATE_MATCHING_RETRY = 3  # 재시도 횟수
 TEMPLATE_MATCHING_TIMEOUT = 30  # 타임아웃 (초)
+TEMPLATE_RETRY_WINDOW_PER_RETRY = 0.5  # 재시도 1회당 find_template 재검색 시간 창 (초, 창 안에서는 PollScheduler 간격으로 재검색)
+TEMPLATE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 스케일링된 템플릿 메모리 캐시 최대 크기 (바이트)
+TEMPLATE_MASK_THRESHOLD = 128  # 마스크 이진화 임계값 (알파/마스크 값이 이 이상이면 매칭에 사용)
+RESULT_CACHE_MAX_ENTRIES = 512  # 크롭 내용 기반 OCR/코스트 인식 결과 캐시 최대 항목 수 (0이면 캐시 미사용)
+TEMPLATE_BUNDLE_FILE = ASSETS_DIR / "template_bundle.npy"  # 사전 컴파일 템플릿 번들 (tools/build_template_bundle.py로 생성)
+TEMPLATE_BUNDLE_INDEX = ASSETS_DIR / "template_bundle.json"  # 템플릿 번들 인덱스
+TEMPLATE_BUNDLE_MAX_PIXELS = 1024 * 1024  # 번들에 포함할 템플릿 최대 픽셀 수 (전체 화면 캡처 참조 이미지 제외)
+
+# 피라미드(coarse-to-fine) 매칭 설정
+TEMPLATE_PYRAMID_SCALE = 0.5  # 축소 매칭 배율 (0.5 = 1/2, 0.25 = 1/4)
+TEMPLATE_PYRAMID_CANDIDATES = 3  # 원본 해상도로 재검증할 후보 수
+TEMPLATE_PYRAMID_COARSE_MARGIN = 0.15  # 축소 단계 임계값 완화폭 (confidence - margin)
+TEMPLATE_PYRAMID_MIN_SIZE = 12  # 축소 후 템플릿 최소 변 길이 (이보다 작으면 원본 매칭)
+
+# 다중 매칭 (find_all: 한 번의 매칭으로 같은 템플릿의 모든 인스턴스 추출)
+TEMPLATE_FIND_ALL_MAX_RESULTS = 20  # 최대 추출 개수 (발판 등)
+
+# 위치 힌트 (마지막 발견 위치 주변 우선 검색)
+TEMPLATE_HINT_PADDING = 40  # 힌트 위치 주변 검색 여백 (픽셀)
+TEMPLATE_HINTS_PERSIST = False  # 힌트를 디스크에 저장/복원할지 여부
+TEMPLATE_HINTS_FILE = CACHE_DIR / "template_hints.json"  # 힌트 저장 파일
+TEMPLATE_HINT_CATEGORIES = ("buttons", "ui")  # 힌트 적용 템플릿 폴더 (위치 고정 UI만, 발판/마커 제외)
+
+# 화면 캡처 설정
+# (CI 등 헤드리스 환경에서는 같은 이름의 환경 변수로 지정 가능)
+CAPTURE_BACKEND = os.environ.get("CAPTURE_BACKEND", "auto")  # "auto" (Linux X11이면 xshm, 아니면 pyautogui) | "xshm" | "pyautogui" | "replay"
+REPLAY_SOURCE = os.environ.get("REPLAY_SOURCE")  # replay 백엔드: 녹화 프레임 PNG 디렉토리 또는 동영상 파일 경로
+REPLAY_TIMELINE = os.environ.get("REPLAY_TIMELINE")  # replay 백엔드: 화면 전환 타임라인 JSON 경로 (None이면 클릭마다 다음 프레임)
+REPLAY_FRAME_CACHE_SIZE = 8  # replay 백엔드: 디코딩 프레임 캐시 최대 개수 (최근 사용 순, 1440p 프레임당 약 15MB)
+CAPTURE_USE_FRAME_SOURCE = False  # 백그라운드 스레드 연속 캡처 사용 여부 (기본 매처/컨트롤러에 적용)
+CAPTURE_FPS = 15  # 백그라운드 캡처 목표 fps
+CAPTURE_RING_SIZE = 8  # 백그라운드 캡처 링 버퍼 프레임 수 (프레임 유효 시간 ≈ (링 크기 - 1) / fps)
+
+# OCR 엔진 설정
+OCR_BACKEND = os.environ.get("OCR_BACKEND", "auto")  # "auto" (libtesseract가 있으면 tesseract_api, 아니면 pytesseract) | "tesseract_api" | "pytesseract"
+OCR_POOL_WORKERS = 2  # OCR 프로세스 풀 워커 수
+OCR_POOL_MAX_PENDING = 16  # OCR 프로세스 풀 최대 대기 작업 수 (초과 시 제출 대기)
+OCR_POOL_TIMEOUT = 10.0  # OCR 프로세스 풀 작업별 기본 타임아웃 (초)
+OCR_USE_GLYPHS = True  # 데미지/코스트 숫자를 글리프 인식으로 먼저 읽기 (실패 시 Tesseract)
+DIGIT_MIN_SCORE = 0.7  # 글리프 인식 최소 유사도 (모든 글리프가 넘어야 인식 성공)
 
 # 대기 시간 설정 (초)
 WAIT_SCREEN_TRANSITION = 1.5  # 화면 전환 대기
 WAIT_ANIMATION = 0.8  # 애니메이션 대기
 WAIT_BATTLE_LOADING = 4.0  # 전투 로딩 대기
 WAIT_SKILL_COOLDOWN = 0.3  # 스킬 쿨다운 확인 간격
+WAIT_ENEMY_PHASE = 6.0  # Phase 종료 후 적 이동으로 전투가 시작되는지 확인하는 최대 시간
+
+# 화면 안정화 감지 (고정 대기 대신 화면 변화가 멈추면 바로 진행)
+STABLE_SIGNATURE_SIZE = (64, 36)  # 비교용 축소 프레임 크기 (width, height)
+STABLE_DIFF_THRESHOLD = 0.01  # 연속 프레임 평균 차이 임계값 (0~1, 이하이면 변화 없음)
+STABLE_CHECK_INTERVAL = 0.1  # 프레임 비교 간격 (초)
+STABLE_REQUIRED_FRAMES = 2  # 연속으로 변화가 없어야 하는 비교 횟수
+STABLE_MIN_WAIT = 0.2  # 클릭 후 화면 반응이 시작되기 전 최소 대기 (초)
+
+# 대기 루프 프레임 변화 게이트 (검색 영역이 바뀌지 않았으면 이전 매칭 결과 재사용)
+WAIT_GATE_BLOCK_SIZE = 16  # 변화 감지용 축소 블록 크기 (픽셀, 블록 평균 비교)
+WAIT_GATE_THRESHOLD = 0.02  # 블록 하나라도 이 값 이상 바뀌면 다시 매칭 (0~1, 0이면 항상 매칭)
+
+# 폴링 스케줄러 (절대 마감 시각 + 적응형 간격)
+POLL_MIN_INTERVAL = 0.05  # 첫 폴링 간격 (초, 캡처 지연 수준)
+POLL_MAX_INTERVAL = 0.5  # 기본 최대 폴링 간격 (초, 대기 함수의 check_interval이 있으면 그 값)
+POLL_BACKOFF = 1.5  # 놓칠 때마다 간격 증가 배율
+POLL_PRIOR_MARGIN = 0.3  # 예상 출현 시각보다 이 비율만큼 일찍 빠른 폴링 시작
+POLL_PRIOR_ALPHA = 0.3  # 템플릿별 출현 시간 지수 이동 평균 가중치
+
+# 화면 상태 분류 (썸네일 + 색상 히스토그램 최근접 이웃)
+SCREEN_THUMBNAIL_SIZE = (32, 18)  # 설명자 축소 프레임 크기 (width, height)
+SCREEN_HIST_BINS = (12, 4)  # HSV 히스토그램 구간 수 (색상, 채도)
+SCREEN_HIST_WEIGHT = 0.3  # 거리 계산 시 히스토그램 가중치 (0~1, 나머지는 썸네일)
+SCREEN_UNKNOWN_DISTANCE = 0.12  # 가장 가까운 기준 화면과의 거리가 이 값을 넘으면 알 수 없는 화면
 
 # 스킬 사용 관련
 SKILL_CHECK_INTERVAL = 0.5  # 스킬 사용 가능 확인 간격
 MAX_SKILL_WAIT_TIME = 30  # 스킬 사용 최대 대기 시간
+BATTLE_COST_CHECK_INTERVAL = 1.0  # 전투 중 코스트 게이지 판독 간격 (Victory 대기와 동시 실행)
+
+# 스테이지 맵 발판 이동
+TILE_SEARCH_RADIUS = 300  # 캐릭터 기준 이동 가능 발판 탐색 반경 (픽셀)
+CHARACTER_MARKER_OFFSET_Y = 250  # 캐릭터 마커 중심 → 캐릭터 발 위치 세로 보정 (픽셀)
+
+# 캐릭터 마커 추적 (전체 화면 검색 1회 후 예측 위치 주변만 검색)
+MARKER_TRACK_MARGIN = 60  # 예측 위치 주변 검색 여백 (픽셀)
+MARKER_TRACK_SCORE_DROP = 0.05  # 전체 검색 때보다 신뢰도가 이만큼 떨어지면 전체 화면 재검색
+MARKER_TRACK_INTERVAL = 0.05  # 이동 확인 시 프레임 간격 (초)
+MARKER_MOVE_MIN_DISTANCE = 10  # 이동으로 판단할 최소 마커 이동 거리 (픽셀)
+MARKER_MOVE_TIMEOUT = 3.0  # 마커 이동 확인 최대 대기 시간 (초)
+
+# 스테이지 맵 모델 (발판 격자를 한 번 검출한 뒤 칸 단위로 분류)
+STAGE_MAP_DETECT_THRESHOLD = 0.6  # 격자 검출 시 발판 템플릿 매칭 임계값
+STAGE_MAP_CELL_THRESHOLD = 0.5  # 칸 분류 최소 점수 (미만이면 "unknown")
+STAGE_MAP_SEARCH_MARGIN = 40  # 칸 분류 시 템플릿 위치 허용 오차 (픽셀, 현재 해상도 기준)
+STAGE_MAP_CHANGE_THRESHOLD = 0.02  # 칸 재분류 기준 픽셀 변화량 (평균 절대 차이, 0~1)
+STAGE_MAP_NEIGHBOR_TOLERANCE = 0.25  # 인접 판정 허용 오차 (발판 간격 대비 비율)
+STAGE_MAP_HEX_DIRECTIONS = ((1.0, 0.0), (0.34, 0.84), (0.66, -0.84))  # 기본 육각 격자 인접 방향 (가로 간격 대비, 검출된 발판으로 추정하지 못한 방향만 사용)
+STAGE_MAP_MOVE_RANGE = 1  # 한 번에 이동할 수 있는 칸 수
 
 # 로그 설정
 LOG_LEVEL = "INFO"
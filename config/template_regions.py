@@ -0,0 +1,118 @@
+"""
+템플릿별 기본 검색 영역 정의
+
+region=None으로 템플릿을 찾을 때 전체 화면 대신 아래 영역만 검색합니다.
+좌표 형식: 정규화 좌표 (x, y, width, height), 0.0 ~ 1.0
+→ SUPPORTED_RESOLUTIONS의 모든 해상도에 동일하게 적용됩니다.
+
+키: 해상도 폴더 기준 상대 경로 (예: "buttons/deploy_button.png")
+
+주의: 영역을 너무 좁게 잡으면 템플릿을 찾지 못합니다.
+      버튼 크기 이상의 여백을 두고, 위치가 확실한 템플릿만 등록하세요.
+"""
+
+from pathlib import Path
+from typing import Optional, Tuple
+
+from config.skill_settings import (
+    SKILL_BUTTON_SLOT_1,
+    SKILL_BUTTON_SLOT_3,
+)
+
+# 실측 기준 해상도
+BASE_WIDTH = 2560
+BASE_HEIGHT = 1440
+
+
+def _from_pixels(x1: int, y1: int, x2: int, y2: int) -> Tuple[float, float, float, float]:
+    """2560x1440 기준 픽셀 좌표 (x1, y1, x2, y2)를 정규화 좌표로 변환"""
+    x1, y1 = max(0, x1), max(0, y1)
+    x2, y2 = min(BASE_WIDTH, x2), min(BASE_HEIGHT, y2)
+    return (
+        x1 / BASE_WIDTH,
+        y1 / BASE_HEIGHT,
+        (x2 - x1) / BASE_WIDTH,
+        (y2 - y1) / BASE_HEIGHT,
+    )
+
+
+# ========================================
+# 공통 영역
+# ========================================
+
+# 우측 하단 (출격 / 임무 개시 / Phase 종료 / 보상 확인 버튼 위치)
+# 실측: 출격 (2169, 1221) 368x192, 임무 개시 (2162, 1273) 357x150,
+#       Phase 종료 (2167, 1270) 358x148, 보상 확인 (1846, 1260) 436x136
+BOTTOM_RIGHT_REGION = _from_pixels(1664, 1120, 2560, 1440)
+
+# 하단 중앙 (랭크 획득 확인 버튼 위치)
+# 실측: 랭크 획득 확인 (1060, 1245) 450x162
+BOTTOM_CENTER_REGION = _from_pixels(896, 1120, 1664, 1440)
+
+# 스킬 카드 슬롯 (config/skill_settings.py 슬롯 1~3 중심점 기준, 카드 크기만큼 여백)
+SKILL_CARD_WIDTH = 173
+SKILL_CARD_HEIGHT = 150
+SKILL_SLOTS_REGION = _from_pixels(
+    SKILL_BUTTON_SLOT_1[0] - SKILL_CARD_WIDTH,
+    SKILL_BUTTON_SLOT_1[1] - SKILL_CARD_HEIGHT,
+    SKILL_BUTTON_SLOT_3[0] + SKILL_CARD_WIDTH,
+    SKILL_BUTTON_SLOT_3[1] + SKILL_CARD_HEIGHT,
+)
+
+
+# ========================================
+# 템플릿 → 기본 검색 영역
+# ========================================
+
+TEMPLATE_REGIONS = {
+    # 버튼
+    "buttons/deploy_button.png": BOTTOM_RIGHT_REGION,
+    "buttons/mission_start_button.png": BOTTOM_RIGHT_REGION,
+    "buttons/phase_end_button.png": BOTTOM_RIGHT_REGION,
+    "buttons/reward_confirm.png": BOTTOM_RIGHT_REGION,
+    "buttons/rank_reward_confirm_button.png": BOTTOM_CENTER_REGION,
+
+    # 스킬 카드 (어떤 스킬이든 슬롯 1~3 중 하나에 표시됨)
+    "buttons/skill_1_button.png": SKILL_SLOTS_REGION,
+    "buttons/skill_2_button.png": SKILL_SLOTS_REGION,
+    "buttons/skill_3_button.png": SKILL_SLOTS_REGION,
+    "buttons/skill_4_button.png": SKILL_SLOTS_REGION,
+    "buttons/skill_5_button.png": SKILL_SLOTS_REGION,
+    "buttons/skill_6_button.png": SKILL_SLOTS_REGION,
+}
+
+
+# ========================================
+# 유틸리티 함수
+# ========================================
+
+def get_template_region(
+    template_path: Path | str,
+    screen_width: int,
+    screen_height: int
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    템플릿의 기본 검색 영역을 화면 픽셀 좌표로 반환
+
+    Args:
+        template_path: 템플릿 경로 (예: assets/templates/2560x1440/buttons/deploy_button.png)
+        screen_width: 화면 너비
+        screen_height: 화면 높이
+
+    Returns:
+        (left, top, width, height) 또는 None (등록되지 않은 템플릿)
+    """
+    template_path = Path(template_path)
+    key = f"{template_path.parent.name}/{template_path.name}"
+
+    region = TEMPLATE_REGIONS.get(key)
+    if region is None:
+        return None
+
+    x, y, w, h = region
+    return (
+        int(x * screen_width),
+        int(y * screen_height),
+        int(round(w * screen_width)),
+        int(round(h * screen_height)),
+    )
@@ -632,4 +632,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 OCR 프로세스 풀 워커가 GUI를 다시 실행하지 않도록
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -1,28 +1,131 @@
 """게임 제어 모듈 - 마우스/키보드 입력"""
 
 import time
-import pyautogui
+import asyncio
 from typing import Optional, Tuple
 import logging
 
+import numpy as np
+from PIL import Image
+
 from config.settings import (
     WAIT_SCREEN_TRANSITION,
     WAIT_ANIMATION,
+    STABLE_DIFF_THRESHOLD,
+    STABLE_CHECK_INTERVAL,
+    STABLE_REQUIRED_FRAMES,
+    STABLE_MIN_WAIT,
+)
+from src.capture import (
+    CaptureBackend, FrameSource, get_capture_backend, get_frame_source, run_in_capture_executor
 )
+from src.recognition.frame_signature import frame_signature, signature_distance
 
 logger = logging.getLogger(__name__)
 
-# pyautogui 안전 설정
-pyautogui.PAUSE = 0.1  # 각 작업 후 기본 대기 시간
-pyautogui.FAILSAFE = True  # 마우스를 화면 좌측 상단 코너로 이동하면 중단
+# pyautogui 사용 가능 여부 확인 (헤드리스 환경에서는 import 시 디스플레이 연결 실패)
+try:
+    import pyautogui
+    PYAUTOGUI_AVAILABLE = True
+
+    # pyautogui 안전 설정
+    pyautogui.PAUSE = 0.1  # 각 작업 후 기본 대기 시간
+    pyautogui.FAILSAFE = True  # 마우스를 화면 좌측 상단 코너로 이동하면 중단
+except Exception as e:
+    pyautogui = None
+    PYAUTOGUI_AVAILABLE = False
+    logger.warning(f"pyautogui를 사용할 수 없습니다 (재생 백엔드만 사용 가능): {e}")
+
+
+class _StableWait:
+    """wait_until_stable / wait_until_stable_async 공용 프레임 비교 및 종료 판정"""
+
+    def __init__(
+        self,
+        realtime: bool,
+        max_wait: float,
+        threshold: float,
+        required_frames: int,
+        check_interval: float
+    ):
+        self.realtime = realtime
+        self.max_wait = max_wait
+        self.threshold = threshold
+        self.required_frames = required_frames
+
+        # 재생 백엔드는 대기 없이 진행하므로 벽시계 대신 비교 횟수로 제한
+        self.max_checks = max(required_frames, int(max_wait / check_interval) + 1)
+        self.start_time = time.monotonic()
+        self.checks = 0
+        self.stable_count = 0
+        self.previous: Optional[np.ndarray] = None
+        self.last_seq = 0  # 마지막으로 비교한 백그라운드 프레임 번호
+
+    def keep_waiting(self) -> bool:
+        """다음 비교를 진행할지 여부 (비교 횟수 / 실시간이면 max_wait 초과 시 중단)"""
+        if self.checks >= self.max_checks:
+            return False
+        return not (self.realtime and time.monotonic() - self.start_time >= self.max_wait)
+
+    def update(self, signature: np.ndarray, seq: int) -> bool:
+        """
+        새 축소 프레임 반영
+
+        Args:
+            signature: 축소 프레임 (GameController._stable_signature 결과)
+            seq: 프레임 번호
+
+        Returns:
+            연속 required_frames번 변화가 없으면 True (안정화)
+        """
+        self.last_seq = seq
+        previous, self.previous = self.previous, signature
+        if previous is None:
+            return False  # 첫 프레임 (비교 대상 없음)
+
+        self.checks += 1
+        diff = signature_distance(previous, signature)
+        if diff > self.threshold:
+            self.stable_count = 0
+            return False
+
+        self.stable_count += 1
+        if self.stable_count < self.required_frames:
+            return False
+
+        logger.debug(f"화면 안정화: {time.monotonic() - self.start_time:.2f}초 (차이 {diff:.4f})")
+        return True
 
 
 class GameController:
     """게임 제어를 위한 마우스/키보드 입력 클래스"""
 
-    def __init__(self):
-        """게임 컨트롤러 초기화"""
-        logger.info("GameController 초기화")
+    def __init__(
+        self,
+        capture_backend: Optional[CaptureBackend] = None,
+        frame_source: Optional[FrameSource] = None
+    ):
+        """
+        게임 컨트롤러 초기화
+
+        Args:
+            capture_backend: 화면 캡처 백엔드 (None이면 프로세스 전역 백엔드 사용)
+            frame_source: 백그라운드 캡처 프레임 소스. 실행 중이면 마지막 입력 이후
+                          캡처된 프레임으로 스크린샷 반환 (None이면 설정에 따라 전역 소스 사용)
+        """
+        self.capture = capture_backend or get_capture_backend()
+        self.frame_source = frame_source or get_frame_source()
+        self.last_input_time = 0.0  # 마지막 마우스/키보드 입력 시각 (time.monotonic 기준)
+        self._last_click = (0, 0)
+
+        # 재생 백엔드 등: 실제 입력 대신 백엔드로 전달, 실시간 대기 생략
+        self.simulate_input = self.capture.simulates_input
+        self.realtime = self.capture.realtime
+
+        if not self.simulate_input and not PYAUTOGUI_AVAILABLE:
+            raise RuntimeError("pyautogui를 사용할 수 없어 입력을 보낼 수 없습니다 (CAPTURE_BACKEND 확인)")
+
+        logger.info(f"GameController 초기화 (캡처 백엔드: {self.capture.name})")
 
     def click(
         self,
@@ -45,14 +148,19 @@ class GameController:
             duration: 마우스 이동 시간 (초)
         """
         try:
-            pyautogui.click(
-                x=x,
-                y=y,
-                clicks=clicks,
-                interval=interval,
-                button=button,
-                duration=duration
-            )
+            if self.simulate_input:
+                self.capture.handle_input("click", x=x, y=y, clicks=clicks, button=button)
+            else:
+                pyautogui.click(
+                    x=x,
+                    y=y,
+                    clicks=clicks,
+                    interval=interval,
+                    button=button,
+                    duration=duration
+                )
+            self._last_click = (x, y)
+            self.last_input_time = time.monotonic()
             logger.info(f"클릭: ({x}, {y}), button={button}, clicks={clicks}")
         except Exception as e:
             logger.error(f"클릭 중 오류 발생: {e}")
@@ -64,7 +172,9 @@ class GameController:
         offset_x: int = 0,
         offset_y: int = 0,
         clicks: int = 1,
-        wait_after: Optional[float] = None
+        wait_after: Optional[float] = None,
+        settle: bool = False,
+        settle_region: Optional[Tuple[int, int, int, int]] = None
     ) -> bool:
         """
         템플릿 위치 클릭 (중앙점 기준)
@@ -74,7 +184,9 @@ class GameController:
             offset_x: X 오프셋
             offset_y: Y 오프셋
             clicks: 클릭 횟수
-            wait_after: 클릭 후 대기 시간 (초)
+            wait_after: 클릭 후 대기 시간 (초). settle=True면 최대 대기 시간
+            settle: True면 고정 대기 대신 화면 변화가 멈출 때까지만 대기
+            settle_region: 화면 안정화를 판단할 영역 (None이면 전체 화면)
 
         Returns:
             성공 여부
@@ -88,8 +200,10 @@ class GameController:
 
         self.click(center_x, center_y, clicks=clicks)
 
-        if wait_after:
-            time.sleep(wait_after)
+        if settle:
+            self.wait_until_stable(settle_region, max_wait=wait_after or WAIT_SCREEN_TRANSITION)
+        elif wait_after:
+            self.wait(wait_after)
 
         return True
 
@@ -114,13 +228,19 @@ class GameController:
             button: 마우스 버튼
         """
         try:
-            pyautogui.moveTo(start_x, start_y)
-            pyautogui.drag(
-                end_x - start_x,
-                end_y - start_y,
-                duration=duration,
-                button=button
-            )
+            if self.simulate_input:
+                self.capture.handle_input(
+                    "drag", x=start_x, y=start_y, end_x=end_x, end_y=end_y, button=button
+                )
+            else:
+                pyautogui.moveTo(start_x, start_y)
+                pyautogui.drag(
+                    end_x - start_x,
+                    end_y - start_y,
+                    duration=duration,
+                    button=button
+                )
+            self.last_input_time = time.monotonic()
             logger.info(f"드래그: ({start_x}, {start_y}) -> ({end_x}, {end_y})")
         except Exception as e:
             logger.error(f"드래그 중 오류 발생: {e}")
@@ -136,7 +256,11 @@ class GameController:
             interval: 입력 간격 (초)
         """
         try:
-            pyautogui.press(key, presses=presses, interval=interval)
+            if self.simulate_input:
+                self.capture.handle_input("key", key=key, presses=presses)
+            else:
+                pyautogui.press(key, presses=presses, interval=interval)
+            self.last_input_time = time.monotonic()
             logger.info(f"키 입력: {key}, presses={presses}")
         except Exception as e:
             logger.error(f"키 입력 중 오류 발생: {e}")
@@ -153,7 +277,7 @@ class GameController:
         for key in keys:
             self.press_key(key)
             if interval > 0:
-                time.sleep(interval)
+                self.wait(interval)
 
     def hotkey(self, *keys: str) -> None:
         """
@@ -163,7 +287,11 @@ class GameController:
             *keys: 키 이름들 (예: 'ctrl', 'c')
         """
         try:
-            pyautogui.hotkey(*keys)
+            if self.simulate_input:
+                self.capture.handle_input("hotkey", keys=keys)
+            else:
+                pyautogui.hotkey(*keys)
+            self.last_input_time = time.monotonic()
             logger.info(f"단축키 입력: {'+'.join(keys)}")
         except Exception as e:
             logger.error(f"단축키 입력 중 오류 발생: {e}")
@@ -178,7 +306,11 @@ class GameController:
             interval: 문자 간격 (초)
         """
         try:
-            pyautogui.write(text, interval=interval)
+            if self.simulate_input:
+                self.capture.handle_input("text", text=text)
+            else:
+                pyautogui.write(text, interval=interval)
+            self.last_input_time = time.monotonic()
             logger.info(f"텍스트 입력: {text}")
         except Exception as e:
             logger.error(f"텍스트 입력 중 오류 발생: {e}")
@@ -192,17 +324,55 @@ class GameController:
             seconds: 대기 시간 (초)
         """
         logger.debug(f"대기 중: {seconds}초")
-        time.sleep(seconds)
+        if self.realtime:
+            time.sleep(seconds)
+
+    def wait_until_stable(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        max_wait: float = WAIT_SCREEN_TRANSITION,
+        threshold: float = STABLE_DIFF_THRESHOLD,
+        min_wait: float = STABLE_MIN_WAIT,
+        required_frames: int = STABLE_REQUIRED_FRAMES,
+        check_interval: float = STABLE_CHECK_INTERVAL
+    ) -> bool:
+        """
+        화면 변화가 멈출 때까지 대기 (연속 축소 프레임 비교)
+
+        Args:
+            region: 비교할 화면 영역 (None이면 전체 화면)
+            max_wait: 최대 대기 시간 (초). 기존 고정 대기 시간을 그대로 상한으로 사용
+            threshold: 연속 프레임 차이 임계값 (0~1, 이하이면 변화 없음)
+            min_wait: 첫 비교 전 최소 대기 (클릭 후 화면 반응 시작 전 오판 방지)
+            required_frames: 연속으로 변화가 없어야 하는 비교 횟수
+            check_interval: 프레임 비교 간격 (초)
+
+        Returns:
+            안정화되면 True, max_wait 안에 안정화되지 않으면 False
+        """
+        state = _StableWait(self.realtime, max_wait, threshold, required_frames, check_interval)
+
+        if min_wait:
+            self.wait(min(min_wait, max_wait))
+
+        state.update(*self._stable_signature(region, state.last_seq))
+        while state.keep_waiting():
+            self.wait(check_interval)
+            if state.update(*self._stable_signature(region, state.last_seq)):
+                return True
+
+        logger.debug(f"화면 안정화 대기 시간 초과: {max_wait}초")
+        return False
 
     def wait_screen_transition(self) -> None:
         """화면 전환 대기"""
         logger.debug("화면 전환 대기")
-        time.sleep(WAIT_SCREEN_TRANSITION)
+        self.wait(WAIT_SCREEN_TRANSITION)
 
     def wait_animation(self) -> None:
         """애니메이션 대기"""
         logger.debug("애니메이션 대기")
-        time.sleep(WAIT_ANIMATION)
+        self.wait(WAIT_ANIMATION)
 
     def screenshot(self, region: Optional[Tuple[int, int, int, int]] = None) -> any:
         """
@@ -215,10 +385,11 @@ class GameController:
             PIL Image 객체
         """
         try:
-            if region:
-                screenshot = pyautogui.screenshot(region=region)
+            frame = self._background_frame(region, grayscale=False)
+            if frame is not None:
+                screenshot = Image.fromarray(np.ascontiguousarray(frame[:, :, ::-1]))
             else:
-                screenshot = pyautogui.screenshot()
+                screenshot = self.capture.grab_image(region)
 
             logger.debug(f"화면 캡처 완료: region={region}")
             return screenshot
@@ -226,6 +397,190 @@ class GameController:
             logger.error(f"화면 캡처 중 오류 발생: {e}")
             raise
 
+    def screenshot_array(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False
+    ) -> np.ndarray:
+        """
+        화면 캡처 (OpenCV 배열, PIL 변환 없음)
+
+        Args:
+            region: 캡처할 영역 (left, top, width, height). None이면 전체 화면
+            grayscale: True면 그레이스케일, False면 BGR
+
+        Returns:
+            캡처된 프레임 배열 (캡처 백엔드 버퍼일 수 있으므로 보관 시 copy 필요)
+        """
+        try:
+            frame = self._background_frame(region, grayscale)
+            if frame is None:
+                frame = self.capture.grab(region, grayscale)
+
+            logger.debug(f"화면 캡처 완료: region={region}, grayscale={grayscale}")
+            return frame
+        except Exception as e:
+            logger.error(f"화면 캡처 중 오류 발생: {e}")
+            raise
+
+    def _background_frame(
+        self,
+        region: Optional[Tuple[int, int, int, int]],
+        grayscale: bool
+    ) -> Optional[np.ndarray]:
+        """백그라운드 프레임 소스에서 마지막 입력 이후 캡처된 프레임 가져오기 (없으면 None)"""
+        if self.frame_source is None or not self.frame_source.running:
+            return None
+
+        frame = self.frame_source.latest(region=region, grayscale=grayscale)
+        if frame is None or frame.timestamp < self.last_input_time:
+            # 최신 프레임이 입력 이전 화면 → 입력 이후 첫 프레임까지 대기
+            frame = self.frame_source.frame_after(self.last_input_time, region=region, grayscale=grayscale)
+        return frame.image if frame is not None else None
+
+    def _stable_signature(
+        self,
+        region: Optional[Tuple[int, int, int, int]],
+        after_seq: int
+    ) -> Tuple[np.ndarray, int]:
+        """
+        화면 안정화 비교용 축소 프레임 (백그라운드 프레임 소스가 있으면 after_seq보다 새로운 프레임)
+
+        latest()는 캡처 주기 안에 다시 부르면 같은 링 슬롯을 돌려주므로, 그대로 비교하면
+        차이 0으로 안정화를 잘못 판단합니다. TemplateMatcher처럼 프레임 번호를 추적합니다.
+
+        Args:
+            region: 비교할 화면 영역
+            after_seq: 마지막으로 비교한 프레임 번호 (처음이면 0)
+
+        Returns:
+            (축소 프레임, 비교한 프레임 번호 (직접 캡처면 after_seq 그대로))
+        """
+        if self.frame_source is not None and self.frame_source.running:
+            frame = self.frame_source.next_frame(after_seq, region=region, grayscale=True)
+            if frame is not None and frame.timestamp < self.last_input_time:
+                # 입력 이전 화면 → 입력 이후 첫 프레임까지 대기
+                frame = self.frame_source.frame_after(self.last_input_time, region=region, grayscale=True)
+            if frame is not None:
+                return frame_signature(frame.image), frame.seq
+            logger.debug("백그라운드 프레임을 받지 못해 직접 캡처합니다")
+
+        return frame_signature(self.capture.grab(region, grayscale=True)), after_seq
+
+    # ------------------------------------------------------------------
+    # asyncio API
+    # 입력/캡처는 캡처 전용 단일 스레드 실행기에서 제출 순서대로 실행하고 (매칭 폴링과 같은 스레드),
+    # 대기는 asyncio.sleep이므로 이벤트 루프의 다른 코루틴이 함께 진행됩니다.
+    # ------------------------------------------------------------------
+
+    async def wait_async(self, seconds: float) -> None:
+        """비동기 대기 (재생 백엔드에서는 다른 코루틴에 양보만)"""
+        logger.debug(f"대기 중 (async): {seconds}초")
+        await asyncio.sleep(seconds if self.realtime else 0)
+
+    async def click_async(
+        self,
+        x: int,
+        y: int,
+        clicks: int = 1,
+        interval: float = 0.0,
+        button: str = 'left',
+        duration: float = 0.0
+    ) -> None:
+        """지정된 좌표 클릭 (click의 asyncio 버전)"""
+        await run_in_capture_executor(self.click, x, y, clicks, interval, button, duration)
+
+    async def click_template_async(
+        self,
+        location: Optional[Tuple[int, int, int, int]],
+        offset_x: int = 0,
+        offset_y: int = 0,
+        clicks: int = 1,
+        wait_after: Optional[float] = None,
+        settle: bool = False,
+        settle_region: Optional[Tuple[int, int, int, int]] = None
+    ) -> bool:
+        """
+        템플릿 위치 클릭 (click_template의 asyncio 버전)
+
+        클릭 후 대기/화면 안정화 대기는 실행기 스레드를 점유하지 않고 이벤트 루프에서 진행합니다.
+
+        Returns:
+            성공 여부
+        """
+        clicked = await run_in_capture_executor(self.click_template, location, offset_x, offset_y, clicks)
+        if not clicked:
+            return False
+
+        if settle:
+            await self.wait_until_stable_async(settle_region, max_wait=wait_after or WAIT_SCREEN_TRANSITION)
+        elif wait_after:
+            await self.wait_async(wait_after)
+
+        return True
+
+    async def drag_async(
+        self,
+        start_x: int,
+        start_y: int,
+        end_x: int,
+        end_y: int,
+        duration: float = 0.5,
+        button: str = 'left'
+    ) -> None:
+        """드래그 동작 (drag의 asyncio 버전)"""
+        await run_in_capture_executor(self.drag, start_x, start_y, end_x, end_y, duration, button)
+
+    async def press_key_async(self, key: str, presses: int = 1, interval: float = 0.0) -> None:
+        """키 입력 (press_key의 asyncio 버전)"""
+        await run_in_capture_executor(self.press_key, key, presses, interval)
+
+    async def hotkey_async(self, *keys: str) -> None:
+        """단축키 입력 (hotkey의 asyncio 버전)"""
+        await run_in_capture_executor(self.hotkey, *keys)
+
+    async def type_text_async(self, text: str, interval: float = 0.0) -> None:
+        """텍스트 입력 (type_text의 asyncio 버전)"""
+        await run_in_capture_executor(self.type_text, text, interval)
+
+    async def screenshot_array_async(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False
+    ) -> np.ndarray:
+        """화면 캡처 (screenshot_array의 asyncio 버전, 보관용 복사본 반환)"""
+        frame = await run_in_capture_executor(self.screenshot_array, region, grayscale)
+        return frame.copy()
+
+    async def wait_until_stable_async(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        max_wait: float = WAIT_SCREEN_TRANSITION,
+        threshold: float = STABLE_DIFF_THRESHOLD,
+        min_wait: float = STABLE_MIN_WAIT,
+        required_frames: int = STABLE_REQUIRED_FRAMES,
+        check_interval: float = STABLE_CHECK_INTERVAL
+    ) -> bool:
+        """
+        화면 변화가 멈출 때까지 비동기 대기 (wait_until_stable의 asyncio 버전)
+
+        Returns:
+            안정화되면 True, max_wait 안에 안정화되지 않으면 False
+        """
+        state = _StableWait(self.realtime, max_wait, threshold, required_frames, check_interval)
+
+        if min_wait:
+            await self.wait_async(min(min_wait, max_wait))
+
+        state.update(*await run_in_capture_executor(self._stable_signature, region, state.last_seq))
+        while state.keep_waiting():
+            await self.wait_async(check_interval)
+            if state.update(*await run_in_capture_executor(self._stable_signature, region, state.last_seq)):
+                return True
+
+        logger.debug(f"화면 안정화 대기 시간 초과: {max_wait}초")
+        return False
+
     def get_screen_size(self) -> Tuple[int, int]:
         """
         화면 크기 가져오기
@@ -233,8 +588,7 @@ class GameController:
         Returns:
             (width, height)
         """
-        size = pyautogui.size()
-        return (size.width, size.height)
+        return self.capture.size()
 
     def get_mouse_position(self) -> Tuple[int, int]:
         """
@@ -243,5 +597,8 @@ class GameController:
         Returns:
             (x, y)
         """
+        if self.simulate_input:
+            return self._last_click
+
         position = pyautogui.position()
         return (position.x, position.y)
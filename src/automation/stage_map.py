@@ -0,0 +1,569 @@
+"""스테이지 맵 모델 모듈
+
+스테이지 맵은 고정된 육각 격자의 발판으로 구성됩니다.
+이동할 때마다 발판 템플릿을 전체 화면에서 다시 매칭하는 대신,
+스테이지 맵 화면에서 격자(발판 위치와 인접 방향)를 한 번만 검출하고
+이후에는 각 칸 주변의 작은 창만 분류합니다.
+
+- 검출: 발판 템플릿별 find_all → 칸 중심 목록 → 이웃 간 변위를 묶어 격자 방향(육각 격자는 3방향) 추정
+- 분류: 모든 칸의 창을 세로로 이어 붙인 모자이크에 템플릿별 matchTemplate 1회 (칸 수와 무관)
+- 갱신: 칸 창의 픽셀이 바뀐 칸만 다시 분류
+- 조회: 인접 칸, 이동 가능 칸(BFS), 경로
+"""
+
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any, List, Union
+
+import numpy as np
+
+from src.recognition.template_matcher import TemplateMatcher
+from config.settings import (
+    ICONS_DIR,
+    TEMPLATE_PYRAMID_SCALE,
+    STAGE_MAP_DETECT_THRESHOLD,
+    STAGE_MAP_CELL_THRESHOLD,
+    STAGE_MAP_SEARCH_MARGIN,
+    STAGE_MAP_CHANGE_THRESHOLD,
+    STAGE_MAP_NEIGHBOR_TOLERANCE,
+    STAGE_MAP_HEX_DIRECTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+# OpenCV 사용 가능 여부 확인
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+# 발판 종류 → 템플릿 (앞쪽이 같은 위치에서 겹칠 때 우선)
+TILE_TEMPLATES = {
+    "start_tile": ICONS_DIR / "start_tile.png",
+    "enemy_tile": ICONS_DIR / "enemy_tile.png",
+    "cant_move_enemy_tile": ICONS_DIR / "cant_move_enemy_tile.png",
+    "cant_move_tile": ICONS_DIR / "cant_move_tile.png",
+    "empty_tile": ICONS_DIR / "empty_tile.png",
+}
+
+UNKNOWN_TILE = "unknown"
+
+# 지나갈 수 있는 칸 / 들어갈 수는 있지만 지나갈 수 없는 칸 (전투 발생)
+PASSABLE_TILES = ("start_tile", "empty_tile")
+TARGET_TILES = ("enemy_tile",)
+
+# 격자 방향 추정 시 최근접 간격 대비 최대 이웃 거리 (육각 격자의 대각선 √3배는 제외)
+_NEIGHBOR_MAX_RATIO = 1.6
+
+
+class StageMap:
+    """스테이지 맵 육각 격자 모델 (검출 1회 + 변경된 칸만 재분류)"""
+
+    def __init__(
+        self,
+        matcher: Optional[TemplateMatcher] = None,
+        tile_templates: Optional[Dict[str, Path]] = None,
+        scale: float = TEMPLATE_PYRAMID_SCALE
+    ):
+        """
+        Args:
+            matcher: 템플릿 매칭 객체 (None이면 기본값 생성)
+            tile_templates: {발판 종류: 템플릿 경로} (None이면 TILE_TEMPLATES)
+            scale: 칸 분류 시 프레임/템플릿 축소 배율
+        """
+        self.matcher = matcher or TemplateMatcher()
+        self.tile_templates = dict(tile_templates or TILE_TEMPLATES)
+        self.scale = scale
+
+        self.centers = np.zeros((0, 2), dtype=np.float32)  # 칸 중심 (x, y), 화면 절대 좌표
+        self.sizes = np.zeros((0, 2), dtype=np.float32)  # 검출된 발판 크기 (width, height)
+        self.types: List[str] = []
+        self.scores = np.zeros(0, dtype=np.float32)
+        self.directions = np.zeros((0, 2), dtype=np.float32)  # 격자 인접 방향 벡터
+        self.spacing = 0.0  # 최근접 발판 간격 (픽셀)
+
+        self._adjacency = np.zeros((0, 0), dtype=bool)
+        self._window_size = (0, 0)  # 축소 프레임 기준 칸 창 크기 (width, height)
+        self._mosaic: Optional[np.ndarray] = None  # 마지막으로 분류한 칸 창 모자이크
+
+        # 통계
+        self.updates = 0
+        self.reclassified = 0
+
+    @property
+    def detected(self) -> bool:
+        """격자 검출 여부"""
+        return len(self.types) > 0
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    # ------------------------------------------------------------------
+    # 검출
+    # ------------------------------------------------------------------
+
+    def _grab(self) -> np.ndarray:
+        """전체 화면 그레이스케일 프레임 캡처 (보관용 복사본)"""
+        return self.matcher.capture.grab(None, grayscale=True).copy()
+
+    def detect(self, frame: Optional[np.ndarray] = None) -> bool:
+        """
+        스테이지 맵 화면에서 격자 검출 (스테이지당 1회)
+
+        Args:
+            frame: 전체 화면 프레임 (BGR 또는 그레이스케일). None이면 캡처
+
+        Returns:
+            발판을 하나 이상 찾았으면 True
+        """
+        if not OPENCV_AVAILABLE:
+            logger.error("OpenCV가 없어 스테이지 맵을 검출할 수 없습니다")
+            return False
+
+        if frame is None:
+            frame = self._grab()
+        elif frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        # 1. 발판 종류별 모든 인스턴스 (점수 순)
+        detections = []
+        for tile_type, template_path in self.tile_templates.items():
+            for (left, top, width, height), score in self.matcher.find_all_in_frame(
+                frame, template_path, threshold=STAGE_MAP_DETECT_THRESHOLD
+            ):
+                center = (left + width / 2.0, top + height / 2.0)
+                detections.append((score, tile_type, center, (width, height)))
+
+        detections.sort(key=lambda d: d[0], reverse=True)
+
+        # 2. 같은 칸에 여러 종류가 겹치면 점수가 높은 쪽만 사용
+        centers, types, scores, sizes = [], [], [], []
+        for score, tile_type, center, size in detections:
+            radius = min(size) / 2.0
+            if any(np.hypot(center[0] - c[0], center[1] - c[1]) < radius for c in centers):
+                continue
+            centers.append(center)
+            types.append(tile_type)
+            scores.append(score)
+            sizes.append(size)
+
+        self.centers = np.array(centers, dtype=np.float32).reshape(-1, 2)
+        self.sizes = np.array(sizes, dtype=np.float32).reshape(-1, 2)
+        self.types = types
+        self.scores = np.array(scores, dtype=np.float32)
+
+        if not types:
+            logger.warning("스테이지 맵에서 발판을 찾지 못했습니다")
+            self._adjacency = np.zeros((0, 0), dtype=bool)
+            self._mosaic = None
+            return False
+
+        # 3. 격자 방향 + 인접 행렬
+        self._fit_directions(float(np.median([size[0] for size in sizes])))
+        self._adjacency = self._adjacent(self.centers, self.centers)
+
+        # 4. 칸 창 크기 (가장 큰 발판 템플릿 + 위치 허용 오차, 축소 프레임 기준)
+        max_w = max(size[0] for size in sizes)
+        max_h = max(size[1] for size in sizes)
+        for tile_type in self.tile_templates:
+            template = self._load_template(tile_type)
+            if template is not None:
+                max_w = max(max_w, template.shape[1] / self.scale)
+                max_h = max(max_h, template.shape[0] / self.scale)
+        self._window_size = (
+            int(round((max_w + 2 * STAGE_MAP_SEARCH_MARGIN) * self.scale)),
+            int(round((max_h + 2 * STAGE_MAP_SEARCH_MARGIN) * self.scale)),
+        )
+
+        # 검출 결과를 분류 기준 상태로 저장 (이후 바뀐 칸만 재분류)
+        self._mosaic = self._build_mosaic(self._shrink(frame), np.arange(len(types)))
+
+        logger.info(
+            f"스테이지 맵 검출: {len(types)}칸, 간격 {self.spacing:.0f}px, 방향 {len(self.directions)}개 "
+            f"({', '.join(f'{t} {types.count(t)}' for t in dict.fromkeys(types))})"
+        )
+        return True
+
+    def _fit_directions(self, tile_width: float) -> None:
+        """
+        칸 중심 간 변위를 묶어 격자 인접 방향 추정
+
+        발판이 캐릭터에 가려 일부 방향의 이웃 쌍이 보이지 않으면
+        STAGE_MAP_HEX_DIRECTIONS(가로 간격 대비 기본 방향)로 빠진 방향을 보충합니다.
+
+        Args:
+            tile_width: 검출된 발판 너비 (가로 방향이 보이지 않을 때 가로 간격 추정값)
+        """
+        directions: List[np.ndarray] = []
+        count = len(self.centers)
+
+        if count >= 2:
+            offsets = self.centers[None, :, :] - self.centers[:, None, :]
+            distances = np.hypot(offsets[..., 0], offsets[..., 1])
+            np.fill_diagonal(distances, np.inf)
+            nearest = float(distances.min())
+
+            # 이웃 후보 변위 (부호 통일: x > 0, x == 0이면 y > 0)
+            i, j = np.nonzero(distances <= nearest * _NEIGHBOR_MAX_RATIO)
+            vectors = offsets[i, j]
+            flip = (vectors[:, 0] < 0) | ((vectors[:, 0] == 0) & (vectors[:, 1] < 0))
+            vectors[flip] *= -1
+
+            # 허용 오차 안의 변위끼리 묶기 (많이 나온 방향 우선)
+            tolerance = nearest * STAGE_MAP_NEIGHBOR_TOLERANCE
+            clusters: List[List[np.ndarray]] = []
+            for vector in vectors:
+                for cluster in clusters:
+                    if np.hypot(*(np.mean(cluster, axis=0) - vector)) <= tolerance:
+                        cluster.append(vector)
+                        break
+                else:
+                    clusters.append([vector])
+
+            clusters.sort(key=len, reverse=True)
+            directions = [np.mean(cluster, axis=0) for cluster in clusters[:3]]
+
+        # 가로 간격: 가로 방향이 검출됐으면 그 길이, 아니면 발판 너비
+        horizontal = [d for d in directions if abs(d[1]) < abs(d[0]) * 0.25]
+        unit = float(np.hypot(*horizontal[0])) if horizontal else tile_width
+
+        # 보이지 않은 방향은 기본 육각 격자 방향으로 보충
+        for ratio_x, ratio_y in STAGE_MAP_HEX_DIRECTIONS:
+            if len(directions) >= 3:
+                break
+            prior = np.array([ratio_x * unit, ratio_y * unit], dtype=np.float32)
+            tolerance = unit * STAGE_MAP_NEIGHBOR_TOLERANCE
+            if all(
+                min(np.hypot(*(d - prior)), np.hypot(*(d + prior))) > tolerance
+                for d in directions
+            ):
+                directions.append(prior)
+
+        self.directions = np.array(directions, dtype=np.float32).reshape(-1, 2)
+        self.spacing = float(np.hypot(self.directions[:, 0], self.directions[:, 1]).min())
+
+    def _adjacent(self, points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+        """
+        점 → 칸 인접 행렬
+
+        Args:
+            points: (M, 2) 기준 위치
+            centers: (N, 2) 칸 중심
+
+        Returns:
+            (M, N) bool 배열
+        """
+        adjacency = np.zeros((len(points), len(centers)), dtype=bool)
+        if not len(self.directions):
+            return adjacency
+
+        offsets = centers[None, :, :] - points[:, None, :]
+        tolerance = self.spacing * STAGE_MAP_NEIGHBOR_TOLERANCE
+        for direction in self.directions:
+            for signed in (direction, -direction):
+                delta = offsets - signed
+                adjacency |= np.hypot(delta[..., 0], delta[..., 1]) <= tolerance
+        return adjacency
+
+    # ------------------------------------------------------------------
+    # 분류
+    # ------------------------------------------------------------------
+
+    def _load_template(self, tile_type: str) -> Optional[np.ndarray]:
+        """축소 배율에 맞춘 발판 템플릿 (프로세스 전역 캐시)"""
+        resolution = self.matcher.screen_resolution if self.matcher.auto_scale else None
+        return self.matcher.template_cache.get(
+            self.tile_templates[tile_type], resolution, True, self.scale
+        )
+
+    def _shrink(self, frame: np.ndarray) -> np.ndarray:
+        """분류용 축소 프레임"""
+        if frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return cv2.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+
+    def _build_mosaic(self, small_frame: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """
+        칸 창들을 세로로 이어 붙인 모자이크
+
+        Returns:
+            (len(indices) * 창 높이, 창 너비) uint8 배열 (화면 밖은 0)
+        """
+        window_w, window_h = self._window_size
+        pad_x, pad_y = window_w, window_h
+        padded = cv2.copyMakeBorder(small_frame, pad_y, pad_y, pad_x, pad_x, cv2.BORDER_CONSTANT, value=0)
+
+        mosaic = np.empty((len(indices) * window_h, window_w), dtype=np.uint8)
+        for row, index in enumerate(indices):
+            center_x, center_y = self.centers[index] * self.scale
+            x = int(round(center_x)) - window_w // 2 + pad_x
+            y = int(round(center_y)) - window_h // 2 + pad_y
+            mosaic[row * window_h:(row + 1) * window_h] = padded[y:y + window_h, x:x + window_w]
+        return mosaic
+
+    def _classify(self, mosaic: np.ndarray, count: int) -> Tuple[List[str], np.ndarray]:
+        """
+        모자이크의 모든 칸을 한 번에 분류 (발판 종류별 matchTemplate 1회)
+
+        각 칸의 유효 매칭 위치는 자기 창 안에 템플릿이 완전히 들어가는 위치뿐이므로
+        결과 맵을 칸별 블록으로 나눠 블록 최대값을 그 칸의 점수로 사용합니다.
+
+        Returns:
+            (칸별 종류, 칸별 점수)
+        """
+        window_w, window_h = self._window_size
+        names = []
+        columns = []
+
+        for tile_type in self.tile_templates:
+            template = self._load_template(tile_type)
+            if template is None:
+                continue
+            template_h, template_w = template.shape[:2]
+            if template_h > window_h or template_w > window_w:
+                continue
+
+            result = cv2.matchTemplate(mosaic, template, cv2.TM_CCOEFF_NORMED)
+
+            # (칸, 창 높이, 위치) 블록으로 정리 후 창 밖으로 넘어가는 행 제외
+            blocks = np.full((count * window_h, result.shape[1]), -1.0, dtype=np.float32)
+            blocks[:result.shape[0]] = result
+            blocks = blocks.reshape(count, window_h, -1)[:, :window_h - template_h + 1]
+
+            names.append(tile_type)
+            columns.append(blocks.reshape(count, -1).max(axis=1))
+
+        if not columns:
+            return [UNKNOWN_TILE] * count, np.zeros(count, dtype=np.float32)
+
+        scores = np.stack(columns, axis=1)
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(count), best]
+        types = [
+            names[b] if score >= STAGE_MAP_CELL_THRESHOLD else UNKNOWN_TILE
+            for b, score in zip(best, best_scores)
+        ]
+        return types, best_scores.astype(np.float32)
+
+    def update(self, frame: Optional[np.ndarray] = None) -> List[int]:
+        """
+        픽셀이 바뀐 칸만 다시 분류
+
+        Args:
+            frame: 전체 화면 프레임 (BGR 또는 그레이스케일). None이면 캡처
+
+        Returns:
+            종류가 바뀐 칸 인덱스 리스트
+        """
+        if not self.detected or self._mosaic is None:
+            return []
+
+        if frame is None:
+            frame = self._grab()
+
+        count = len(self.types)
+        window_h = self._window_size[1]
+        mosaic = self._build_mosaic(self._shrink(frame), np.arange(count))
+
+        # 칸 창별 평균 절대 차이
+        diff = np.abs(mosaic.astype(np.int16) - self._mosaic.astype(np.int16))
+        changed = np.nonzero(diff.reshape(count, -1).mean(axis=1) / 255.0 > STAGE_MAP_CHANGE_THRESHOLD)[0]
+
+        self.updates += 1
+        if not len(changed):
+            return []
+
+        windows = mosaic.reshape(count, window_h, -1)[changed].reshape(len(changed) * window_h, -1)
+        types, scores = self._classify(windows, len(changed))
+
+        retyped = []
+        for index, tile_type, score in zip(changed, types, scores):
+            if self.types[index] != tile_type:
+                logger.debug(f"칸 {index} 변경: {self.types[index]} → {tile_type} ({score:.3f})")
+                retyped.append(int(index))
+            self.types[index] = tile_type
+            self.scores[index] = score
+
+        self._mosaic = mosaic
+        self.reclassified += len(changed)
+        return retyped
+
+    def reclassify(self, frame: Optional[np.ndarray] = None) -> None:
+        """변화 여부와 관계없이 모든 칸 다시 분류"""
+        if not self.detected:
+            return
+
+        if frame is None:
+            frame = self._grab()
+
+        count = len(self.types)
+        self._mosaic = self._build_mosaic(self._shrink(frame), np.arange(count))
+        self.types, self.scores = self._classify(self._mosaic, count)
+        self.reclassified += count
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def cell(self, index: int) -> Dict[str, Any]:
+        """
+        칸 정보
+
+        Returns:
+            {"index", "center": (x, y), "location": (left, top, width, height), "type", "score"}
+        """
+        center_x, center_y = self.centers[index]
+        width, height = self.sizes[index]
+        return {
+            "index": index,
+            "center": (int(round(center_x)), int(round(center_y))),
+            "location": (
+                int(round(center_x - width / 2)), int(round(center_y - height / 2)),
+                int(width), int(height)
+            ),
+            "type": self.types[index],
+            "score": float(self.scores[index]),
+        }
+
+    def cells_of_type(self, tile_type: str) -> List[int]:
+        """해당 종류의 칸 인덱스 리스트"""
+        return [index for index, t in enumerate(self.types) if t == tile_type]
+
+    def cell_at(self, x: float, y: float) -> Optional[int]:
+        """
+        화면 좌표에 있는 칸 (가장 가까운 칸 중심이 간격의 절반 이내일 때)
+
+        Returns:
+            칸 인덱스 또는 None
+        """
+        if not self.detected:
+            return None
+
+        distances = np.hypot(self.centers[:, 0] - x, self.centers[:, 1] - y)
+        index = int(distances.argmin())
+        limit = self.spacing / 2.0 if self.spacing else np.inf
+        return index if distances[index] <= limit else None
+
+    def neighbors(self, start: Union[int, Tuple[float, float]]) -> List[int]:
+        """
+        인접 칸 인덱스 리스트
+
+        Args:
+            start: 칸 인덱스 또는 화면 좌표 (x, y). 좌표가 칸 위가 아니면
+                   (캐릭터에 가려 검출되지 않은 칸 등) 격자 방향으로 인접한 칸
+        """
+        if isinstance(start, (int, np.integer)):
+            return [int(i) for i in np.nonzero(self._adjacency[start])[0]]
+
+        index = self.cell_at(*start)
+        if index is not None:
+            return self.neighbors(index)
+
+        point = np.array([start], dtype=np.float32)
+        return [int(i) for i in np.nonzero(self._adjacent(point, self.centers)[0])[0]]
+
+    def _bfs(
+        self,
+        start: Union[int, Tuple[float, float]],
+        max_steps: Optional[int] = None
+    ) -> Tuple[Dict[int, int], Dict[int, Optional[int]]]:
+        """
+        시작 위치에서 너비 우선 탐색
+
+        Returns:
+            ({칸 인덱스: 이동 칸 수}, {칸 인덱스: 이전 칸 인덱스})
+        """
+        distances: Dict[int, int] = {}
+        parents: Dict[int, Optional[int]] = {}
+        queue = deque()
+
+        if isinstance(start, (int, np.integer)):
+            start = int(start)
+            distances[start] = 0
+            parents[start] = None
+            queue.append(start)
+        else:
+            # 좌표 시작: 인접 칸이 1칸 거리
+            for index in self.neighbors(start):
+                if self.types[index] in PASSABLE_TILES + TARGET_TILES:
+                    distances[index] = 1
+                    parents[index] = None
+                    if self.types[index] in PASSABLE_TILES:
+                        queue.append(index)
+
+        while queue:
+            current = queue.popleft()
+            if max_steps is not None and distances[current] >= max_steps:
+                continue
+
+            for index in self.neighbors(current):
+                if index in distances or self.types[index] not in PASSABLE_TILES + TARGET_TILES:
+                    continue
+                distances[index] = distances[current] + 1
+                parents[index] = current
+                # 적 발판은 들어가면 전투가 시작되므로 더 지나갈 수 없음
+                if self.types[index] in PASSABLE_TILES:
+                    queue.append(index)
+
+        if max_steps is not None:
+            distances = {i: d for i, d in distances.items() if d <= max_steps}
+        return distances, parents
+
+    def reachable(
+        self,
+        start: Union[int, Tuple[float, float]],
+        max_steps: Optional[int] = None
+    ) -> Dict[int, int]:
+        """
+        시작 위치에서 이동할 수 있는 칸
+
+        빈 발판/시작 발판은 지나갈 수 있고, 적 발판은 도착만 할 수 있습니다.
+        이동 불가 발판과 분류되지 않은 칸(unknown)은 제외됩니다.
+
+        Args:
+            start: 칸 인덱스 또는 화면 좌표 (x, y)
+            max_steps: 최대 이동 칸 수 (None이면 제한 없음)
+
+        Returns:
+            {칸 인덱스: 이동 칸 수} (칸 인덱스로 시작하면 시작 칸은 0)
+        """
+        return self._bfs(start, max_steps)[0]
+
+    def path(
+        self,
+        start: Union[int, Tuple[float, float]],
+        goal: int
+    ) -> Optional[List[int]]:
+        """
+        시작 위치에서 목표 칸까지 최단 경로
+
+        Returns:
+            칸 인덱스 리스트 (시작 칸 제외, 목표 칸 포함) 또는 None (도달 불가)
+        """
+        distances, parents = self._bfs(start)
+        if goal not in distances:
+            return None
+
+        route = []
+        current: Optional[int] = goal
+        while current is not None:
+            route.append(current)
+            current = parents[current]
+        route.reverse()
+
+        if isinstance(start, (int, np.integer)):
+            route = route[1:]
+        return route
+
+    def stats(self) -> Dict[str, Any]:
+        """스테이지 맵 통계"""
+        return {
+            "cells": len(self.types),
+            "spacing": self.spacing,
+            "directions": len(self.directions),
+            "types": {t: self.types.count(t) for t in dict.fromkeys(self.types)},
+            "updates": self.updates,
+            "reclassified": self.reclassified,
+        }
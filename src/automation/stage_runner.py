@@ -1,20 +1,33 @@
 """스테이지 자동 실행 및 검증 모듈"""
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Awaitable
 
 from src.recognition.template_matcher import TemplateMatcher
 from src.automation.game_controller import GameController
+from src.automation.stage_map import StageMap, TARGET_TILES
+from src.recognition.marker_tracker import MarkerTracker
+from src.recognition.screen_classifier import ScreenClassifier
 from src.verification.movement_checker import MovementChecker
 from src.verification.battle_checker import BattleChecker
 from src.verification.skill_checker import SkillChecker
 from src.verification.reward_checker import RewardChecker
 from src.logger.test_logger import TestLogger
+from src.capture.executor import run_in_capture_executor
 from config.settings import (
     BUTTONS_DIR,
     ICONS_DIR,
     UI_DIR,
     WAIT_SCREEN_TRANSITION,
+    WAIT_ENEMY_PHASE,
+    TEMPLATE_PYRAMID_SCALE,
+    TILE_SEARCH_RADIUS,
+    CHARACTER_MARKER_OFFSET_Y,
+    STAGE_MAP_MOVE_RANGE,
+    BATTLE_COST_CHECK_INTERVAL,
 )
 
 logger = logging.getLogger(__name__)
@@ -45,6 +58,13 @@ class StageRunner:
         self.skill_checker = SkillChecker(self.matcher, self.controller)
         self.reward_checker = RewardChecker(self.matcher, self.controller)
 
+        # 화면 상태 분류 (전체 화면 템플릿 매칭 대신 프레임 한 장으로 판별)
+        self.screen_classifier = ScreenClassifier(self.matcher.capture)
+
+        # 스테이지 맵 격자 (스테이지마다 처음 발판을 고를 때 한 번 검출)
+        self.stage_map: Optional[StageMap] = None
+        self.marker_tracker: Optional[MarkerTracker] = None
+
         logger.info("StageRunner 초기화 완료")
 
     def run_normal_1_4(self) -> Dict[str, Any]:
@@ -71,6 +91,8 @@ class StageRunner:
         logger.info("="*60)
 
         overall_success = True
+        self.stage_map = None
+        self.marker_tracker = None
 
         # ============================================================
         # 1단계: 시작 발판 클릭 → 편성 화면 이동
@@ -201,11 +223,11 @@ class StageRunner:
             )
 
         # ============================================================
-        # 5단계: 전투 종료 확인 (Victory)
+        # 5단계: 전투 종료 확인 (Victory, 대기 중 코스트 게이지 판독)
         # ============================================================
         logger.info("\n[5단계] 전투 종료 확인")
 
-        battle_end_result = self._wait_for_victory(timeout=120)
+        battle_end_result = self._run_battle_phase(timeout=120)
         self.test_logger.log_check(
             "전투_종료",
             battle_end_result["success"],
@@ -265,7 +287,7 @@ class StageRunner:
         }
 
         # 출격 버튼 찾기
-        button_location = self.matcher.find_template(deploy_button)
+        button_location = self.matcher.find_template(deploy_button, pyramid_scale=TEMPLATE_PYRAMID_SCALE)
         if not button_location:
             result["message"] = "출격 버튼을 찾을 수 없습니다"
             return result
@@ -276,7 +298,8 @@ class StageRunner:
         try:
             clicked = self.controller.click_template(
                 button_location,
-                wait_after=WAIT_SCREEN_TRANSITION
+                wait_after=WAIT_SCREEN_TRANSITION,
+                settle=True
             )
             if not clicked:
                 result["message"] = "출격 버튼 클릭 실패"
@@ -321,7 +344,8 @@ class StageRunner:
         try:
             clicked = self.controller.click_template(
                 button_location,
-                wait_after=2.0
+                wait_after=2.0,
+                settle=True
             )
             if clicked:
                 result["button_clicked"] = True
@@ -335,10 +359,135 @@ class StageRunner:
 
         return result
 
+    def _find_character_position(self) -> Optional[Tuple[int, int]]:
+        """
+        캐릭터 마커로 현재 캐릭터 위치 추정 (처음에만 전체 화면 검색, 이후 마커 주변 추적)
+
+        Returns:
+            캐릭터 발 위치 (x, y) 또는 None (마커 미발견)
+        """
+        if self.marker_tracker is None:
+            character_marker_mask = ICONS_DIR / "character_marker_mask.png"
+            mask_path = character_marker_mask if character_marker_mask.exists() else None
+            self.marker_tracker = MarkerTracker(self.matcher, mask_path=mask_path)
+
+        marker = self.marker_tracker.track()
+        if not marker:
+            return None
+
+        return (
+            marker[0] + marker[2] // 2,
+            marker[1] + marker[3] // 2 + CHARACTER_MARKER_OFFSET_Y
+        )
+
+    def _nearest_tile(
+        self,
+        tiles: List[Tuple[Tuple[int, int, int, int], float]],
+        character_position: Optional[Tuple[int, int]]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        탐색 반경 안에서 캐릭터와 가장 가까운 발판 선택
+
+        Args:
+            tiles: find_all 결과 [((left, top, width, height), 신뢰도), ...]
+            character_position: 캐릭터 위치 (None이면 신뢰도가 가장 높은 발판)
+
+        Returns:
+            발판 위치 (left, top, width, height) 또는 None
+        """
+        if not tiles:
+            return None
+
+        if character_position is None:
+            return tiles[0][0]
+
+        char_x, char_y = character_position
+        best = None
+        best_distance = None
+
+        for location, _ in tiles:
+            center_x = location[0] + location[2] // 2
+            center_y = location[1] + location[3] // 2
+            distance = ((center_x - char_x) ** 2 + (center_y - char_y) ** 2) ** 0.5
+            if distance <= TILE_SEARCH_RADIUS and (best_distance is None or distance < best_distance):
+                best = location
+                best_distance = distance
+
+        return best
+
+    def _select_tile_from_map(
+        self,
+        character_position: Optional[Tuple[int, int]]
+    ) -> Optional[Tuple[Tuple[int, int, int, int], bool]]:
+        """
+        스테이지 맵 격자에서 이동할 발판 선택 (적 발판 우선, 이동 범위 안)
+
+        격자는 스테이지에서 처음 호출될 때 한 번만 검출하고, 이후에는 픽셀이 바뀐 칸만 재분류합니다.
+
+        Args:
+            character_position: 캐릭터 위치 (None이면 시작 발판 기준)
+
+        Returns:
+            (발판 위치 (left, top, width, height), 적 발판 여부) 또는 None (격자 미검출 / 후보 없음)
+        """
+        if self.stage_map is None:
+            self.stage_map = StageMap(self.matcher)
+            self.stage_map.detect()
+        else:
+            self.stage_map.update()
+
+        if not self.stage_map.detected:
+            return None
+
+        start = character_position
+        if start is None:
+            start_cells = self.stage_map.cells_of_type("start_tile")
+            if not start_cells:
+                return None
+            start = start_cells[0]
+
+        reachable = self.stage_map.reachable(start, STAGE_MAP_MOVE_RANGE)
+        candidates = [index for index, steps in reachable.items() if steps > 0]
+        if not candidates:
+            return None
+
+        # 적 발판 우선, 같은 종류면 적게 이동하는 칸
+        best = min(
+            candidates,
+            key=lambda index: (self.stage_map.types[index] not in TARGET_TILES, reachable[index])
+        )
+        cell = self.stage_map.cell(best)
+        logger.info(f"스테이지 맵에서 발판 선택: {cell['type']} at {cell['center']} (후보 {len(candidates)}칸)")
+        return cell["location"], cell["type"] in TARGET_TILES
+
+    def _select_tile_by_search(
+        self,
+        character_position: Optional[Tuple[int, int]]
+    ) -> Optional[Tuple[Tuple[int, int, int, int], bool]]:
+        """
+        발판 템플릿을 화면 전체에서 찾아 캐릭터와 가장 가까운 발판 선택 (적 발판 우선)
+
+        Returns:
+            (발판 위치 (left, top, width, height), 적 발판 여부) 또는 None
+        """
+        # 1. 먼저 적이 있는 발판 찾기 (화면의 모든 적 발판 중 가장 가까운 것)
+        enemy_tiles = self.matcher.find_all(ICONS_DIR / "enemy_tile.png")
+        enemy_location = self._nearest_tile(enemy_tiles, character_position)
+        if enemy_location:
+            logger.info(f"적이 있는 발판 발견: {enemy_location} (후보 {len(enemy_tiles)}개)")
+            return enemy_location, True
+
+        # 2. 범위 안에 적이 없으면 빈 발판 찾기
+        empty_tiles = self.matcher.find_all(ICONS_DIR / "empty_tile.png")
+        empty_location = self._nearest_tile(empty_tiles, character_position)
+        if empty_location:
+            logger.info(f"적이 없는 발판 발견: {empty_location} (후보 {len(empty_tiles)}개)")
+            return empty_location, False
+
+        return None
+
     def _click_movable_tile(self) -> Dict[str, Any]:
-        """이동 가능한 발판 클릭 (적 유무 상관없이)"""
-        empty_tile = ICONS_DIR / "empty_tile.png"
-        enemy_tile = ICONS_DIR / "enemy_tile.png"
+        """이동 가능한 발판 클릭 (적 유무 상관없이, 캐릭터와 가장 가까운 발판)"""
         battle_ui = UI_DIR / "battle_ui.png"
 
         result = {
@@ -349,28 +498,24 @@ class StageRunner:
             "message": ""
         }
 
-        # 1. 먼저 적이 있는 발판 찾기
-        enemy_location = self.matcher.find_template(enemy_tile)
-
-        if enemy_location:
-            logger.info(f"적이 있는 발판 발견: {enemy_location}")
-            result["has_enemy"] = True
-            tile_to_click = enemy_location
+        character_position = self._find_character_position()
+        if character_position:
+            logger.info(f"캐릭터 위치: {character_position} (탐색 반경 {TILE_SEARCH_RADIUS}픽셀)")
         else:
-            # 2. 적이 없으면 빈 발판 찾기
-            empty_location = self.matcher.find_template(empty_tile)
-            if not empty_location:
-                result["message"] = "이동 가능한 발판을 찾을 수 없습니다"
-                logger.error(result["message"])
-                return result
+            logger.info("캐릭터 마커 미발견, 신뢰도가 가장 높은 발판 선택")
+
+        # 스테이지 맵 격자에서 선택 (격자를 검출하지 못하면 발판 템플릿 직접 검색)
+        selected = self._select_tile_from_map(character_position) or self._select_tile_by_search(character_position)
+        if not selected:
+            result["message"] = "이동 가능한 발판을 찾을 수 없습니다"
+            logger.error(result["message"])
+            return result
 
-            logger.info(f"적이 없는 발판 발견: {empty_location}")
-            result["has_enemy"] = False
-            tile_to_click = empty_location
+        tile_to_click, result["has_enemy"] = selected
 
-        # 3. 발판 클릭
+        # 발판 클릭
         try:
-            clicked = self.controller.click_template(tile_to_click, wait_after=2.0)
+            clicked = self.controller.click_template(tile_to_click, wait_after=2.0, settle=True)
             if not clicked:
                 result["message"] = "발판 클릭 실패"
                 logger.error(result["message"])
@@ -379,7 +524,7 @@ class StageRunner:
             result["tile_clicked"] = True
             logger.info("발판 클릭 성공")
 
-            # 4. 적이 있었다면 전투 진입 확인
+            # 적이 있었다면 전투 진입 확인
             if result["has_enemy"]:
                 battle_started = self.matcher.wait_for_template(battle_ui, timeout=10)
                 if battle_started:
@@ -417,7 +562,7 @@ class StageRunner:
         }
 
         # Phase 종료 버튼 찾기
-        button_location = self.matcher.find_template(phase_end_button)
+        button_location = self.matcher.find_template(phase_end_button, pyramid_scale=TEMPLATE_PYRAMID_SCALE)
         if not button_location:
             result["message"] = "Phase 종료 버튼을 찾을 수 없습니다"
             logger.warning(result["message"])
@@ -428,7 +573,7 @@ class StageRunner:
 
         # Phase 종료 버튼 클릭
         try:
-            clicked = self.controller.click_template(button_location, wait_after=3.0)
+            clicked = self.controller.click_template(button_location)
             if not clicked:
                 result["message"] = "Phase 종료 버튼 클릭 실패"
                 logger.error(result["message"])
@@ -437,29 +582,26 @@ class StageRunner:
             result["button_clicked"] = True
             logger.info("Phase 종료 버튼 클릭 성공")
 
-            # 3초 대기 후 적 이동으로 인한 전투 발생 확인
-            logger.info("적 이동 확인 중... (3초 대기)")
-            import time
-            time.sleep(3.0)
-
-            # 스테이지 맵 화면이 사라졌는지 확인 (전투 진입 시 사라짐)
-            stage_map_visible = self.matcher.template_exists(stage_map)
-
-            if not stage_map_visible:
-                # 스테이지 맵이 사라짐 → 전투 진입 가능성
-                logger.info("스테이지 맵 화면 사라짐, 전투 UI 확인 중...")
-                battle_ui_appeared = self.matcher.find_template(battle_ui)
+            # 적 이동 중 멈춤/전투 전환 지연이 있을 수 있으므로 화면 한 장으로 판단하지 않고
+            # 최대 대기 시간까지 전투 UI를 계속 확인 (전투가 시작되면 바로 진행)
+            logger.info(f"적 이동 확인 중... (전투 UI 대기, 최대 {WAIT_ENEMY_PHASE}초)")
+            battle_ui_appeared = self.matcher.wait_for_template(
+                battle_ui,
+                timeout=WAIT_ENEMY_PHASE,
+                check_interval=0.5
+            )
 
-                if battle_ui_appeared:
-                    result["enemy_approached"] = True
-                    result["battle_started"] = True
-                    result["success"] = True
-                    result["message"] = "Phase 종료 후 적 이동으로 전투 진입"
-                    logger.info(result["message"])
-                else:
-                    result["success"] = True
-                    result["message"] = "Phase 종료 후 화면 전환 (전투 아님)"
-                    logger.info(result["message"])
+            if battle_ui_appeared:
+                result["enemy_approached"] = True
+                result["battle_started"] = True
+                result["success"] = True
+                result["message"] = "Phase 종료 후 적 이동으로 전투 진입"
+                logger.info(result["message"])
+            elif not self._is_screen("stage_map", stage_map):
+                # 대기 시간 동안 전투 UI 없이 스테이지 맵이 사라짐
+                result["success"] = True
+                result["message"] = "Phase 종료 후 화면 전환 (전투 아님)"
+                logger.info(result["message"])
             else:
                 # 스테이지 맵이 여전히 보임 → 전투 없음
                 result["success"] = True
@@ -498,19 +640,31 @@ class StageRunner:
 
         return result
 
-    def _wait_for_victory(self, timeout: int = 120) -> Dict[str, Any]:
-        """전투 종료 대기 (Victory 화면 확인)"""
-        victory_screen = UI_DIR / "victory.png"
-
+    def _victory_result(self, victory_appeared: bool, duration: float, timeout: float) -> Dict[str, Any]:
+        """Victory 대기 결과 생성 (_wait_for_victory / _wait_for_victory_async 공용)"""
         result = {
             "success": False,
             "victory_found": False,
-            "duration": 0.0,
+            "duration": duration,
             "message": ""
         }
 
+        if victory_appeared:
+            result["victory_found"] = True
+            result["success"] = True
+            result["message"] = f"전투 승리 확인 (소요시간: {duration:.1f}초)"
+            logger.info(result["message"])
+        else:
+            result["message"] = f"Victory 화면이 {timeout}초 내에 나타나지 않음"
+            logger.error(result["message"])
+
+        return result
+
+    def _wait_for_victory(self, timeout: int = 120) -> Dict[str, Any]:
+        """전투 종료 대기 (Victory 화면 확인)"""
+        victory_screen = UI_DIR / "victory.png"
+
         logger.info(f"전투 종료 대기 중 (최대 {timeout}초)...")
-        import time
         start_time = time.time()
 
         # Victory 화면 대기
@@ -520,19 +674,163 @@ class StageRunner:
             check_interval=2.0
         )
 
-        result["duration"] = time.time() - start_time
+        return self._victory_result(bool(victory_appeared), time.time() - start_time, timeout)
 
-        if victory_appeared:
-            result["victory_found"] = True
-            result["success"] = True
-            result["message"] = f"전투 승리 확인 (소요시간: {result['duration']:.1f}초)"
-            logger.info(result["message"])
+    async def _wait_for_victory_async(self, timeout: float = 120) -> Dict[str, Any]:
+        """전투 종료 대기 (Victory 화면 확인, _wait_for_victory의 asyncio 버전)"""
+        victory_screen = UI_DIR / "victory.png"
+
+        logger.info(f"전투 종료 대기 중 (최대 {timeout}초)...")
+        start_time = time.time()
+
+        victory_appeared = await self.matcher.await_template(
+            victory_screen,
+            timeout=timeout,
+            check_interval=2.0
+        )
+
+        return self._victory_result(bool(victory_appeared), time.time() - start_time, timeout)
+
+    async def _monitor_cost_async(self, battle_over: asyncio.Event) -> List[Dict[str, Any]]:
+        """
+        전투 중 현재 코스트 게이지 주기적 판독 (battle_over가 설정될 때까지)
+
+        재생 백엔드에서는 녹화 프레임을 Victory 대기와 나눠 쓰지 않도록 한 번만 읽습니다.
+
+        Returns:
+            [{"time": 전투 단계 시작 후 경과 시간 (초), "cost": 코스트 값}] (읽기 실패한 회차 제외)
+        """
+        readings: List[Dict[str, Any]] = []
+        start_time = time.time()
+
+        while not battle_over.is_set():
+            cost = await run_in_capture_executor(self.skill_checker.read_current_cost)
+            if cost is not None:
+                readings.append({"time": time.time() - start_time, "cost": cost})
+
+            if not self.controller.realtime:
+                break
+            try:
+                # 판독 간격만큼 대기하되 전투가 끝나면 바로 종료
+                await asyncio.wait_for(battle_over.wait(), BATTLE_COST_CHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+        return readings
+
+    def _run_battle_phase(self, timeout: int = 120) -> Dict[str, Any]:
+        """
+        전투 진행 단계 (Victory 대기 + 코스트 게이지 판독을 run_steps_concurrently로 동시 실행)
+
+        Returns:
+            _wait_for_victory 결과 + "cost_readings": 전투 중 읽은 코스트 목록
+        """
+        return asyncio.run(self._run_battle_phase_async(timeout))
+
+    async def _run_battle_phase_async(self, timeout: float) -> Dict[str, Any]:
+        """_run_battle_phase의 코루틴 (Victory 대기가 끝나면 코스트 판독도 종료)"""
+        battle_over = asyncio.Event()
+
+        async def wait_for_victory() -> Dict[str, Any]:
+            try:
+                return await self._wait_for_victory_async(timeout)
+            finally:
+                battle_over.set()
+
+        steps = await self.run_steps_concurrently(
+            {
+                "victory": wait_for_victory(),
+                "cost": self._monitor_cost_async(battle_over),
+            },
+            timeout=timeout + WAIT_SCREEN_TRANSITION  # 마지막 폴링 1회 여유
+        )
+
+        victory_step = steps["victory"]
+        if victory_step["status"] == "done":
+            result = victory_step["result"]
         else:
-            result["message"] = f"Victory 화면이 {timeout}초 내에 나타나지 않음"
+            result = {
+                "success": False,
+                "victory_found": False,
+                "duration": float(timeout),
+                "message": f"전투 종료 대기 실패 ({victory_step['status']}: {victory_step['error']})"
+            }
             logger.error(result["message"])
 
+        result["cost_readings"] = steps["cost"]["result"] or []
+        if result["cost_readings"]:
+            costs = [reading["cost"] for reading in result["cost_readings"]]
+            logger.info(f"전투 중 코스트 판독 {len(costs)}회 (최소 {min(costs)}, 최대 {max(costs)})")
+
         return result
 
+    async def run_steps_concurrently(
+        self,
+        steps: Dict[str, Awaitable[Any]],
+        timeout: Optional[float] = None,
+        stop_on_first: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 단계를 코루틴으로 동시에 실행 (예: 승리 대기 + 코스트 읽기 + 스킬 사용)
+
+        제한 시간이 지나거나 stop_on_first로 먼저 끝난 단계가 있으면 남은 단계를 취소하고
+        취소가 끝날 때까지 기다립니다. 이 코루틴 자체가 취소되어도 모든 단계를 취소합니다.
+
+        GUI 작업 스레드처럼 이벤트 루프가 없는 곳에서는 asyncio.run()으로 실행합니다.
+
+        Args:
+            steps: {단계 이름: 코루틴}
+            timeout: 전체 제한 시간 (초). None이면 제한 없음
+            stop_on_first: True면 한 단계가 끝나는 즉시 나머지 단계 취소
+
+        Returns:
+            {단계 이름: {"status": "done" | "error" | "cancelled", "result", "error"}}
+        """
+        if not steps:
+            return {}
+
+        tasks = {name: asyncio.ensure_future(step) for name, step in steps.items()}
+        return_when = asyncio.FIRST_COMPLETED if stop_on_first else asyncio.ALL_COMPLETED
+
+        try:
+            _, pending = await asyncio.wait(tasks.values(), timeout=timeout, return_when=return_when)
+            if pending:
+                logger.info(f"남은 단계 취소: {[name for name, task in tasks.items() if task in pending]}")
+        finally:
+            # 제한 시간 초과 / 조기 종료 / 외부 취소 시 남은 단계 정리
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for name, task in tasks.items():
+            if task.cancelled():
+                results[name] = {"status": "cancelled", "result": None, "error": None}
+            elif task.exception() is not None:
+                logger.error(f"단계 실행 중 오류 ({name}): {task.exception()}")
+                results[name] = {"status": "error", "result": None, "error": str(task.exception())}
+            else:
+                results[name] = {"status": "done", "result": task.result(), "error": None}
+
+        return results
+
+    def _is_screen(self, state: str, template: Path) -> bool:
+        """
+        현재 화면 상태 확인 (화면 분류기로 판별, 판별할 수 없으면 템플릿 매칭)
+
+        Args:
+            state: 화면 상태 이름 (예: "stage_map")
+            template: 분류기가 판별할 수 없을 때 확인할 템플릿
+
+        Returns:
+            해당 화면이면 True
+        """
+        detected = self.screen_classifier.is_screen(state)
+        if detected is None:
+            return bool(self.matcher.template_exists(template))
+        return detected
+
     def _verify_damage_report(self) -> Dict[str, Any]:
         """통계 버튼 클릭 및 데미지 기록 확인 → 랭크 획득 → 스테이지 복귀"""
         battle_log_button = BUTTONS_DIR / "battle_log_button.png"
@@ -568,7 +866,7 @@ class StageRunner:
 
         # 2. 통계 버튼 클릭
         try:
-            clicked = self.controller.click_template(button_location, wait_after=2.0)
+            clicked = self.controller.click_template(button_location, wait_after=2.0, settle=True)
             if not clicked:
                 result["message"] = "통계 버튼 클릭 실패"
                 logger.error(result["message"])
@@ -594,10 +892,9 @@ class StageRunner:
         result["damage_report_found"] = True
         logger.info("데미지 기록 창 출현 확인")
 
-        # 4. 데미지 기록 확인 후 3초 대기
-        logger.info("데미지 기록 확인 중... (3초 대기)")
-        import time
-        time.sleep(3.0)
+        # 4. 데미지 기록 창 표시 완료 대기 (최대 3초)
+        logger.info("데미지 기록 확인 중... (화면 안정화 대기, 최대 3초)")
+        self.controller.wait_until_stable(max_wait=3.0)
 
         # 5. 데미지 기록 창 닫기 버튼 클릭
         logger.info("데미지 기록 창 닫기 버튼 찾는 중...")
@@ -610,7 +907,7 @@ class StageRunner:
         logger.info(f"닫기 버튼 발견: {close_button_location}")
 
         try:
-            clicked = self.controller.click_template(close_button_location, wait_after=2.0)
+            clicked = self.controller.click_template(close_button_location, wait_after=2.0, settle=True)
             if not clicked:
                 result["message"] = "데미지 기록 창 닫기 버튼 클릭 실패"
                 logger.error(result["message"])
@@ -626,7 +923,7 @@ class StageRunner:
 
         # 6. Victory 화면으로 복귀 확인 후 확인 버튼 클릭
         logger.info("Victory 화면 확인 버튼 찾는 중...")
-        time.sleep(1.0)  # 화면 안정화 대기
+        self.controller.wait_until_stable(max_wait=1.0)  # 화면 안정화 대기
 
         confirm_location = self.matcher.find_template(confirm_button)
         if not confirm_location:
@@ -637,7 +934,7 @@ class StageRunner:
         logger.info(f"확인 버튼 발견: {confirm_location}")
 
         try:
-            clicked = self.controller.click_template(confirm_location, wait_after=2.0)
+            clicked = self.controller.click_template(confirm_location, wait_after=2.0, settle=True)
             if not clicked:
                 result["message"] = "확인 버튼 클릭 실패"
                 logger.error(result["message"])
@@ -665,7 +962,7 @@ class StageRunner:
 
         # 6. 랭크 획득 창의 확인 버튼 클릭
         logger.info("랭크 획득 창 확인 버튼 찾는 중...")
-        time.sleep(1.0)  # 화면 안정화 대기
+        self.controller.wait_until_stable(max_wait=1.0)  # 화면 안정화 대기
 
         confirm_location = self.matcher.find_template(confirm_button)
         if not confirm_location:
@@ -676,7 +973,7 @@ class StageRunner:
         logger.info(f"확인 버튼 발견: {confirm_location}")
 
         try:
-            clicked = self.controller.click_template(confirm_location, wait_after=3.0)
+            clicked = self.controller.click_template(confirm_location, wait_after=3.0, settle=True)
             if not clicked:
                 result["message"] = "확인 버튼 클릭 실패"
                 logger.error(result["message"])
@@ -692,7 +989,7 @@ class StageRunner:
 
         # 7. 스테이지 화면 복귀 확인
         logger.info("스테이지 화면 복귀 확인 중...")
-        time.sleep(2.0)  # 화면 전환 대기
+        self.controller.wait_until_stable(max_wait=2.0)  # 화면 전환 대기
 
         stage_appeared = self.matcher.wait_for_template(stage_map, timeout=10)
 
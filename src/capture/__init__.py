@@ -0,0 +1,26 @@
+"""화면 캡처 모듈"""
+
+from .backends import (
+    CaptureBackend,
+    PyAutoGuiBackend,
+    XShmBackend,
+    create_capture_backend,
+    get_capture_backend,
+)
+from .frame_source import Frame, FrameSource, get_frame_source
+from .replay import ReplayBackend
+from .executor import get_capture_executor, run_in_capture_executor
+
+__all__ = [
+    'CaptureBackend',
+    'PyAutoGuiBackend',
+    'XShmBackend',
+    'ReplayBackend',
+    'create_capture_backend',
+    'get_capture_backend',
+    'Frame',
+    'FrameSource',
+    'get_frame_source',
+    'get_capture_executor',
+    'run_in_capture_executor',
+]
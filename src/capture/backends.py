@@ -0,0 +1,502 @@
+"""화면 캡처 백엔드 모듈
+
+pyautogui.screenshot()은 PIL 이미지를 만든 뒤 np.array + cvtColor로 다시 변환하므로
+프레임마다 전체 화면 버퍼(2560x1440 기준 약 11MB)를 여러 번 복사합니다.
+
+- PyAutoGuiBackend: 기존 pyautogui 경로 (모든 플랫폼, 폴백)
+- XShmBackend: Linux X11 공유 메모리(XShm) 캡처. 미리 할당한 버퍼에 직접 채우고
+               BGR/그레이스케일 변환도 미리 할당한 배열에 한 번만 수행
+
+반환되는 배열은 백엔드가 재사용하는 버퍼일 수 있습니다.
+같은 스레드에서 다음 grab()을 호출하면 덮어써지므로, 보관하려면 copy()하세요.
+"""
+
+import sys
+import ctypes
+import ctypes.util
+import logging
+import threading
+from typing import Optional, Tuple, Dict
+
+import numpy as np
+from PIL import Image
+
+from config.settings import CAPTURE_BACKEND, REPLAY_SOURCE, REPLAY_TIMELINE
+
+logger = logging.getLogger(__name__)
+
+# OpenCV 사용 가능 여부 확인 (없으면 numpy로 변환)
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+
+def _bgr_to_gray(bgr: np.ndarray) -> np.ndarray:
+    """OpenCV 없이 BGR(A) → 그레이스케일 변환 (ITU-R BT.601, cv2와 동일 가중치)"""
+    gray = bgr[..., 0] * 0.114 + bgr[..., 1] * 0.587 + bgr[..., 2] * 0.299
+    return np.round(gray).astype(np.uint8)
+
+
+class CaptureBackend:
+    """화면 캡처 백엔드 기본 클래스"""
+
+    name = "base"
+    realtime = True  # 실제 화면 여부 (False면 대기 시간을 건너뛰어도 됨)
+    simulates_input = False  # True면 마우스/키보드 입력을 handle_input()으로 전달
+
+    def size(self) -> Tuple[int, int]:
+        """
+        화면 크기
+
+        Returns:
+            (width, height)
+        """
+        raise NotImplementedError
+
+    def grab(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        화면 캡처 (OpenCV 배열)
+
+        Args:
+            region: 캡처할 영역 (left, top, width, height). None이면 전체 화면
+            grayscale: True면 그레이스케일(H, W), False면 BGR(H, W, 3)
+            out: 결과를 채울 배열 (선택, 영역 크기와 같은 연속 배열)
+
+        Returns:
+            캡처된 프레임 배열 (out이 주어지면 out)
+        """
+        raise NotImplementedError
+
+    def grab_image(self, region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+        """
+        화면 캡처 (PIL RGB 이미지, 기존 pyautogui.screenshot()과 같은 형식)
+
+        Args:
+            region: 캡처할 영역 (left, top, width, height). None이면 전체 화면
+
+        Returns:
+            PIL Image 객체
+        """
+        bgr = self.grab(region, grayscale=False)
+        return Image.fromarray(np.ascontiguousarray(bgr[:, :, ::-1]))
+
+    def handle_input(self, kind: str, **details) -> None:
+        """
+        시뮬레이션 입력 처리 (simulates_input 백엔드만 사용)
+
+        Args:
+            kind: "click", "drag", "key", "hotkey", "text"
+            **details: 입력 정보 (click이면 x, y)
+        """
+
+    def close(self) -> None:
+        """리소스 해제"""
+
+
+class PyAutoGuiBackend(CaptureBackend):
+    """pyautogui.screenshot() 기반 캡처 (기존 방식, 모든 플랫폼)"""
+
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def size(self) -> Tuple[int, int]:
+        size = self._pyautogui.size()
+        return (size.width, size.height)
+
+    def grab(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        rgb = np.asarray(self._pyautogui.screenshot(region=region))
+
+        if OPENCV_AVAILABLE:
+            code = cv2.COLOR_RGB2GRAY if grayscale else cv2.COLOR_RGB2BGR
+            return cv2.cvtColor(rgb, code, dst=out)
+
+        bgr = rgb[:, :, ::-1]
+        frame = _bgr_to_gray(bgr) if grayscale else np.ascontiguousarray(bgr)
+        if out is not None:
+            out[...] = frame
+            return out
+        return frame
+
+    def grab_image(self, region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+        return self._pyautogui.screenshot(region=region)
+
+
+# ========================================
+# X11 공유 메모리 (XShm) 백엔드
+# ========================================
+
+_ZPIXMAP = 2
+_ALL_PLANES = 0xFFFFFFFFFFFFFFFF
+_IPC_PRIVATE = 0
+_IPC_CREAT = 0o1000
+_IPC_RMID = 0
+
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ("shmseg", ctypes.c_ulong),
+        ("shmid", ctypes.c_int),
+        ("shmaddr", ctypes.c_void_p),
+        ("readOnly", ctypes.c_int),
+    ]
+
+
+class _XImage(ctypes.Structure):
+    # 사용하는 필드까지만 정의 (포인터로만 접근하므로 뒤쪽 함수 테이블은 생략)
+    # obdata: XShm 이미지는 세그먼트 정보 포인터 → XDestroyImage 전에 비워야 함
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("xoffset", ctypes.c_int),
+        ("format", ctypes.c_int),
+        ("data", ctypes.c_void_p),
+        ("byte_order", ctypes.c_int),
+        ("bitmap_unit", ctypes.c_int),
+        ("bitmap_bit_order", ctypes.c_int),
+        ("bitmap_pad", ctypes.c_int),
+        ("depth", ctypes.c_int),
+        ("bytes_per_line", ctypes.c_int),
+        ("bits_per_pixel", ctypes.c_int),
+        ("red_mask", ctypes.c_ulong),
+        ("green_mask", ctypes.c_ulong),
+        ("blue_mask", ctypes.c_ulong),
+        ("obdata", ctypes.c_void_p),
+    ]
+
+
+def _load_library(name: str):
+    path = ctypes.util.find_library(name)
+    if not path:
+        raise OSError(f"lib{name}를 찾을 수 없습니다")
+    return ctypes.CDLL(path, use_errno=True)
+
+
+class XShmBackend(CaptureBackend):
+    """
+    X11 공유 메모리 캡처 (Linux)
+
+    전체 화면 크기의 공유 메모리 세그먼트 하나를 numpy 배열로 매핑하고,
+    XShmGetImage가 X 서버에서 그 버퍼로 직접 픽셀을 씁니다 (PIL/중간 복사 없음).
+    영역 캡처는 같은 세그먼트를 가리키는 영역 크기의 XImage로 해당 영역만 전송합니다.
+    """
+
+    name = "xshm"
+
+    # 영역 크기별 XImage 헤더 최대 보관 개수
+    MAX_REGION_IMAGES = 16
+
+    def __init__(self, display: Optional[str] = None):
+        """
+        Args:
+            display: X 디스플레이 이름 (None이면 $DISPLAY)
+
+        Raises:
+            OSError: X11/XShm을 사용할 수 없는 환경
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("XShm 캡처는 Linux(X11)에서만 사용할 수 있습니다")
+
+        self._x11 = _load_library("X11")
+        self._xext = _load_library("Xext")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._declare_functions()
+
+        self._display = self._x11.XOpenDisplay(display.encode() if display else None)
+        if not self._display:
+            raise OSError("X 디스플레이에 연결할 수 없습니다 (DISPLAY 확인)")
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._images: Dict[Tuple[int, int], ctypes.POINTER(_XImage)] = {}
+        self._shminfo = _XShmSegmentInfo()
+        self._attached = False
+
+        try:
+            if not self._xext.XShmQueryExtension(self._display):
+                raise OSError("X 서버가 MIT-SHM 확장을 지원하지 않습니다")
+
+            screen = self._x11.XDefaultScreen(self._display)
+            self._root = self._x11.XRootWindow(self._display, screen)
+            self._visual = self._x11.XDefaultVisual(self._display, screen)
+            self._depth = self._x11.XDefaultDepth(self._display, screen)
+            self._width = self._x11.XDisplayWidth(self._display, screen)
+            self._height = self._x11.XDisplayHeight(self._display, screen)
+
+            self._create_segment()
+        except Exception:
+            self.close()
+            raise
+
+        logger.info(f"XShm 캡처 백엔드 초기화: {self._width}x{self._height}, depth={self._depth}")
+
+    def _declare_functions(self) -> None:
+        """ctypes 함수 시그니처 선언 (64비트 포인터 잘림 방지)"""
+        x11, xext, libc = self._x11, self._xext, self._libc
+
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XRootWindow.restype = ctypes.c_ulong
+        x11.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDefaultVisual.restype = ctypes.c_void_p
+        x11.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDestroyImage.argtypes = [ctypes.POINTER(_XImage)]
+
+        xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+        xext.XShmCreateImage.restype = ctypes.POINTER(_XImage)
+        xext.XShmCreateImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+            ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo), ctypes.c_uint, ctypes.c_uint,
+        ]
+        xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmGetImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(_XImage),
+            ctypes.c_int, ctypes.c_int, ctypes.c_ulong,
+        ]
+
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        libc.shmdt.argtypes = [ctypes.c_void_p]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+
+    def _create_segment(self) -> None:
+        """전체 화면 크기 공유 메모리 세그먼트 생성 및 X 서버에 연결"""
+        full_image = self._create_image(self._width, self._height)
+        if full_image.contents.bits_per_pixel != 32:
+            raise OSError(f"지원하지 않는 픽셀 형식입니다 ({full_image.contents.bits_per_pixel}bpp)")
+
+        nbytes = full_image.contents.bytes_per_line * self._height
+        shmid = self._libc.shmget(_IPC_PRIVATE, nbytes, _IPC_CREAT | 0o600)
+        if shmid < 0:
+            raise OSError(ctypes.get_errno(), "shmget 실패")
+        self._shminfo.shmid = shmid
+
+        address = self._libc.shmat(shmid, None, 0)
+        if address in (None, ctypes.c_void_p(-1).value):
+            self._libc.shmctl(shmid, _IPC_RMID, None)
+            raise OSError(ctypes.get_errno(), "shmat 실패")
+        self._shminfo.shmaddr = address
+        self._shminfo.readOnly = 0
+
+        if not self._xext.XShmAttach(self._display, ctypes.byref(self._shminfo)):
+            raise OSError("XShmAttach 실패")
+        self._x11.XSync(self._display, 0)
+        self._attached = True
+
+        # 프로세스가 비정상 종료해도 세그먼트가 남지 않도록 연결 직후 삭제 예약
+        self._libc.shmctl(shmid, _IPC_RMID, None)
+
+        full_image.contents.data = address
+        self._images[(self._width, self._height)] = full_image
+
+        # 공유 메모리 전체를 바이트 배열로 매핑 (영역별 뷰는 여기서 잘라 사용)
+        self._buffer = np.ctypeslib.as_array((ctypes.c_uint8 * nbytes).from_address(address))
+
+    def _create_image(self, width: int, height: int):
+        """공유 메모리 세그먼트를 사용하는 XImage 헤더 생성"""
+        image = self._xext.XShmCreateImage(
+            self._display, self._visual, self._depth, _ZPIXMAP,
+            self._shminfo.shmaddr, ctypes.byref(self._shminfo), width, height
+        )
+        if not image:
+            raise OSError(f"XShmCreateImage 실패 ({width}x{height})")
+        return image
+
+    def _destroy_image(self, image) -> None:
+        """XImage 헤더만 해제 (공유 메모리와 세그먼트 정보는 Xlib이 해제하지 않도록 분리)"""
+        image.contents.data = None
+        image.contents.obdata = None
+        self._x11.XDestroyImage(image)
+
+    def _image_for(self, width: int, height: int):
+        """영역 크기에 맞는 XImage 반환 (크기별 캐싱)"""
+        key = (width, height)
+        image = self._images.get(key)
+        if image is not None:
+            return image
+
+        if len(self._images) >= self.MAX_REGION_IMAGES:
+            # 전체 화면 이미지를 제외하고 가장 오래된 항목 제거
+            for old_key in list(self._images):
+                if old_key != (self._width, self._height):
+                    self._destroy_image(self._images.pop(old_key))
+                    break
+
+        image = self._create_image(width, height)
+        self._images[key] = image
+        return image
+
+    def _clip_region(
+        self,
+        region: Optional[Tuple[int, int, int, int]]
+    ) -> Tuple[int, int, int, int]:
+        """영역을 화면 안으로 제한"""
+        if region is None:
+            return 0, 0, self._width, self._height
+
+        left = min(max(0, int(region[0])), self._width - 1)
+        top = min(max(0, int(region[1])), self._height - 1)
+        width = max(1, min(int(region[2]), self._width - left))
+        height = max(1, min(int(region[3]), self._height - top))
+        return left, top, width, height
+
+    def _output_buffer(self, name: str, size: int) -> np.ndarray:
+        """스레드별 출력 버퍼 (최대 크기로 한 번만 할당 후 재사용)"""
+        buffer = getattr(self._local, name, None)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=np.uint8)
+            setattr(self._local, name, buffer)
+        return buffer
+
+    def size(self) -> Tuple[int, int]:
+        return (self._width, self._height)
+
+    def grab(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        left, top, width, height = self._clip_region(region)
+        pixels = width * height
+
+        if out is None and grayscale:
+            out = self._output_buffer("gray", pixels)[:pixels].reshape(height, width)
+        elif out is None:
+            out = self._output_buffer("bgr", pixels * 3)[:pixels * 3].reshape(height, width, 3)
+
+        with self._lock:
+            bgra = self._capture(left, top, width, height)
+
+            # 공유 메모리(BGRX) → 출력 버퍼로 1회 변환
+            if OPENCV_AVAILABLE:
+                code = cv2.COLOR_BGRA2GRAY if grayscale else cv2.COLOR_BGRA2BGR
+                cv2.cvtColor(bgra, code, dst=out)
+            elif grayscale:
+                out[...] = _bgr_to_gray(bgra)
+            else:
+                out[...] = bgra[:, :, :3]
+
+        return out
+
+    def grab_image(self, region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+        left, top, width, height = self._clip_region(region)
+
+        with self._lock:
+            bgra = self._capture(left, top, width, height)
+            # BGRX 원시 데이터에서 바로 RGB 이미지 생성 (numpy 변환 없음)
+            return Image.frombuffer("RGB", (width, height), bgra, "raw", "BGRX", 0, 1).copy()
+
+    def _capture(self, left: int, top: int, width: int, height: int) -> np.ndarray:
+        """XShmGetImage로 공유 메모리에 캡처 후 BGRA 뷰 반환 (락 보유 상태에서 호출)"""
+        image = self._image_for(width, height)
+        if not self._xext.XShmGetImage(self._display, self._root, image, left, top, _ALL_PLANES):
+            raise OSError(f"XShmGetImage 실패: region=({left}, {top}, {width}, {height})")
+
+        stride = image.contents.bytes_per_line
+        return self._buffer[:stride * height].reshape(height, stride // 4, 4)[:, :width]
+
+    def close(self) -> None:
+        display = getattr(self, "_display", None)
+        if not display:
+            return
+
+        for image in self._images.values():
+            self._destroy_image(image)
+        self._images.clear()
+
+        if self._attached:
+            self._xext.XShmDetach(display, ctypes.byref(self._shminfo))
+            self._x11.XSync(display, 0)
+            self._attached = False
+        if self._shminfo.shmaddr:
+            self._libc.shmdt(self._shminfo.shmaddr)
+            self._shminfo.shmaddr = None
+
+        self._x11.XCloseDisplay(display)
+        self._display = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# ========================================
+# 백엔드 선택
+# ========================================
+
+_BACKENDS = {
+    "xshm": XShmBackend,
+    "pyautogui": PyAutoGuiBackend,
+}
+
+# 프로세스 전역 백엔드 (X 연결/공유 메모리 재사용)
+_shared_backend: Optional[CaptureBackend] = None
+_shared_backend_lock = threading.Lock()
+
+
+def create_capture_backend(name: str = CAPTURE_BACKEND) -> CaptureBackend:
+    """
+    캡처 백엔드 생성
+
+    Args:
+        name: "auto" | "xshm" | "pyautogui" | "replay"
+              auto는 XShm을 먼저 시도하고 실패하면 pyautogui 사용
+              replay는 설정의 REPLAY_SOURCE / REPLAY_TIMELINE 재생
+
+    Returns:
+        CaptureBackend 인스턴스
+    """
+    if name == "replay":
+        from src.capture.replay import ReplayBackend
+        if not REPLAY_SOURCE:
+            raise ValueError("replay 캡처 백엔드를 사용하려면 REPLAY_SOURCE를 설정하세요")
+        return ReplayBackend(REPLAY_SOURCE, REPLAY_TIMELINE)
+
+    if name != "auto":
+        if name not in _BACKENDS:
+            raise ValueError(f"Unknown capture backend: {name}")
+        return _BACKENDS[name]()
+
+    if sys.platform.startswith("linux"):
+        try:
+            return XShmBackend()
+        except OSError as e:
+            logger.info(f"XShm 캡처를 사용할 수 없어 pyautogui로 캡처합니다: {e}")
+
+    return PyAutoGuiBackend()
+
+
+def get_capture_backend() -> CaptureBackend:
+    """프로세스 전역 캡처 백엔드 반환 (설정의 CAPTURE_BACKEND 사용)"""
+    global _shared_backend
+    if _shared_backend is None:
+        with _shared_backend_lock:
+            if _shared_backend is None:
+                _shared_backend = create_capture_backend()
+                logger.info(f"화면 캡처 백엔드: {_shared_backend.name}")
+    return _shared_backend
@@ -0,0 +1,48 @@
+"""캡처/입력 전용 실행기 모듈
+
+비동기 API(TemplateMatcher.await_*, GameController.*_async)는 캡처/매칭/입력을
+이벤트 루프 밖의 한 스레드에서 실행합니다.
+
+단일 스레드인 이유:
+- 캡처 백엔드는 프레임 버퍼를 재사용하므로 동시에 캡처하면 버퍼가 덮어써질 수 있음
+- 입력(클릭/키 입력)은 제출한 순서대로 전달되어야 함
+
+대기 루프는 폴링 1회 단위로 작업을 제출하므로, 여러 코루틴이 동시에 대기 중이어도
+입력 작업은 다른 폴링 사이에 바로 실행됩니다.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Any
+
+# 프로세스 전역 실행기
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_capture_executor() -> ThreadPoolExecutor:
+    """프로세스 전역 캡처/입력 실행기 반환 (단일 스레드, 첫 호출 시 생성)"""
+    global _shared_executor
+    if _shared_executor is None:
+        with _shared_executor_lock:
+            if _shared_executor is None:
+                _shared_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture-io")
+    return _shared_executor
+
+
+async def run_in_capture_executor(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    캡처/입력 실행기에서 함수 실행 후 결과 반환 (asyncio)
+
+    코루틴이 취소되어도 이미 시작된 작업은 끝까지 실행됩니다 (폴링 1회 / 입력 1회 단위).
+
+    Args:
+        func: 실행할 함수
+        *args, **kwargs: 함수 인자
+
+    Returns:
+        함수 반환값
+    """
+    future = get_capture_executor().submit(func, *args, **kwargs)
+    return await asyncio.wrap_future(future)
@@ -0,0 +1,346 @@
+"""백그라운드 프레임 캡처 모듈
+
+대기 루프(wait_for_template, wait_battle_end 등)가 폴링마다 직접 화면을 캡처하면
+매 폴링이 캡처 지연을 그대로 부담합니다. FrameSource는 백그라운드 스레드에서
+설정된 fps로 계속 캡처해서 미리 할당한 링 버퍼에 타임스탬프와 함께 보관하고,
+소비자는 이미 캡처된 프레임을 가져다 매칭/OCR만 수행합니다.
+
+- latest(): 가장 최근 프레임
+- frame_after(T): 타임스탬프 T 이후에 캡처를 시작한 첫 프레임 (없으면 대기)
+
+링 버퍼 슬롯은 재사용됩니다. 반환된 프레임 배열은 약 (ring_size - 1) / fps 초 동안
+유효하며, 그보다 오래 보관하려면 copy=True로 요청하세요.
+"""
+
+import time
+import logging
+import threading
+from typing import Optional, Tuple, NamedTuple, Dict, Any
+
+import numpy as np
+
+from config.settings import (
+    CAPTURE_FPS,
+    CAPTURE_RING_SIZE,
+    CAPTURE_USE_FRAME_SOURCE,
+)
+from src.capture.backends import CaptureBackend, get_capture_backend
+
+logger = logging.getLogger(__name__)
+
+# OpenCV 사용 가능 여부 확인 (없으면 numpy로 변환)
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+
+class Frame(NamedTuple):
+    """캡처된 프레임"""
+    seq: int  # 프레임 번호 (1부터 증가)
+    timestamp: float  # 캡처 시작 시각 (time.monotonic 기준)
+    image: np.ndarray  # BGR(H, W, 3) 또는 그레이스케일(H, W)
+
+
+class FrameSource:
+    """백그라운드 스레드 화면 캡처 + 타임스탬프 링 버퍼"""
+
+    def __init__(
+        self,
+        capture_backend: Optional[CaptureBackend] = None,
+        fps: float = CAPTURE_FPS,
+        ring_size: int = CAPTURE_RING_SIZE,
+    ):
+        """
+        Args:
+            capture_backend: 화면 캡처 백엔드 (None이면 프로세스 전역 백엔드 사용)
+            fps: 목표 캡처 속도 (초당 프레임 수)
+            ring_size: 링 버퍼 프레임 수 (2 이상)
+        """
+        self.capture = capture_backend or get_capture_backend()
+        self.fps = fps
+        self.ring_size = max(2, ring_size)
+
+        width, height = self.capture.size()
+        self.size = (width, height)
+
+        # 링 버퍼 미리 할당 (BGR + 필요 시 채우는 그레이스케일)
+        self._bgr = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(self.ring_size)]
+        self._gray = [np.empty((height, width), dtype=np.uint8) for _ in range(self.ring_size)]
+        self._seqs = [0] * self.ring_size  # 슬롯별 프레임 번호 (0 = 비어있음/쓰는 중)
+        self._timestamps = [0.0] * self.ring_size
+        self._gray_seqs = [0] * self.ring_size  # 슬롯별 그레이스케일 변환된 프레임 번호
+
+        self._seq = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # 통계
+        self.overruns = 0  # 캡처가 목표 주기보다 오래 걸린 횟수
+        self.errors = 0
+        self._started_at = 0.0
+
+    # ========================================
+    # 시작 / 중지
+    # ========================================
+
+    @property
+    def running(self) -> bool:
+        """캡처 스레드 실행 중 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "FrameSource":
+        """캡처 스레드 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return self
+
+        self._stop_event.clear()
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="FrameSource", daemon=True)
+        self._thread.start()
+        logger.info(f"FrameSource 시작: {self.size[0]}x{self.size[1]}, {self.fps}fps, 링 {self.ring_size}개")
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """캡처 스레드 중지"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("FrameSource 중지")
+
+    def __enter__(self) -> "FrameSource":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        """캡처 루프 (백그라운드 스레드)"""
+        interval = 1.0 / self.fps if self.fps > 0 else 0.0
+        next_time = time.monotonic()
+
+        while not self._stop_event.is_set():
+            with self._condition:
+                slot = self._seq % self.ring_size
+                self._seqs[slot] = 0  # 쓰는 동안 소비자가 가져가지 않도록 표시
+
+            timestamp = time.monotonic()
+            try:
+                self.capture.grab(None, grayscale=False, out=self._bgr[slot])
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"백그라운드 화면 캡처 중 오류 발생: {e}")
+                self._stop_event.wait(max(interval, 0.1))
+                continue
+
+            with self._condition:
+                self._seq += 1
+                self._seqs[slot] = self._seq
+                self._timestamps[slot] = timestamp
+                self._condition.notify_all()
+
+            next_time += interval
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                # 캡처가 주기보다 느림 → 밀린 주기는 건너뜀
+                self.overruns += 1
+                next_time = time.monotonic()
+
+    # ========================================
+    # 프레임 조회
+    # ========================================
+
+    def _newest_slot(self) -> Optional[int]:
+        """가장 최근 완성된 슬롯 (락 보유 상태에서 호출)"""
+        if self._seq == 0:
+            return None
+        slot = (self._seq - 1) % self.ring_size
+        return slot if self._seqs[slot] == self._seq else None
+
+    def _make_frame(
+        self,
+        slot: int,
+        region: Optional[Tuple[int, int, int, int]],
+        grayscale: bool,
+        copy: bool
+    ) -> Frame:
+        """슬롯을 Frame으로 변환 (락 보유 상태에서 호출)"""
+        seq = self._seqs[slot]
+
+        if grayscale:
+            if self._gray_seqs[slot] != seq:
+                if OPENCV_AVAILABLE:
+                    cv2.cvtColor(self._bgr[slot], cv2.COLOR_BGR2GRAY, dst=self._gray[slot])
+                else:
+                    bgr = self._bgr[slot]
+                    self._gray[slot][...] = np.round(
+                        bgr[..., 0] * 0.114 + bgr[..., 1] * 0.587 + bgr[..., 2] * 0.299
+                    ).astype(np.uint8)
+                self._gray_seqs[slot] = seq
+            image = self._gray[slot]
+        else:
+            image = self._bgr[slot]
+
+        if region:
+            left, top, width, height = region
+            image = image[top:top + height, left:left + width]
+
+        if copy:
+            image = image.copy()
+
+        return Frame(seq, self._timestamps[slot], image)
+
+    def latest(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False,
+        copy: bool = False
+    ) -> Optional[Frame]:
+        """
+        가장 최근 프레임 반환 (대기 없음)
+
+        Args:
+            region: 잘라낼 영역 (left, top, width, height). None이면 전체 화면
+            grayscale: 그레이스케일 여부
+            copy: 링 버퍼와 분리된 복사본 반환 여부
+
+        Returns:
+            Frame 또는 None (아직 캡처된 프레임 없음)
+        """
+        with self._condition:
+            slot = self._newest_slot()
+            if slot is None:
+                return None
+            return self._make_frame(slot, region, grayscale, copy)
+
+    def frame_after(
+        self,
+        timestamp: float,
+        timeout: Optional[float] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False,
+        copy: bool = False
+    ) -> Optional[Frame]:
+        """
+        타임스탬프 이후에 캡처를 시작한 첫 프레임 반환 (없으면 대기)
+
+        클릭 직후 time.monotonic()을 넘기면 클릭 이후 화면만 받을 수 있습니다.
+
+        Args:
+            timestamp: 기준 시각 (time.monotonic 기준)
+            timeout: 최대 대기 시간 (초). None이면 캡처 주기의 5배
+            region: 잘라낼 영역 (left, top, width, height)
+            grayscale: 그레이스케일 여부
+            copy: 링 버퍼와 분리된 복사본 반환 여부
+
+        Returns:
+            Frame 또는 None (타임아웃 / 캡처 중지)
+        """
+        if timeout is None:
+            timeout = 5.0 / self.fps if self.fps > 0 else 1.0
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                # 링 안에서 조건을 만족하는 가장 오래된 프레임 검색
+                best = None
+                for slot in range(self.ring_size):
+                    seq = self._seqs[slot]
+                    if seq and self._timestamps[slot] >= timestamp:
+                        if best is None or seq < self._seqs[best]:
+                            best = slot
+                if best is not None:
+                    return self._make_frame(best, region, grayscale, copy)
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.running:
+                    return None
+                self._condition.wait(remaining)
+
+    def next_frame(
+        self,
+        after_seq: int,
+        timeout: Optional[float] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False,
+        copy: bool = False
+    ) -> Optional[Frame]:
+        """
+        after_seq보다 새로운 가장 최근 프레임 반환 (없으면 다음 프레임까지 대기)
+
+        폴링 루프에서 같은 프레임을 두 번 처리하지 않기 위해 사용합니다.
+
+        Args:
+            after_seq: 마지막으로 처리한 프레임 번호 (처음이면 0)
+            timeout: 최대 대기 시간 (초). None이면 캡처 주기의 5배
+            region: 잘라낼 영역 (left, top, width, height)
+            grayscale: 그레이스케일 여부
+            copy: 링 버퍼와 분리된 복사본 반환 여부
+
+        Returns:
+            Frame 또는 None (타임아웃 / 캡처 중지)
+        """
+        if timeout is None:
+            timeout = 5.0 / self.fps if self.fps > 0 else 1.0
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                slot = self._newest_slot()
+                if slot is not None and self._seqs[slot] > after_seq:
+                    return self._make_frame(slot, region, grayscale, copy)
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.running:
+                    return None
+                self._condition.wait(remaining)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캡처 통계 반환
+
+        Returns:
+            {"frames", "fps", "overruns", "errors", "running"}
+        """
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        with self._condition:
+            frames = self._seq
+        return {
+            "frames": frames,
+            "fps": frames / elapsed if elapsed > 0 else 0.0,
+            "overruns": self.overruns,
+            "errors": self.errors,
+            "running": self.running,
+        }
+
+
+# 프로세스 전역 프레임 소스
+_shared_source: Optional[FrameSource] = None
+_shared_source_lock = threading.Lock()
+
+
+def get_frame_source() -> Optional[FrameSource]:
+    """
+    프로세스 전역 프레임 소스 반환 (CAPTURE_USE_FRAME_SOURCE가 켜져 있을 때만, 첫 호출 시 시작)
+
+    Returns:
+        실행 중인 FrameSource 또는 None (설정 꺼짐)
+    """
+    global _shared_source
+    if not CAPTURE_USE_FRAME_SOURCE:
+        return None
+
+    if _shared_source is None:
+        with _shared_source_lock:
+            if _shared_source is None:
+                _shared_source = FrameSource().start()
+    return _shared_source
@@ -0,0 +1,309 @@
+"""녹화 화면 재생 캡처 백엔드
+
+라이브 게임 없이 녹화된 프레임(PNG 디렉토리 또는 동영상)을 화면처럼 제공합니다.
+TemplateMatcher, GameController와 이들을 사용하는 검증 모듈은 코드 수정 없이
+CAPTURE_BACKEND = "replay"만으로 재생 화면에 대해 동작합니다.
+
+타임라인(JSON)으로 화면 전환 시점을 지정할 수 있습니다.
+
+    {
+        "frames": [
+            {"frame": "stage_map.png", "advance": "click", "click_region": [2162, 1273, 357, 150]},
+            {"frame": "formation_screen.png", "advance": "click"},
+            {"frame": "battle_0001.png", "advance": "grabs", "count": 5},
+            {"frame": "mission_complete.png", "advance": "time", "duration": 2.0}
+        ]
+    }
+
+- frame: PNG 파일명 (디렉토리 기준) 또는 동영상 프레임 번호
+- advance: 다음 단계로 넘어가는 조건
+    - "click": 클릭 시 (click_region이 있으면 영역 안 클릭만)
+    - "grabs": count번 캡처 후 (실시간 대기 없이 결정적으로 진행)
+    - "time": duration초 경과 후 (실시간)
+    - "none": 넘어가지 않음 (기본값: 마지막 단계)
+
+타임라인이 없으면 모든 프레임을 순서대로 사용하고 클릭할 때마다 다음 프레임으로 넘어갑니다.
+"""
+
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, List, Dict, Any
+
+import numpy as np
+from PIL import Image
+
+from src.capture.backends import CaptureBackend
+from config.settings import REPLAY_FRAME_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# OpenCV 사용 가능 여부 확인 (동영상 재생에 필요)
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mkv", ".mov", ".webm")
+
+
+class ReplayBackend(CaptureBackend):
+    """녹화 프레임 재생 캡처 백엔드 (입력은 타임라인 진행으로 시뮬레이션)"""
+
+    name = "replay"
+    realtime = False
+    simulates_input = True
+
+    def __init__(
+        self,
+        source: Path | str,
+        timeline: Optional[Path | str | Dict[str, Any]] = None,
+        cache_size: int = REPLAY_FRAME_CACHE_SIZE
+    ):
+        """
+        Args:
+            source: PNG 프레임 디렉토리 또는 동영상 파일 경로
+            timeline: 타임라인 JSON 파일 경로 또는 딕셔너리 (None이면 클릭마다 다음 프레임)
+            cache_size: 디코딩 프레임 캐시 최대 개수 (최근 사용 순으로 유지)
+
+        Raises:
+            FileNotFoundError: source가 존재하지 않음
+            ValueError: 재생할 프레임이 없음
+        """
+        self.source = Path(source)
+        if not self.source.exists():
+            raise FileNotFoundError(f"재생 소스가 존재하지 않습니다: {self.source}")
+
+        self._video = None
+        self._video_next_index = 0
+        self._frame_files: List[Path] = []
+
+        if self.source.is_dir():
+            self._frame_files = sorted(self.source.glob("*.png"))
+            frame_count = len(self._frame_files)
+        elif self.source.suffix.lower() in VIDEO_EXTENSIONS:
+            if not OPENCV_AVAILABLE:
+                raise ValueError("동영상 재생에는 OpenCV가 필요합니다")
+            self._video = cv2.VideoCapture(str(self.source))
+            frame_count = int(self._video.get(cv2.CAP_PROP_FRAME_COUNT))
+        else:
+            raise ValueError(f"지원하지 않는 재생 소스입니다: {self.source}")
+
+        if frame_count == 0:
+            raise ValueError(f"재생할 프레임이 없습니다: {self.source}")
+
+        self.steps = self._load_timeline(timeline, frame_count)
+        if not self.steps:
+            raise ValueError("타임라인에 재생할 단계가 없습니다")
+
+        self._lock = threading.Lock()
+        # 디코딩 캐시 (LRU): {frame: (BGR, 그레이)}, 동영상은 프레임 수 제한이 없으므로 개수 제한
+        self._frames: OrderedDict[Any, Tuple[np.ndarray, Optional[np.ndarray]]] = OrderedDict()
+        self.cache_size = max(1, cache_size)
+        self.step_index = 0
+        self._step_grabs = 0
+        self._step_started = time.monotonic()
+
+        # 통계
+        self.grabs = 0
+        self.inputs: List[Dict[str, Any]] = []  # 시뮬레이션된 입력 기록
+
+        height, width = self._frame_arrays(self.steps[0]["frame"])[0].shape[:2]
+        self._size = (width, height)
+
+        logger.info(f"재생 백엔드 초기화: {self.source.name}, {len(self.steps)}단계, {width}x{height}")
+
+    def _load_timeline(
+        self,
+        timeline: Optional[Path | str | Dict[str, Any]],
+        frame_count: int
+    ) -> List[Dict[str, Any]]:
+        """타임라인 로드 (없으면 프레임 순서대로 클릭 진행)"""
+        if timeline is None:
+            if self._frame_files:
+                frames = [path.name for path in self._frame_files]
+            else:
+                frames = list(range(frame_count))
+            steps = [{"frame": frame, "advance": "click"} for frame in frames]
+            steps[-1]["advance"] = "none"
+            return steps
+
+        if not isinstance(timeline, dict):
+            with open(timeline, 'r', encoding='utf-8') as f:
+                timeline = json.load(f)
+
+        steps = []
+        for step in timeline.get("frames", []):
+            step = dict(step)
+            step.setdefault("advance", "none")
+            steps.append(step)
+        return steps
+
+    # ========================================
+    # 프레임 디코딩
+    # ========================================
+
+    def _frame_arrays(self, frame: Any) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """단계 프레임의 (BGR, 그레이스케일) 배열 반환 (디코딩 결과 LRU 캐싱)"""
+        cached = self._frames.get(frame)
+        if cached is not None:
+            self._frames.move_to_end(frame)
+            return cached
+
+        if self._video is not None:
+            bgr = self._read_video_frame(int(frame))
+        else:
+            path = self.source / frame
+            rgb = np.array(Image.open(path).convert("RGB"))
+            bgr = np.ascontiguousarray(rgb[:, :, ::-1])
+
+        bgr.setflags(write=False)
+        self._frames[frame] = (bgr, None)
+        while len(self._frames) > self.cache_size:
+            self._frames.popitem(last=False)  # 가장 오래 사용하지 않은 프레임 제거
+        return self._frames[frame]
+
+    def _read_video_frame(self, index: int) -> np.ndarray:
+        """동영상 프레임 디코딩 (순차 재생이면 탐색 없이 다음 프레임 읽기)"""
+        if index != self._video_next_index:
+            self._video.set(cv2.CAP_PROP_POS_FRAMES, index)
+
+        ok, bgr = self._video.read()
+        if not ok:
+            raise ValueError(f"동영상 프레임을 읽을 수 없습니다: {self.source.name} #{index}")
+
+        self._video_next_index = index + 1
+        return bgr
+
+    def _gray(self, frame: Any) -> np.ndarray:
+        """단계 프레임의 그레이스케일 배열 (처음 요청 시 변환 후 캐싱)"""
+        bgr, gray = self._frame_arrays(frame)
+        if gray is None:
+            if OPENCV_AVAILABLE:
+                gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+            else:
+                gray = np.round(
+                    bgr[..., 0] * 0.114 + bgr[..., 1] * 0.587 + bgr[..., 2] * 0.299
+                ).astype(np.uint8)
+            gray.setflags(write=False)
+            self._frames[frame] = (bgr, gray)
+        return gray
+
+    # ========================================
+    # 타임라인 진행
+    # ========================================
+
+    @property
+    def current_step(self) -> Dict[str, Any]:
+        """현재 타임라인 단계"""
+        return self.steps[self.step_index]
+
+    @property
+    def finished(self) -> bool:
+        """마지막 단계 도달 여부"""
+        return self.step_index >= len(self.steps) - 1
+
+    def advance(self) -> bool:
+        """
+        다음 단계로 진행
+
+        Returns:
+            진행했으면 True (이미 마지막 단계면 False)
+        """
+        with self._lock:
+            return self._advance_locked()
+
+    def _advance_locked(self) -> bool:
+        if self.finished:
+            return False
+
+        self.step_index += 1
+        self._step_grabs = 0
+        self._step_started = time.monotonic()
+        logger.debug(f"재생 단계 진행: {self.step_index} ({self.current_step['frame']})")
+        return True
+
+    def reset(self) -> None:
+        """첫 단계로 되감기"""
+        with self._lock:
+            self.step_index = 0
+            self._step_grabs = 0
+            self._step_started = time.monotonic()
+            self.grabs = 0
+            self.inputs.clear()
+
+    def _advance_by_time_or_grabs(self) -> None:
+        """캡처 시점에 grabs/time 조건 확인 (락 보유 상태에서 호출)"""
+        while not self.finished:
+            step = self.current_step
+            advance = step["advance"]
+            if advance == "grabs" and self._step_grabs >= step.get("count", 1):
+                self._advance_locked()
+            elif advance == "time" and time.monotonic() - self._step_started >= step.get("duration", 0):
+                self._advance_locked()
+            else:
+                break
+
+    def handle_input(self, kind: str, **details: Any) -> None:
+        """
+        시뮬레이션된 입력 처리 (GameController가 pyautogui 대신 호출)
+
+        Args:
+            kind: "click", "drag", "key", "hotkey", "text"
+            **details: 입력 정보 (click이면 x, y)
+        """
+        with self._lock:
+            self.inputs.append({"kind": kind, "step": self.step_index, **details})
+
+            step = self.current_step
+            if kind != "click" or step["advance"] != "click":
+                return
+
+            region = step.get("click_region")
+            if region:
+                x, y = details.get("x", -1), details.get("y", -1)
+                if not (region[0] <= x < region[0] + region[2] and region[1] <= y < region[1] + region[3]):
+                    logger.debug(f"재생: 클릭 영역 밖 ({x}, {y}), 단계 유지")
+                    return
+
+            self._advance_locked()
+
+    # ========================================
+    # CaptureBackend 구현
+    # ========================================
+
+    def size(self) -> Tuple[int, int]:
+        return self._size
+
+    def grab(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = False,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        with self._lock:
+            self._advance_by_time_or_grabs()
+            frame = self.current_step["frame"]
+            self._step_grabs += 1
+            self.grabs += 1
+
+        image = self._gray(frame) if grayscale else self._frame_arrays(frame)[0]
+
+        if region:
+            left, top, width, height = region
+            image = image[top:top + height, left:left + width]
+
+        if out is not None:
+            out[...] = image
+            return out
+        return image
+
+    def close(self) -> None:
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+        self._frames.clear()
@@ -1,7 +1,21 @@
 """OCR (Optical Character Recognition) 모듈"""
 
+from .backends import (
+    OCRBackend,
+    PytesseractBackend,
+    TesseractAPIBackend,
+    create_ocr_backend,
+    get_ocr_backend,
+)
 from .ocr_reader import OCRReader
+from .pool import OCRPool
 
 __all__ = [
     'OCRReader',
+    'OCRPool',
+    'OCRBackend',
+    'PytesseractBackend',
+    'TesseractAPIBackend',
+    'create_ocr_backend',
+    'get_ocr_backend',
 ]
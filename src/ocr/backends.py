@@ -0,0 +1,488 @@
+"""OCR 엔진 백엔드 모듈
+
+pytesseract.image_to_string()은 호출할 때마다 tesseract 프로세스를 새로 띄우고
+언어 모델(kor+eng traineddata)을 다시 로드합니다. 작은 ROI 하나를 읽는 시간보다
+프로세스 생성 + 모델 로드 시간이 훨씬 큽니다.
+
+- PytesseractBackend: 기존 pytesseract 경로 (호출마다 프로세스 생성, 폴백)
+- TesseractAPIBackend: libtesseract C API를 ctypes로 직접 호출. 언어/변수 조합별로
+                       TessBaseAPI 핸들을 한 번만 초기화하고 이후 읽기에서 재사용
+
+두 백엔드 모두 pytesseract와 같은 image_to_string(image, lang, config) 형식을 사용하므로
+OCRReader의 Tesseract 설정 문자열(--psm, -c 변수)을 그대로 쓸 수 있습니다.
+image_to_data()는 단어별 위치(TSV)를 반환합니다 (여러 ROI 일괄 인식용).
+"""
+
+import os
+import sys
+import shlex
+import ctypes
+import ctypes.util
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Dict, List, Any
+
+import numpy as np
+from PIL import Image
+
+from config.settings import OCR_BACKEND
+
+logger = logging.getLogger(__name__)
+
+# Windows 기본 설치 경로 (UB-Mannheim 빌드, libtesseract DLL도 같은 폴더에 설치됨)
+WINDOWS_TESSERACT_DIR = Path(r'C:\Program Files\Tesseract-OCR')
+
+DEFAULT_LANG = 'eng'  # pytesseract 기본 언어와 동일
+
+TSV_WORD_LEVEL = 5  # Tesseract TSV의 단어 레벨 (1: 페이지, 2: 블록, 3: 문단, 4: 라인, 5: 단어)
+
+
+def parse_tsv(tsv: str) -> List[Dict[str, Any]]:
+    """
+    Tesseract TSV 출력에서 단어 목록 추출
+
+    Args:
+        tsv: image_to_data TSV 문자열 (헤더 유무 무관)
+
+    Returns:
+        [{'text', 'left', 'top', 'width', 'height', 'conf', 'block', 'line'}, ...] (빈 단어 제외)
+    """
+    words = []
+    for row in tsv.splitlines():
+        columns = row.split('\t')
+        if len(columns) < 12 or not columns[0].isdigit():
+            continue  # 헤더 또는 불완전한 줄
+
+        if int(columns[0]) != TSV_WORD_LEVEL:
+            continue
+
+        text = columns[11].strip()
+        if not text:
+            continue
+
+        words.append({
+            'text': text,
+            'left': int(columns[6]),
+            'top': int(columns[7]),
+            'width': int(columns[8]),
+            'height': int(columns[9]),
+            'conf': float(columns[10]),
+            'block': int(columns[2]),
+            'line': int(columns[4]),
+        })
+    return words
+
+
+class OCRBackend:
+    """OCR 엔진 백엔드 기본 클래스"""
+
+    name = "base"
+
+    def image_to_string(
+        self,
+        image: Image.Image,
+        lang: str = DEFAULT_LANG,
+        config: str = ''
+    ) -> str:
+        """
+        이미지에서 텍스트 인식 (pytesseract.image_to_string과 같은 형식)
+
+        Args:
+            image: 입력 이미지 (PIL)
+            lang: 언어 설정 ('kor', 'eng', 'kor+eng')
+            config: Tesseract 설정 문자열 (예: '--psm 7 -c tessedit_char_whitelist=0123456789')
+
+        Returns:
+            인식된 텍스트
+        """
+        raise NotImplementedError
+
+    def image_to_data(
+        self,
+        image: Image.Image,
+        lang: str = DEFAULT_LANG,
+        config: str = ''
+    ) -> List[Dict[str, Any]]:
+        """
+        이미지에서 단어별 텍스트와 위치 인식
+
+        Args:
+            image: 입력 이미지 (PIL)
+            lang: 언어 설정
+            config: Tesseract 설정 문자열
+
+        Returns:
+            parse_tsv() 형식의 단어 목록 (좌표는 입력 이미지 기준)
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """엔진 리소스 해제"""
+
+
+class PytesseractBackend(OCRBackend):
+    """pytesseract 기반 백엔드 (호출마다 tesseract 프로세스 실행)"""
+
+    name = "pytesseract"
+
+    def __init__(self, tesseract_cmd: Optional[str] = None):
+        """
+        Args:
+            tesseract_cmd: Tesseract 실행 파일 경로 (선택)
+                          예: r'C:\\Program Files\\Tesseract-OCR\\tesseract.exe'
+
+        Raises:
+            ImportError: pytesseract 미설치
+        """
+        try:
+            import pytesseract
+        except ImportError:
+            raise ImportError(
+                "pytesseract가 설치되지 않았습니다. "
+                "설치: pip install pytesseract"
+            )
+
+        self._pytesseract = pytesseract
+
+        # Tesseract 경로 설정 (Windows 기본 경로 자동 인식)
+        if tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        else:
+            default_path = WINDOWS_TESSERACT_DIR / 'tesseract.exe'
+            if default_path.exists():
+                pytesseract.pytesseract.tesseract_cmd = str(default_path)
+
+    def image_to_string(
+        self,
+        image: Image.Image,
+        lang: str = DEFAULT_LANG,
+        config: str = ''
+    ) -> str:
+        return self._pytesseract.image_to_string(image, lang=lang, config=config)
+
+    def image_to_data(
+        self,
+        image: Image.Image,
+        lang: str = DEFAULT_LANG,
+        config: str = ''
+    ) -> List[Dict[str, Any]]:
+        return parse_tsv(self._pytesseract.image_to_data(image, lang=lang, config=config))
+
+
+# ========================================
+# libtesseract C API (ctypes)
+# ========================================
+
+def _load_tesseract_library(tesseract_cmd: Optional[str] = None) -> Tuple[ctypes.CDLL, Optional[Path]]:
+    """
+    libtesseract 공유 라이브러리 로드
+
+    Args:
+        tesseract_cmd: Tesseract 실행 파일 경로 (같은 폴더의 DLL을 우선 검색)
+
+    Returns:
+        (라이브러리, 라이브러리를 로드한 디렉토리 또는 None(시스템 검색 경로에서 로드))
+
+    Raises:
+        OSError: 라이브러리를 찾을 수 없음
+    """
+    candidates = []
+
+    if sys.platform == "win32":
+        search_dirs = []
+        if tesseract_cmd:
+            search_dirs.append(Path(tesseract_cmd).parent)
+        search_dirs.append(WINDOWS_TESSERACT_DIR)
+
+        for directory in search_dirs:
+            if directory.is_dir():
+                candidates.extend(sorted(directory.glob("libtesseract*.dll"), reverse=True))
+                # 의존 DLL(leptonica 등)도 같은 폴더에서 찾도록 등록
+                os.add_dll_directory(str(directory))
+
+    found = ctypes.util.find_library("tesseract")
+    if found:
+        candidates.append(found)
+    candidates.extend(["libtesseract.so.5", "libtesseract.so.4", "libtesseract.dylib"])
+
+    errors = []
+    for candidate in candidates:
+        try:
+            lib = ctypes.CDLL(str(candidate))
+        except OSError as e:
+            errors.append(f"{candidate}: {e}")
+            continue
+
+        path = Path(candidate)
+        return lib, (path.parent if path.is_absolute() else None)
+
+    raise OSError("libtesseract를 찾을 수 없습니다 (" + "; ".join(errors or ["후보 없음"]) + ")")
+
+
+def _parse_config(config: str) -> Tuple[Optional[int], Dict[str, str]]:
+    """
+    Tesseract 설정 문자열 파싱
+
+    Args:
+        config: 예: '--psm 7 -c tessedit_char_whitelist=0123456789'
+
+    Returns:
+        (PSM 모드 또는 None, {변수 이름: 값})
+    """
+    psm = None
+    variables = {}
+
+    tokens = shlex.split(config, posix=(sys.platform != "win32"))
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        argument = tokens[index + 1] if index + 1 < len(tokens) else None
+
+        if token == '--psm' and argument is not None:
+            psm = int(argument)
+            index += 2
+        elif token == '--dpi' and argument is not None:
+            variables['user_defined_dpi'] = argument
+            index += 2
+        elif token == '-c' and argument is not None and '=' in argument:
+            name, value = argument.split('=', 1)
+            variables[name] = value
+            index += 2
+        else:
+            logger.debug(f"지원하지 않는 Tesseract 설정 무시: {token}")
+            index += 1
+
+    return psm, variables
+
+
+class TesseractAPIBackend(OCRBackend):
+    """
+    libtesseract C API 백엔드 (모델을 메모리에 유지하고 핸들 재사용)
+
+    Tesseract 변수(-c)는 핸들에 남기 때문에 (언어, 변수 조합)별로 핸들을 따로 둡니다.
+    OCRReader는 텍스트(kor+eng)와 숫자(eng + 화이트리스트) 두 조합만 사용하므로
+    핸들은 보통 2개입니다. 핸들은 스레드 안전하지 않아 핸들마다 락을 사용합니다.
+    """
+
+    name = "tesseract_api"
+
+    # pytesseract는 PNG를 DPI 정보 없이 넘기므로 tesseract CLI는 70 DPI로 간주함 (결과 일치용)
+    SOURCE_RESOLUTION = 70
+
+    def __init__(self, tesseract_cmd: Optional[str] = None, tessdata_dir: Optional[str] = None):
+        """
+        Args:
+            tesseract_cmd: Tesseract 실행 파일 경로 (같은 폴더의 libtesseract / tessdata 사용)
+            tessdata_dir: tessdata 디렉토리. None이면 라이브러리를 로드한 폴더의 tessdata
+                          (없으면 TESSDATA_PREFIX 또는 라이브러리 기본 경로)
+
+        Raises:
+            OSError: libtesseract를 찾을 수 없음
+        """
+        self._lib, library_dir = _load_tesseract_library(tesseract_cmd)
+        self._declare_functions()
+
+        if tessdata_dir is None:
+            # datapath가 NULL이면 Tesseract는 TESSDATA_PREFIX 또는 실행 파일(python.exe /
+            # PyInstaller exe) 폴더에서 찾으므로, Windows 설치 폴더의 tessdata를 직접 지정
+            for directory in (Path(tesseract_cmd).parent if tesseract_cmd else None, library_dir):
+                if directory is not None and (directory / 'tessdata').is_dir():
+                    tessdata_dir = str(directory / 'tessdata')
+                    break
+        self.tessdata_dir = tessdata_dir
+
+        self._handles: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[ctypes.c_void_p, threading.Lock]] = {}
+        self._handles_lock = threading.Lock()
+
+        version = self._lib.TessVersion()
+        self.version = version.decode() if version else "unknown"
+        logger.info(f"libtesseract 로드: {self.version}")
+
+    def _declare_functions(self) -> None:
+        """사용하는 C API 함수 시그니처 선언"""
+        lib = self._lib
+        handle = ctypes.c_void_p
+
+        lib.TessVersion.restype = ctypes.c_char_p
+        lib.TessVersion.argtypes = []
+        lib.TessBaseAPICreate.restype = handle
+        lib.TessBaseAPICreate.argtypes = []
+        lib.TessBaseAPIInit3.restype = ctypes.c_int
+        lib.TessBaseAPIInit3.argtypes = [handle, ctypes.c_char_p, ctypes.c_char_p]
+        lib.TessBaseAPISetVariable.restype = ctypes.c_int
+        lib.TessBaseAPISetVariable.argtypes = [handle, ctypes.c_char_p, ctypes.c_char_p]
+        lib.TessBaseAPISetPageSegMode.restype = None
+        lib.TessBaseAPISetPageSegMode.argtypes = [handle, ctypes.c_int]
+        lib.TessBaseAPISetImage.restype = None
+        lib.TessBaseAPISetImage.argtypes = [
+            handle, ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int
+        ]
+        lib.TessBaseAPISetSourceResolution.restype = None
+        lib.TessBaseAPISetSourceResolution.argtypes = [handle, ctypes.c_int]
+        lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p  # TessDeleteText로 해제해야 하므로 포인터로 받음
+        lib.TessBaseAPIGetUTF8Text.argtypes = [handle]
+        lib.TessBaseAPIGetTsvText.restype = ctypes.c_void_p
+        lib.TessBaseAPIGetTsvText.argtypes = [handle, ctypes.c_int]
+        lib.TessDeleteText.restype = None
+        lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIClear.restype = None
+        lib.TessBaseAPIClear.argtypes = [handle]
+        lib.TessBaseAPIEnd.restype = None
+        lib.TessBaseAPIEnd.argtypes = [handle]
+        lib.TessBaseAPIDelete.restype = None
+        lib.TessBaseAPIDelete.argtypes = [handle]
+
+    def _get_handle(
+        self,
+        lang: str,
+        variables: Dict[str, str]
+    ) -> Tuple[ctypes.c_void_p, threading.Lock]:
+        """(언어, 변수 조합)의 초기화된 핸들 반환 (처음 요청 시 모델 로드)"""
+        key = (lang, tuple(sorted(variables.items())))
+
+        entry = self._handles.get(key)
+        if entry is not None:
+            return entry
+
+        with self._handles_lock:
+            entry = self._handles.get(key)
+            if entry is not None:
+                return entry
+
+            api = self._lib.TessBaseAPICreate()
+            datapath = self.tessdata_dir.encode() if self.tessdata_dir else None
+            if self._lib.TessBaseAPIInit3(api, datapath, lang.encode()) != 0:
+                self._lib.TessBaseAPIDelete(api)
+                raise RuntimeError(f"Tesseract 초기화 실패 (언어: {lang}, tessdata: {self.tessdata_dir})")
+
+            for name, value in variables.items():
+                if not self._lib.TessBaseAPISetVariable(api, name.encode(), value.encode()):
+                    logger.warning(f"알 수 없는 Tesseract 변수: {name}")
+
+            entry = (api, threading.Lock())
+            self._handles[key] = entry
+            logger.debug(f"Tesseract 핸들 생성: {lang} {variables}")
+            return entry
+
+    @staticmethod
+    def _to_pixels(image: Image.Image) -> np.ndarray:
+        """PIL 이미지를 8bit 그레이스케일(H, W) 또는 RGB(H, W, 3) 연속 배열로 변환"""
+        if image.mode not in ('L', 'RGB'):
+            image = image.convert('RGB' if image.mode in ('RGBA', 'P', 'CMYK') else 'L')
+        return np.ascontiguousarray(np.asarray(image, dtype=np.uint8))
+
+    def _recognize(self, image: Image.Image, lang: str, config: str, tsv: bool) -> str:
+        """이미지 인식 후 UTF-8 텍스트 또는 TSV 문자열 반환"""
+        psm, variables = _parse_config(config)
+        api, lock = self._get_handle(lang, variables)
+
+        pixels = self._to_pixels(image)
+        height, width = pixels.shape[:2]
+        bytes_per_pixel = 1 if pixels.ndim == 2 else pixels.shape[2]
+
+        with lock:
+            # tesseract CLI 기본값 PSM 3 (자동 페이지 분할)
+            self._lib.TessBaseAPISetPageSegMode(api, 3 if psm is None else psm)
+            self._lib.TessBaseAPISetImage(
+                api, pixels.ctypes.data, width, height, bytes_per_pixel, pixels.strides[0]
+            )
+            self._lib.TessBaseAPISetSourceResolution(api, self.SOURCE_RESOLUTION)
+
+            if tsv:
+                text_ptr = self._lib.TessBaseAPIGetTsvText(api, 0)
+            else:
+                text_ptr = self._lib.TessBaseAPIGetUTF8Text(api)
+            try:
+                text = ctypes.string_at(text_ptr).decode('utf-8', errors='replace') if text_ptr else ""
+            finally:
+                if text_ptr:
+                    self._lib.TessDeleteText(text_ptr)
+                self._lib.TessBaseAPIClear(api)
+
+        return text
+
+    def image_to_string(
+        self,
+        image: Image.Image,
+        lang: str = DEFAULT_LANG,
+        config: str = ''
+    ) -> str:
+        return self._recognize(image, lang, config, tsv=False)
+
+    def image_to_data(
+        self,
+        image: Image.Image,
+        lang: str = DEFAULT_LANG,
+        config: str = ''
+    ) -> List[Dict[str, Any]]:
+        return parse_tsv(self._recognize(image, lang, config, tsv=True))
+
+    def close(self) -> None:
+        with self._handles_lock:
+            for api, lock in self._handles.values():
+                with lock:
+                    self._lib.TessBaseAPIEnd(api)
+                    self._lib.TessBaseAPIDelete(api)
+            self._handles.clear()
+
+
+# ========================================
+# 백엔드 선택
+# ========================================
+
+_BACKENDS = {
+    "tesseract_api": TesseractAPIBackend,
+    "pytesseract": PytesseractBackend,
+}
+
+_shared_backend: Optional[OCRBackend] = None
+_shared_backend_lock = threading.Lock()
+
+
+def create_ocr_backend(name: str = OCR_BACKEND, tesseract_cmd: Optional[str] = None) -> OCRBackend:
+    """
+    OCR 백엔드 생성
+
+    Args:
+        name: "auto" | "tesseract_api" | "pytesseract"
+              auto는 libtesseract 로드와 기본 언어(eng) 초기화를 먼저 시도하고 실패하면 pytesseract 사용
+        tesseract_cmd: Tesseract 실행 파일 경로 (선택)
+
+    Returns:
+        OCRBackend 인스턴스
+
+    Raises:
+        ImportError: 사용할 수 있는 OCR 엔진이 없음 (pytesseract 미설치)
+    """
+    if name != "auto":
+        if name not in _BACKENDS:
+            raise ValueError(f"Unknown OCR backend: {name}")
+        return _BACKENDS[name](tesseract_cmd)
+
+    try:
+        backend = TesseractAPIBackend(tesseract_cmd)
+    except OSError as e:
+        logger.info(f"libtesseract를 사용할 수 없어 pytesseract로 OCR합니다: {e}")
+    else:
+        # 라이브러리만 로드되고 모델(tessdata)을 못 찾는 경우는 첫 읽기에서야 실패하므로
+        # 기본 언어 핸들을 미리 초기화해서 확인
+        try:
+            backend._get_handle(DEFAULT_LANG, {})
+            return backend
+        except RuntimeError as e:
+            logger.info(f"libtesseract 초기화에 실패해 pytesseract로 OCR합니다: {e}")
+            backend.close()
+
+    return PytesseractBackend(tesseract_cmd)
+
+
+def get_ocr_backend() -> OCRBackend:
+    """프로세스 전역 OCR 백엔드 반환 (설정의 OCR_BACKEND 사용, 로드된 모델 공유)"""
+    global _shared_backend
+    if _shared_backend is None:
+        with _shared_backend_lock:
+            if _shared_backend is None:
+                _shared_backend = create_ocr_backend()
+                logger.info(f"OCR 백엔드: {_shared_backend.name}")
+    return _shared_backend
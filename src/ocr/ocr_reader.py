@@ -9,46 +9,73 @@ Tesseract OCR을 사용하여 게임 화면에서 텍스트와 숫자를 읽습
     Tesseract 실행 파일 설치:
     - Windows: https://github.com/UB-Mannheim/tesseract/wiki
     - 한글 언어팩(kor.traineddata) 포함 설치 필요
+
+    libtesseract를 찾을 수 있으면 C API로 모델을 메모리에 유지한 채 읽고,
+    없으면 pytesseract(호출마다 tesseract 프로세스 실행)를 사용합니다 (src/ocr/backends.py).
 """
 
 import re
 import time
-from typing import Optional, List, Tuple, Dict
+from collections import Counter
+from typing import Optional, List, Tuple, Dict, Any
 from PIL import Image
 import numpy as np
 import cv2
 
-try:
-    import pytesseract
-    TESSERACT_AVAILABLE = True
-except ImportError:
-    TESSERACT_AVAILABLE = False
+from config.settings import OCR_USE_GLYPHS
+from src.ocr.backends import OCRBackend, create_ocr_backend, get_ocr_backend
+from src.recognition.digit_recognizer import DigitRecognizer
+from src.recognition.result_cache import ResultCache, get_result_cache
 
 
 class OCRReader:
     """통합 OCR 클래스 - 텍스트/숫자 읽기, 이미지 전처리 포함"""
 
-    def __init__(self, tesseract_cmd: Optional[str] = None):
+    # 정수 인식 PSM 모드 (숫자 인식에 효과적인 순서: 단일 라인, 단일 단어, 블록, 원시 라인, 자동)
+    INTEGER_PSM_MODES = (7, 8, 6, 13, 3)
+
+    # 조기 종료 정족수: 같은 값이 이만큼 나오면 나머지 PSM 모드 생략
+    # (PSM 5개 중 3개 = 과반 → 전체 실행 후 최빈값과 항상 같은 결과)
+    DEFAULT_VOTE_QUORUM = 3
+
+    # 일괄 인식 캔버스 설정 (전처리 후 픽셀 기준)
+    BATCH_MARGIN = 20  # 캔버스 가장자리 여백
+    BATCH_ROW_GAP = 40  # 행 사이 최소 구분 여백 (가장 큰 행 높이의 절반보다 작으면 그 값 사용)
+
+    # 일괄 정수 인식 최소 신뢰도 (행의 단어별 conf 최솟값, 0~100).
+    # 일괄 인식은 PSM 6 한 번뿐이라 투표가 없으므로, 이보다 낮은 행은 read_integer()로 다시 읽기
+    BATCH_MIN_CONFIDENCE = 80.0
+
+    def __init__(
+        self,
+        tesseract_cmd: Optional[str] = None,
+        backend: Optional[OCRBackend] = None,
+        use_glyphs: bool = OCR_USE_GLYPHS,
+        result_cache: Optional[ResultCache] = None
+    ):
         """
         Args:
             tesseract_cmd: Tesseract 실행 파일 경로 (선택)
                           예: r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+            backend: OCR 엔진 백엔드 (None이면 설정의 OCR_BACKEND,
+                     tesseract_cmd가 없으면 프로세스 전역 백엔드를 공유해서 로드된 모델 재사용)
+            use_glyphs: 데미지/코스트 숫자를 글리프 인식(DigitRecognizer)으로 먼저 읽기
+                        (글리프 세트가 없거나 0~9 중 빠진 숫자가 있거나 인식 실패 시 Tesseract)
+            result_cache: read_text / read_integer 결과 캐시 (None이면 프로세스 전역 캐시)
+
+        Raises:
+            ImportError: 사용할 수 있는 OCR 엔진이 없음 (libtesseract, pytesseract 모두 없음)
         """
-        if not TESSERACT_AVAILABLE:
-            raise ImportError(
-                "pytesseract가 설치되지 않았습니다. "
-                "설치: pip install pytesseract"
-            )
-
-        # Tesseract 경로 설정 (Windows 기본 경로 자동 인식)
-        if tesseract_cmd:
-            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        if backend is not None:
+            self.backend = backend
+        elif tesseract_cmd:
+            self.backend = create_ocr_backend(tesseract_cmd=tesseract_cmd)
         else:
-            # Windows 기본 설치 경로
-            import os
-            default_path = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-            if os.path.exists(default_path):
-                pytesseract.pytesseract.tesseract_cmd = default_path
+            self.backend = get_ocr_backend()
+
+        self.use_glyphs = use_glyphs
+        self._digit_recognizers: Dict[str, DigitRecognizer] = {}  # 폰트별 글리프 인식기 (처음 사용 시 로드)
+        self.result_cache = result_cache or get_result_cache()
 
     # ========================================
     # 이미지 전처리
@@ -133,11 +160,21 @@ class OCRReader:
         Returns:
             추출된 텍스트 (공백 제거됨)
         """
+        # 같은 크롭 + 같은 설정이면 캐시된 결과 반환
+        return self.result_cache.get_or_compute(
+            "read_text",
+            image,
+            (self.backend.name, lang, preprocess, config),
+            lambda: self._read_text(image, lang, preprocess, config)
+        )
+
+    def _read_text(self, image: Image.Image, lang: str, preprocess: bool, config: str) -> str:
+        """read_text() 실제 인식 (캐시 미사용)"""
         if preprocess:
             image = self.preprocess_image(image)
 
         try:
-            text = pytesseract.image_to_string(image, lang=lang, config=config)
+            text = self.backend.image_to_string(image, lang=lang, config=config)
             return self._clean_text(text)
         except Exception as e:
             print(f"텍스트 읽기 실패: {e}")
@@ -198,11 +235,8 @@ class OCRReader:
         Returns:
             학생 이름 리스트
         """
-        names = []
-        for bbox in bboxes:
-            name = self.read_student_name(image, bbox)
-            names.append(name)
-        return names
+        names = self.read_texts_batch(image, bboxes, lang='kor+eng')
+        return [self._normalize_student_name(name) for name in names]
 
     # ========================================
     # 숫자 읽기
@@ -217,67 +251,106 @@ class OCRReader:
         preprocess: bool = True
     ) -> Optional[int]:
         """
-        이미지에서 정수 읽기 (재시도 로직 포함)
+        이미지에서 정수 읽기 (PSM 모드별 투표)
 
         Args:
             image: 입력 이미지
             min_value: 최소값 (검증용)
             max_value: 최대값 (검증용)
-            retries: 재시도 횟수
+            retries: 호환용 인자 (Tesseract는 같은 입력에 항상 같은 결과를 내므로
+                     반복해도 투표 결과가 바뀌지 않음 → 1회만 수행)
             preprocess: 전처리 수행 여부
 
         Returns:
             추출된 정수 또는 None (실패 시)
         """
-        # 여러 PSM 모드 시도 (숫자 인식에 효과적인 순서)
-        psm_modes = [7, 8, 6, 13, 3]  # 단일 라인, 단일 단어, 블록, 원시 라인, 자동
+        # 같은 크롭 + 같은 범위면 캐시된 결과 반환
+        return self.result_cache.get_or_compute(
+            "read_integer",
+            image,
+            (self.backend.name, min_value, max_value, preprocess),
+            lambda: self.read_integer_votes(
+                image,
+                min_value=min_value,
+                max_value=max_value,
+                preprocess=preprocess
+            )["value"]
+        )
+
+    def read_integer_votes(
+        self,
+        image: Image.Image,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        preprocess: bool = True,
+        quorum: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        PSM 모드별 결과를 투표해서 정수 읽기 (정족수 도달 시 조기 종료)
+
+        전처리는 1회만 수행하고, 다음 중 하나가 되면 남은 PSM 모드를 생략합니다.
+        - 한 값이 정족수(quorum)만큼 득표
+        - 남은 모드를 모두 다른 값이 가져가도 1위가 바뀔 수 없음
+
+        Args:
+            image: 입력 이미지
+            min_value: 최소값 (검증용)
+            max_value: 최대값 (검증용)
+            preprocess: 전처리 수행 여부
+            quorum: 조기 종료 정족수 (None이면 DEFAULT_VOTE_QUORUM).
+                    과반 미만으로 낮추면 더 빠르지만 전체 투표와 결과가 달라질 수 있음
 
-        # 결과 수집 (빈도 기반 필터링)
-        candidates = []
+        Returns:
+            {
+                "value": Optional[int],  # 최다 득표 값 (동률이면 먼저 나온 값)
+                "votes": Dict[int, int],  # 값별 득표 수
+                "elapsed": float,  # 소요 시간 (초)
+                "calls": int  # Tesseract 호출 횟수
+            }
+        """
+        start_time = time.perf_counter()
+        quorum = self.DEFAULT_VOTE_QUORUM if quorum is None else quorum
+        psm_modes = self.INTEGER_PSM_MODES
 
-        for attempt in range(retries):
-            if preprocess:
-                processed = self.preprocess_image(image)
-            else:
-                processed = image
+        processed = self.preprocess_image(image) if preprocess else image
 
-            # PSM 모드 순회
-            for psm in psm_modes:
-                try:
-                    # Tesseract 설정: 숫자만 인식
-                    config = f'--psm {psm} -c tessedit_char_whitelist=0123456789'
-                    text = pytesseract.image_to_string(processed, config=config)
+        votes = Counter()
+        calls = 0
 
-                    # 숫자 추출
-                    numbers = re.findall(r'\d+', text)
-                    if not numbers:
-                        continue
+        for index, psm in enumerate(psm_modes):
+            calls += 1
+            try:
+                # Tesseract 설정: 숫자만 인식
+                config = f'--psm {psm} -c tessedit_char_whitelist=0123456789'
+                text = self.backend.image_to_string(processed, config=config)
 
+                # 숫자 추출
+                numbers = re.findall(r'\d+', text)
+                if numbers:
                     value = int(numbers[0])
 
                     # 범위 검증
-                    if min_value is not None and value < min_value:
-                        continue
-                    if max_value is not None and value > max_value:
-                        continue
+                    if (min_value is None or value >= min_value) and (max_value is None or value <= max_value):
+                        votes[value] += 1
 
-                    candidates.append(value)
+            except (ValueError, IndexError):
+                pass
 
-                except (ValueError, IndexError):
-                    continue
+            if votes:
+                ranked = votes.most_common(2)
+                leader_votes = ranked[0][1]
+                runner_up_votes = ranked[1][1] if len(ranked) > 1 else 0
+                remaining = len(psm_modes) - index - 1
 
-            # 재시도 간 대기
-            if attempt < retries - 1:
-                time.sleep(0.05)
+                if leader_votes >= quorum or leader_votes > runner_up_votes + remaining:
+                    break
 
-        # 후보가 없으면 실패
-        if not candidates:
-            return None
-
-        # 가장 많이 나온 값 반환 (빈도 기반)
-        from collections import Counter
-        most_common = Counter(candidates).most_common(1)
-        return most_common[0][0]
+        return {
+            "value": votes.most_common(1)[0][0] if votes else None,
+            "votes": dict(votes),
+            "elapsed": time.perf_counter() - start_time,
+            "calls": calls,
+        }
 
     def read_cost_value(
         self,
@@ -297,6 +370,10 @@ class OCRReader:
         if bbox:
             image = image.crop(bbox)
 
+        value = self.read_glyph_value(image, 'cost', min_value=0, max_value=10)
+        if value is not None:
+            return value
+
         return self.read_integer(image, min_value=0, max_value=10)
 
     def read_damage_value(
@@ -317,8 +394,45 @@ class OCRReader:
         if bbox:
             image = image.crop(bbox)
 
+        value = self.read_glyph_value(image, 'damage', min_value=0, max_value=999999)
+        if value is not None:
+            return value
+
         return self.read_integer(image, min_value=0, max_value=999999)
 
+    def read_glyph_value(
+        self,
+        image: Image.Image,
+        font: str,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        글리프 인식으로 숫자 읽기 (Tesseract 미사용)
+
+        Args:
+            image: 숫자 영역 이미지
+            font: 글리프 세트 이름 ('damage', 'cost')
+            min_value: 최소값 (검증용)
+            max_value: 최대값 (검증용)
+
+        Returns:
+            인식된 값 또는 None (글리프 미사용, 글리프 세트 없음/불완전, 신뢰도 부족)
+        """
+        if not self.use_glyphs:
+            return None
+
+        recognizer = self._digit_recognizers.get(font)
+        if recognizer is None:
+            recognizer = DigitRecognizer(font)
+            self._digit_recognizers[font] = recognizer
+
+        if not recognizer.available:
+            return None
+
+        value, _ = recognizer.read(image, min_value=min_value, max_value=max_value)
+        return value
+
     def compare_cost_values(
         self,
         before_image: Image.Image,
@@ -360,12 +474,193 @@ class OCRReader:
         Returns:
             데미지 값 리스트
         """
-        damages = []
-        for bbox in bboxes:
-            damage = self.read_damage_value(image, bbox)
-            damages.append(damage)
+        damages = [
+            self.read_glyph_value(image.crop(bbox), 'damage', min_value=0, max_value=999999)
+            for bbox in bboxes
+        ]
+
+        # 글리프로 읽지 못한 영역만 Tesseract 일괄 인식
+        missing = [index for index, damage in enumerate(damages) if damage is None]
+        if missing:
+            values = self.read_integers_batch(
+                image, [bboxes[index] for index in missing], min_value=0, max_value=999999
+            )
+            for index, value in zip(missing, values):
+                damages[index] = value
+
         return damages
 
+    # ========================================
+    # 일괄 인식 (여러 ROI를 엔진 1회 호출로)
+    # ========================================
+
+    def _stitch_rows(
+        self,
+        crops: List[Image.Image]
+    ) -> Tuple[Image.Image, List[Tuple[int, int]]]:
+        """
+        전처리한 ROI들을 흰 여백으로 구분해서 세로로 이어 붙인 캔버스 생성
+
+        각 ROI는 개별로 전처리(확대 + 이진화)한 뒤 흰 배경/검은 글자로 통일합니다.
+        행 사이 여백을 글자 높이보다 크게 두어 Tesseract가 행을 합치지 않게 합니다.
+
+        Args:
+            crops: ROI 이미지 리스트
+
+        Returns:
+            (캔버스 이미지, 행별 (top, bottom) y 범위)
+        """
+        rows = []
+        for crop in crops:
+            if crop.width == 0 or crop.height == 0:
+                rows.append(np.full((1, 1), 255, dtype=np.uint8))
+                continue
+
+            row = np.array(self.preprocess_image(crop).convert('L'))
+
+            # 테두리가 어두우면 (어두운 배경 + 밝은 글자) 반전
+            border = np.concatenate([row[0], row[-1], row[:, 0], row[:, -1]])
+            if border.mean() < 128:
+                row = 255 - row
+            rows.append(row)
+
+        gap = max(self.BATCH_ROW_GAP, max(row.shape[0] for row in rows) // 2)
+        width = max(row.shape[1] for row in rows) + self.BATCH_MARGIN * 2
+        height = sum(row.shape[0] for row in rows) + gap * (len(rows) - 1) + self.BATCH_MARGIN * 2
+
+        canvas = np.full((height, width), 255, dtype=np.uint8)
+        spans = []
+        top = self.BATCH_MARGIN
+        for row in rows:
+            canvas[top:top + row.shape[0], self.BATCH_MARGIN:self.BATCH_MARGIN + row.shape[1]] = row
+            spans.append((top, top + row.shape[0]))
+            top += row.shape[0] + gap
+
+        return Image.fromarray(canvas), spans
+
+    def _batch_recognize(
+        self,
+        crops: List[Image.Image],
+        lang: str,
+        config: str
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        ROI들을 한 캔버스로 합쳐 엔진 1회 호출로 인식하고, 단어 위치로 행별 결과 분리
+
+        Args:
+            crops: ROI 이미지 리스트
+            lang: 언어 설정
+            config: Tesseract 설정
+
+        Returns:
+            행별 단어 리스트 (읽기 순서, parse_tsv() 형식 {'text', 'conf', ...}).
+            인식 실패 시 모든 행이 빈 리스트
+        """
+        row_words = [[] for _ in crops]
+        if not crops:
+            return row_words
+
+        canvas, spans = self._stitch_rows(crops)
+
+        try:
+            words = self.backend.image_to_data(canvas, lang=lang, config=config)
+        except Exception as e:
+            print(f"일괄 인식 실패: {e}")
+            return row_words
+
+        for word in words:
+            # 단어 중심이 속한 (또는 가장 가까운) 행에 배정
+            center = word['top'] + word['height'] / 2
+            distances = [
+                0 if top <= center < bottom else min(abs(center - top), abs(center - bottom))
+                for top, bottom in spans
+            ]
+            row_words[distances.index(min(distances))].append(word)
+
+        return [
+            sorted(row, key=lambda w: (w['block'], w['line'], w['left']))
+            for row in row_words
+        ]
+
+    def read_integers_batch(
+        self,
+        image: Image.Image,
+        bboxes: List[Tuple[int, int, int, int]],
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        fallback: bool = True
+    ) -> List[Optional[int]]:
+        """
+        여러 영역의 정수 일괄 읽기 (엔진 1회 호출)
+
+        Args:
+            image: 입력 이미지
+            bboxes: 숫자 영역 좌표 리스트 (x1, y1, x2, y2)
+            min_value: 최소값 (검증용)
+            max_value: 최대값 (검증용)
+            fallback: 일괄 인식에 실패했거나 신뢰도가 BATCH_MIN_CONFIDENCE 미만인 행만
+                      read_integer()(PSM 모드별 투표)로 다시 읽기
+
+        Returns:
+            정수 리스트 (bboxes 순서, 실패 시 None)
+        """
+        crops = [image.crop(bbox) for bbox in bboxes]
+        rows = self._batch_recognize(
+            crops,
+            lang='eng',
+            config='--psm 6 -c tessedit_char_whitelist=0123456789'
+        )
+
+        values = []
+        for crop, words in zip(crops, rows):
+            # 천 단위 구분 기호가 빠지면서 "12 345"처럼 나뉜 단어는 이어 붙임
+            numbers = re.findall(r'\d+', ''.join(word['text'] for word in words))
+            value = int(numbers[0]) if numbers else None
+
+            if value is not None and (
+                (min_value is not None and value < min_value) or
+                (max_value is not None and value > max_value)
+            ):
+                value = None
+
+            # 범위 검증만으로는 오인식을 거를 수 없으므로 (데미지 0~999999 등) 신뢰도도 확인
+            confidence = min((word['conf'] for word in words), default=0.0)
+            if fallback and (value is None or confidence < self.BATCH_MIN_CONFIDENCE):
+                value = self.read_integer(crop, min_value=min_value, max_value=max_value)
+
+            values.append(value)
+        return values
+
+    def read_texts_batch(
+        self,
+        image: Image.Image,
+        bboxes: List[Tuple[int, int, int, int]],
+        lang: str = 'kor+eng',
+        fallback: bool = True
+    ) -> List[str]:
+        """
+        여러 영역의 텍스트 일괄 읽기 (엔진 1회 호출)
+
+        Args:
+            image: 입력 이미지
+            bboxes: 텍스트 영역 좌표 리스트 (x1, y1, x2, y2)
+            lang: 언어 설정
+            fallback: 일괄 인식 결과가 빈 행만 read_text()로 다시 읽기
+
+        Returns:
+            텍스트 리스트 (bboxes 순서)
+        """
+        crops = [image.crop(bbox) for bbox in bboxes]
+        rows = self._batch_recognize(crops, lang=lang, config='--psm 6')
+
+        texts = []
+        for crop, words in zip(crops, rows):
+            text = self._clean_text(' '.join(word['text'] for word in words))
+            if not text and fallback:
+                text = self.read_text(crop, lang=lang)
+            texts.append(text)
+        return texts
+
     # ========================================
     # 고급 기능 (ROI 기반 읽기)
     # ========================================
@@ -419,10 +714,27 @@ class OCRReader:
         Returns:
             {'name': str, 'damage': Optional[int]}
         """
-        name = self.read_student_name(image, name_bbox)
-        damage = self.read_damage_value(image, damage_bbox)
+        return self.batch_extract_student_data(image, [(name_bbox, damage_bbox)])[0]
 
-        return {
-            'name': name,
-            'damage': damage
-        }
+    def batch_extract_student_data(
+        self,
+        image: Image.Image,
+        rows: List[Tuple[Tuple[int, int, int, int], Tuple[int, int, int, int]]]
+    ) -> List[Dict[str, any]]:
+        """
+        여러 학생 데이터 일괄 추출 (이름 1회 + 데미지 1회 엔진 호출)
+
+        Args:
+            image: 전체 화면 이미지
+            rows: [(이름 영역 좌표, 데미지 영역 좌표), ...]
+
+        Returns:
+            [{'name': str, 'damage': Optional[int]}, ...]
+        """
+        names = self.batch_read_student_names(image, [name_bbox for name_bbox, _ in rows])
+        damages = self.batch_read_damages(image, [damage_bbox for _, damage_bbox in rows])
+
+        return [
+            {'name': name, 'damage': damage}
+            for name, damage in zip(names, damages)
+        ]
@@ -0,0 +1,291 @@
+"""OCR 프로세스 풀 모듈
+
+OCR은 CPU를 많이 쓰는 작업이라 테스트 스레드에서 직접 실행하면 그동안 다음 입력을
+진행할 수 없습니다. OCRPool은 워커 프로세스마다 OCRReader를 하나씩 두고
+OCR 작업을 future로 반환하므로, 인식 결과를 기다리는 동안 다음 동작을 진행할 수 있습니다.
+
+    with OCRPool(workers=2) as pool:
+        future = pool.submit('read_damage_value', screenshot.crop(bbox))
+        controller.click(x, y)  # OCR과 동시에 진행
+        damage = future.result()
+
+    # asyncio
+    damage = await pool.run('read_damage_value', crop)
+
+- 이미지(PIL 또는 numpy 배열)는 공유 메모리로 전달 (pickle 복사 없음)
+- 동시에 대기 중인 작업 수 제한 (max_pending, 초과 시 submit이 대기)
+- 작업별 타임아웃 (초과 시 future에 TimeoutError 설정)
+
+Windows/PyInstaller 환경에서는 진입점에서 multiprocessing.freeze_support()를 호출해야 합니다.
+"""
+
+import asyncio
+import logging
+import threading
+import concurrent.futures
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import shared_memory
+from typing import Optional, Tuple, Dict, Any, Union
+
+import numpy as np
+from PIL import Image
+
+from config.settings import OCR_POOL_WORKERS, OCR_POOL_MAX_PENDING, OCR_POOL_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# 풀에서 실행할 수 있는 OCRReader 메서드 (첫 번째 인자가 이미지인 메서드)
+POOL_METHODS = {
+    'read_text',
+    'read_student_name',
+    'batch_read_student_names',
+    'read_integer',
+    'read_integer_votes',
+    'read_cost_value',
+    'read_damage_value',
+    'batch_read_damages',
+    'read_integers_batch',
+    'read_texts_batch',
+    'extract_from_region',
+    'extract_student_data',
+    'batch_extract_student_data',
+}
+
+# 워커 프로세스 전역 OCRReader (initializer에서 생성, 프로세스 수명 동안 모델 유지)
+_worker_reader = None
+
+
+def _init_worker(tesseract_cmd: Optional[str]) -> None:
+    """워커 프로세스 초기화 (OCRReader 1회 생성)"""
+    global _worker_reader
+    from src.ocr.ocr_reader import OCRReader
+    _worker_reader = OCRReader(tesseract_cmd=tesseract_cmd)
+
+
+def _run_job(
+    shm_name: str,
+    shape: Tuple[int, ...],
+    method: str,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any]
+) -> Any:
+    """워커 프로세스에서 공유 메모리의 이미지로 OCRReader 메서드 실행"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        pixels = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+
+    return getattr(_worker_reader, method)(Image.fromarray(pixels), *args, **kwargs)
+
+
+class OCRPool:
+    """OCRReader 멀티 프로세스 실행기 (concurrent.futures / asyncio future 반환)"""
+
+    def __init__(
+        self,
+        workers: int = OCR_POOL_WORKERS,
+        max_pending: int = OCR_POOL_MAX_PENDING,
+        timeout: Optional[float] = OCR_POOL_TIMEOUT,
+        tesseract_cmd: Optional[str] = None
+    ):
+        """
+        Args:
+            workers: 워커 프로세스 수
+            max_pending: 동시에 제출할 수 있는 최대 작업 수 (초과하면 submit이 대기)
+            timeout: 작업별 기본 타임아웃 (초, None이면 무제한)
+            tesseract_cmd: 워커 OCRReader에 전달할 Tesseract 실행 파일 경로
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(tesseract_cmd,)
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._closed = False
+
+        # 통계
+        self.submitted = 0
+        self.completed = 0
+        self.timed_out = 0
+        self.failed = 0
+        self._stats_lock = threading.Lock()
+
+        logger.info(f"OCR 프로세스 풀 시작: 워커 {workers}개, 최대 대기 {max_pending}개")
+
+    @staticmethod
+    def _to_pixels(image: Union[Image.Image, np.ndarray]) -> np.ndarray:
+        """
+        PIL 이미지 또는 numpy 배열을 uint8 연속 배열로 변환
+
+        numpy 배열은 np.array(PIL 이미지)와 같은 채널 순서(RGB)로 간주합니다.
+        """
+        if isinstance(image, Image.Image):
+            if image.mode not in ('L', 'RGB', 'RGBA'):
+                image = image.convert('RGB')
+            return np.ascontiguousarray(np.asarray(image, dtype=np.uint8))
+        return np.ascontiguousarray(image, dtype=np.uint8)
+
+    def submit(
+        self,
+        method: str,
+        image: Union[Image.Image, np.ndarray],
+        *args: Any,
+        timeout: Optional[float] = None,
+        block: bool = True,
+        **kwargs: Any
+    ) -> Future:
+        """
+        OCR 작업 제출
+
+        Args:
+            method: OCRReader 메서드 이름 (POOL_METHODS)
+            image: 입력 이미지 (PIL 또는 RGB/그레이스케일 numpy 배열)
+            *args: 메서드 추가 인자 (이미지 다음 인자)
+            timeout: 작업 타임아웃 (초, None이면 풀 기본값)
+            block: 대기 작업이 max_pending이면 빈 자리가 날 때까지 대기 (False면 즉시 RuntimeError)
+            **kwargs: 메서드 키워드 인자
+
+        Returns:
+            메서드 반환값을 결과로 갖는 Future (타임아웃 시 TimeoutError)
+
+        Raises:
+            ValueError: 지원하지 않는 메서드
+            RuntimeError: 풀이 종료됨 또는 대기 작업이 가득 참 (block=False)
+        """
+        if method not in POOL_METHODS:
+            raise ValueError(f"OCRPool에서 실행할 수 없는 메서드: {method}")
+        if self._closed:
+            raise RuntimeError("종료된 OCRPool입니다")
+        if not self._slots.acquire(blocking=block):
+            raise RuntimeError("OCRPool 대기 작업이 가득 찼습니다")
+
+        try:
+            pixels = self._to_pixels(image)
+            shm = shared_memory.SharedMemory(create=True, size=max(pixels.nbytes, 1))
+        except Exception:
+            self._slots.release()
+            raise
+
+        np.ndarray(pixels.shape, dtype=np.uint8, buffer=shm.buf)[...] = pixels
+
+        try:
+            inner = self._executor.submit(_run_job, shm.name, pixels.shape, method, args, kwargs)
+        except Exception:
+            shm.close()
+            shm.unlink()
+            self._slots.release()
+            raise
+
+        with self._stats_lock:
+            self.submitted += 1
+
+        outer = Future()
+        outer.set_running_or_notify_cancel()
+
+        timeout = self.timeout if timeout is None else timeout
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, self._expire, args=(outer, method, timeout))
+            timer.daemon = True
+            timer.start()
+
+        def on_done(finished: Future) -> None:
+            # 워커가 실제로 끝나야 공유 메모리와 대기 슬롯을 반환 (타임아웃된 작업 포함)
+            if timer is not None:
+                timer.cancel()
+            shm.close()
+            shm.unlink()
+            self._slots.release()
+
+            error = finished.exception() if not finished.cancelled() else concurrent.futures.CancelledError()
+            with self._stats_lock:
+                if error is None:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+            try:
+                if error is None:
+                    outer.set_result(finished.result())
+                else:
+                    outer.set_exception(error)
+            except concurrent.futures.InvalidStateError:
+                pass  # 이미 타임아웃 처리됨
+
+        inner.add_done_callback(on_done)
+        return outer
+
+    def _expire(self, outer: Future, method: str, timeout: float) -> None:
+        """작업 타임아웃 처리 (워커의 작업 자체는 끝날 때까지 계속 실행됨)"""
+        try:
+            outer.set_exception(TimeoutError(f"OCR 작업 타임아웃 ({method}, {timeout}초)"))
+        except concurrent.futures.InvalidStateError:
+            return
+
+        with self._stats_lock:
+            self.timed_out += 1
+        logger.warning(f"OCR 작업 타임아웃: {method} ({timeout}초)")
+
+    def submit_async(
+        self,
+        method: str,
+        image: Union[Image.Image, np.ndarray],
+        *args: Any,
+        **kwargs: Any
+    ) -> asyncio.Future:
+        """
+        OCR 작업 제출 (asyncio future 반환, 실행 중인 이벤트 루프에서 호출)
+
+        대기 작업이 가득 차 있으면 이벤트 루프를 막지 않도록 즉시 RuntimeError를 발생시킵니다.
+        """
+        kwargs.setdefault('block', False)
+        return asyncio.wrap_future(self.submit(method, image, *args, **kwargs))
+
+    async def run(
+        self,
+        method: str,
+        image: Union[Image.Image, np.ndarray],
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        """
+        OCR 작업 실행 후 결과 반환 (asyncio)
+
+        대기 작업이 가득 차 있으면 이벤트 루프를 막지 않고 기본 스레드 풀에서 빈 자리를 기다립니다.
+        """
+        loop = asyncio.get_running_loop()
+        future = await loop.run_in_executor(
+            None, lambda: self.submit(method, image, *args, **kwargs)
+        )
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, int]:
+        """작업 통계"""
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "timed_out": self.timed_out,
+                "failed": self.failed,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        풀 종료
+
+        Args:
+            wait: 실행 중인 작업이 끝날 때까지 대기
+        """
+        self._closed = True
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        logger.info(f"OCR 프로세스 풀 종료: {self.stats()}")
+
+    def __enter__(self) -> "OCRPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
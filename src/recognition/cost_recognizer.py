@@ -8,6 +8,8 @@ from typing import Optional, Dict, Tuple
 from PIL import Image
 
 from config.settings import UI_DIR
+from src.recognition.result_cache import ResultCache, get_result_cache
+from src.recognition.template_cache import get_template_cache
 
 logger = logging.getLogger(__name__)
 
@@ -20,32 +22,51 @@ class CostRecognizer:
     OCR보다 템플릿 분류 방식이 더 안정적이고 정확함.
 
     특징:
-    - 코스트 값: 2~5 (고정 범위)
+    - 코스트 값: 2~5 (cost_2.png ~ cost_5.png 템플릿, 그 밖의 값은 분류할 수 없음)
     - 흰색 숫자 + 짙은 남색 원형 배경 + 흰색 외곽선
-    - 템플릿 매칭으로 가장 유사한 숫자 분류
+    - 모든 숫자 템플릿을 한 번의 벡터 연산(정규화 상관계수)으로 비교해서 가장 유사한 숫자 분류
     """
 
-    def __init__(self, template_dir: Optional[Path] = None):
+    # 인식 가능한 코스트 범위 (템플릿이 있는 값)
+    MIN_COST = 2
+    MAX_COST = 5
+
+    # 현재 코스트 게이지(0~10) 판독 기준: 템플릿이 없는 값(0, 1, 6~10)을 가장 비슷한
+    # 2~5로 억지로 분류하지 않도록 더 높은 신뢰도와 1, 2위 점수 차이를 요구
+    # (템플릿끼리의 상관계수는 최대 약 0.41이므로 실제 2~5는 차이 0.5 이상)
+    GAUGE_CONFIDENCE_THRESHOLD = 0.7
+    GAUGE_MIN_MARGIN = 0.25
+
+    def __init__(
+        self,
+        template_dir: Optional[Path] = None,
+        result_cache: Optional[ResultCache] = None
+    ):
         """
         Args:
             template_dir: 코스트 템플릿 디렉토리 (None이면 기본 경로 사용)
+            result_cache: 인식 결과 캐시 (None이면 프로세스 전역 캐시)
         """
         self.template_dir = template_dir or UI_DIR
         self.templates = self._load_templates()
+        self.result_cache = result_cache or get_result_cache()
+
+        # ROI 크기별로 미리 리사이즈한 템플릿 스택 캐시: {(h, w): (코스트 값 배열, (K, H*W) 행렬)}
+        self._stacks: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
 
         if not self.templates:
             logger.warning("코스트 템플릿을 로드하지 못했습니다. 템플릿 파일을 확인하세요.")
 
     def _load_templates(self) -> Dict[int, np.ndarray]:
         """
-        코스트 숫자 템플릿 로드 (2~5)
+        코스트 숫자 템플릿 로드 (MIN_COST ~ MAX_COST)
 
         Returns:
             {숫자: 전처리된 템플릿 이미지} 딕셔너리
         """
         templates = {}
 
-        for cost_value in range(2, 6):  # 2, 3, 4, 5
+        for cost_value in range(self.MIN_COST, self.MAX_COST + 1):
             template_path = self.template_dir / f"cost_{cost_value}.png"
 
             if not template_path.exists():
@@ -53,9 +74,10 @@ class CostRecognizer:
                 continue
 
             try:
-                # PIL로 로드 후 OpenCV 형식으로 변환
-                pil_img = Image.open(template_path)
-                img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+                # BGR 배열 (템플릿 번들에 있으면 디코딩 없이 사용)
+                img = get_template_cache().get(template_path, grayscale=False)
+                if img is None:
+                    continue
 
                 # 전처리 (흰색 숫자 추출)
                 processed = self._preprocess_cost_image(img)
@@ -99,10 +121,86 @@ class CostRecognizer:
 
         return mask
 
+    def _template_stack(self, roi_shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ROI 크기에 맞게 리사이즈 + 정규화된 템플릿 스택 (ROI 크기별 1회만 계산)
+
+        각 템플릿을 평균 0, 노름 1로 정규화해 두면 ROI와의 TM_CCOEFF_NORMED 값은
+        (정규화된 ROI 벡터)와의 내적 한 번으로 계산됩니다.
+
+        Args:
+            roi_shape: ROI 크기 (height, width)
+
+        Returns:
+            (코스트 값 배열 (K,), 정규화된 템플릿 행렬 (K, H*W))
+        """
+        stack = self._stacks.get(roi_shape)
+        if stack is not None:
+            return stack
+
+        height, width = roi_shape
+        values = np.array(sorted(self.templates), dtype=np.int32)
+        resized = np.stack([
+            cv2.resize(self.templates[value], (width, height), interpolation=cv2.INTER_AREA)
+            if self.templates[value].shape[:2] != roi_shape else self.templates[value]
+            for value in values
+        ]).astype(np.float32)  # (K, H, W)
+
+        matrix = resized.reshape(len(values), -1)
+        matrix -= matrix.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms > 0, norms, 1.0)  # 단색 템플릿은 모든 ROI와 점수 0
+
+        stack = (values, matrix)
+        self._stacks[roi_shape] = stack
+        return stack
+
+    def _to_bgr(self, roi_image: np.ndarray) -> np.ndarray:
+        """RGB(PIL 변환 배열) ROI를 BGR로 변환"""
+        if len(roi_image.shape) == 3 and roi_image.shape[2] == 3:
+            # PIL 이미지는 RGB, OpenCV는 BGR
+            try:
+                return cv2.cvtColor(roi_image, cv2.COLOR_RGB2BGR)
+            except cv2.error:
+                return roi_image
+        return roi_image
+
+    def score_costs(self, roi_image: np.ndarray) -> Dict[int, float]:
+        """
+        ROI와 모든 코스트 템플릿의 유사도 계산 (단일 벡터 연산)
+
+        Args:
+            roi_image: 코스트 영역 이미지 (RGB)
+
+        Returns:
+            {코스트 값: 정규화 상관계수 (-1.0 ~ 1.0)} (템플릿이 없거나 전처리 실패 시 빈 딕셔너리)
+        """
+        if not self.templates:
+            return {}
+
+        try:
+            processed_roi = self._preprocess_cost_image(self._to_bgr(roi_image))
+        except Exception as e:
+            logger.error(f"ROI 전처리 실패: {e}")
+            return {}
+
+        values, matrix = self._template_stack(processed_roi.shape[:2])
+
+        roi_vector = processed_roi.astype(np.float32).ravel()
+        roi_vector -= roi_vector.mean()
+        roi_norm = np.linalg.norm(roi_vector)
+        if roi_norm == 0:
+            # 숫자가 전혀 없는 ROI (전처리 결과 단색)
+            return {int(value): 0.0 for value in values}
+
+        scores = matrix @ (roi_vector / roi_norm)  # (K,)
+        return {int(value): float(score) for value, score in zip(values, scores)}
+
     def recognize_cost(
         self,
         roi_image: np.ndarray,
-        confidence_threshold: float = 0.6
+        confidence_threshold: float = 0.6,
+        min_margin: float = 0.0
     ) -> Tuple[Optional[int], float]:
         """
         ROI 이미지에서 코스트 값 인식
@@ -110,6 +208,8 @@ class CostRecognizer:
         Args:
             roi_image: 코스트 영역 이미지 (BGR or RGB)
             confidence_threshold: 최소 신뢰도 (0.0 ~ 1.0)
+            min_margin: 가장 유사한 값과 두 번째 값의 최소 점수 차이
+                (템플릿이 없는 값을 거부할 때 사용, 0.0이면 검사하지 않음)
 
         Returns:
             (인식된 코스트 값, 신뢰도)
@@ -119,60 +219,27 @@ class CostRecognizer:
             logger.error("로드된 템플릿이 없습니다")
             return None, 0.0
 
-        # RGB -> BGR 변환 (필요시)
-        if len(roi_image.shape) == 3 and roi_image.shape[2] == 3:
-            # PIL 이미지는 RGB, OpenCV는 BGR
-            if isinstance(roi_image, np.ndarray):
-                # 이미 OpenCV BGR이면 그대로, PIL RGB면 변환
-                try:
-                    roi_bgr = cv2.cvtColor(roi_image, cv2.COLOR_RGB2BGR)
-                except:
-                    roi_bgr = roi_image
-            else:
-                roi_bgr = roi_image
-        else:
-            roi_bgr = roi_image
-
-        # 전처리
-        try:
-            processed_roi = self._preprocess_cost_image(roi_bgr)
-        except Exception as e:
-            logger.error(f"ROI 전처리 실패: {e}")
-            return None, 0.0
+        # 같은 ROI 픽셀이면 캐시된 결과 반환 (대기 루프에서 같은 게이지를 반복해서 읽는 경우)
+        return self.result_cache.get_or_compute(
+            "recognize_cost",
+            roi_image,
+            (str(self.template_dir), confidence_threshold, min_margin),
+            lambda: self._recognize_cost(roi_image, confidence_threshold, min_margin)
+        )
 
-        # 각 템플릿과 매칭
-        best_match = None
-        best_score = 0.0
-        match_results = {}
+    def _recognize_cost(
+        self,
+        roi_image: np.ndarray,
+        confidence_threshold: float,
+        min_margin: float
+    ) -> Tuple[Optional[int], float]:
+        """recognize_cost() 실제 인식 (캐시 미사용)"""
+        match_results = self.score_costs(roi_image)
+        if not match_results:
+            return None, 0.0
 
-        for cost_value, template in self.templates.items():
-            try:
-                # 템플릿 크기 조정 (ROI와 크기가 다를 경우)
-                if processed_roi.shape[:2] != template.shape[:2]:
-                    template_resized = cv2.resize(
-                        template,
-                        (processed_roi.shape[1], processed_roi.shape[0]),
-                        interpolation=cv2.INTER_AREA
-                    )
-                else:
-                    template_resized = template
-
-                # 템플릿 매칭 (정규화된 상관계수)
-                result = cv2.matchTemplate(
-                    processed_roi,
-                    template_resized,
-                    cv2.TM_CCOEFF_NORMED
-                )
-
-                score = result.max()
-                match_results[cost_value] = score
-
-                if score > best_score:
-                    best_score = score
-                    best_match = cost_value
-
-            except Exception as e:
-                logger.warning(f"템플릿 매칭 실패 (cost_{cost_value}): {e}")
+        best_match = max(match_results, key=match_results.get)
+        best_score = max(match_results[best_match], 0.0)
 
         # 결과 로깅
         logger.debug(f"매칭 결과: {match_results}")
@@ -184,6 +251,15 @@ class CostRecognizer:
             )
             return None, best_score
 
+        # 점수 차이 체크 (어느 템플릿과도 뚜렷하게 일치하지 않으면 템플릿이 없는 값)
+        runner_up = max((score for value, score in match_results.items() if value != best_match), default=0.0)
+        if best_score - runner_up < min_margin:
+            logger.warning(
+                f"코스트 인식 모호: {best_match} ({best_score:.2f}), "
+                f"2위와 차이 {best_score - runner_up:.2f} < {min_margin:.2f}"
+            )
+            return None, best_score
+
         logger.info(f"코스트 인식 성공: {best_match} (신뢰도: {best_score:.2f})")
         return best_match, best_score
 
@@ -191,7 +267,8 @@ class CostRecognizer:
         self,
         screenshot: Image.Image,
         region: Tuple[int, int, int, int],
-        confidence_threshold: float = 0.6
+        confidence_threshold: float = 0.6,
+        min_margin: float = 0.0
     ) -> Tuple[Optional[int], float]:
         """
         스크린샷에서 특정 영역의 코스트 인식
@@ -200,6 +277,7 @@ class CostRecognizer:
             screenshot: PIL Image 스크린샷
             region: (left, top, right, bottom) 영역
             confidence_threshold: 최소 신뢰도
+            min_margin: 1, 2위 최소 점수 차이 (recognize_cost 참고)
 
         Returns:
             (인식된 코스트 값, 신뢰도)
@@ -211,4 +289,4 @@ class CostRecognizer:
         roi_array = np.array(roi)
 
         # 인식
-        return self.recognize_cost(roi_array, confidence_threshold)
+        return self.recognize_cost(roi_array, confidence_threshold, min_margin)
@@ -0,0 +1,266 @@
+"""글리프 템플릿 기반 숫자 인식 모듈 (Tesseract 없이 빠른 경로)
+
+데미지/코스트 숫자는 고정된 게임 폰트(흰색 숫자)라서 숫자 모양이 항상 같습니다.
+ROI를 흰색 마스크로 이진화 → 연결 요소로 글리프 분리 → 글리프 세트와 정규화 상관계수 비교
+순서로 여러 자리 숫자를 읽습니다. 데미지 숫자 한 개(100x50 ROI)에 0.1ms 내외가 걸립니다.
+
+글리프 세트는 assets/glyphs/<폰트>/<숫자>_<번호>.png (정규화된 이진 글리프)이며
+tools/build_glyph_set.py로 캡처 화면에서 생성합니다.
+0~9 중 하나라도 글리프가 없으면 그 숫자를 다른 숫자로 잘못 읽을 수 있으므로
+(예: 8 → 0) 세트가 완전할 때만 사용 가능(available)으로 판단하고, 그 전에는 Tesseract를 사용합니다.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional, List, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from config.settings import GLYPHS_DIR, DIGIT_MIN_SCORE
+
+logger = logging.getLogger(__name__)
+
+
+class DigitRecognizer:
+    """
+    글리프 템플릿 기반 숫자 인식 클래스
+
+    - 흰색 숫자만 추출 (HSV: S 낮음, V 높음 → 채널 순서(RGB/BGR)와 무관)
+    - ROI 테두리에 닿는 요소(말풍선 외곽, 원형 테두리 등)와 작은 요소(쉼표, 노이즈)는 제외
+      (테두리에 닿았지만 글리프 크기인 요소는 잘린 숫자이므로 인식하지 않음)
+    - 각 글리프를 높이 기준으로 GLYPH_SIZE에 맞춰 정규화한 뒤 글리프 세트 전체와 한 번의 행렬 곱으로 비교
+    """
+
+    # 정규화 글리프 크기 (width, height)
+    GLYPH_SIZE = (20, 28)
+
+    # 흰색 숫자 마스크 (HSV, CostRecognizer와 같은 기준)
+    LOWER_WHITE = np.array([0, 0, 200])
+    UPPER_WHITE = np.array([180, 40, 255])
+
+    # 가장 큰 글리프 대비 최소 높이 비율 (쉼표/마침표 제외)
+    MIN_HEIGHT_RATIO = 0.5
+    MIN_GLYPH_HEIGHT = 6  # px
+
+    def __init__(self, font: str = "damage", glyph_dir: Optional[Path] = None):
+        """
+        Args:
+            font: 글리프 세트 이름 ("damage", "cost" 등)
+            glyph_dir: 글리프 세트 상위 디렉토리 (None이면 기본 경로 사용)
+        """
+        self.font = font
+        self.glyph_dir = Path(glyph_dir or GLYPHS_DIR) / font
+        self.labels, self.matrix = self._load_glyphs()
+
+        if not self.loaded:
+            # 글리프 세트는 tools/build_glyph_set.py로 만들 때까지 없을 수 있음 (Tesseract 사용)
+            logger.info(f"글리프 세트 없음, Tesseract로 읽습니다: {self.glyph_dir}")
+        elif self.missing_digits:
+            logger.warning(f"글리프 세트에 없는 숫자가 있어 사용하지 않습니다: {self.font} "
+                           f"(없는 숫자: {self.missing_digits})")
+
+    @property
+    def loaded(self) -> bool:
+        """글리프 세트 로드 여부 (일부 숫자만 있어도 True)"""
+        return len(self.labels) > 0
+
+    @property
+    def missing_digits(self) -> List[int]:
+        """글리프 세트에 없는 숫자 목록"""
+        return sorted(set(range(10)) - set(self.labels.tolist()))
+
+    @property
+    def available(self) -> bool:
+        """인식에 사용 가능 여부 (0~9 모든 숫자의 글리프가 있어야 함)"""
+        return self.loaded and not self.missing_digits
+
+    def _load_glyphs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        글리프 세트 로드
+
+        Returns:
+            (숫자 라벨 배열 (N,), 정규화된 글리프 행렬 (N, H*W))
+        """
+        labels = []
+        glyphs = []
+
+        if self.glyph_dir.is_dir():
+            for path in sorted(self.glyph_dir.glob("*.png")):
+                label = path.stem.split("_")[0]
+                if not label.isdigit() or len(label) != 1:
+                    logger.debug(f"글리프 파일 이름 형식 아님 (숫자_번호.png): {path.name}")
+                    continue
+
+                glyph = np.array(Image.open(path).convert("L"))
+                if glyph.shape[::-1] != self.GLYPH_SIZE:
+                    glyph = cv2.resize(glyph, self.GLYPH_SIZE, interpolation=cv2.INTER_AREA)
+
+                labels.append(int(label))
+                glyphs.append(glyph)
+
+        if not glyphs:
+            return np.zeros(0, dtype=np.int32), np.zeros((0, self.GLYPH_SIZE[0] * self.GLYPH_SIZE[1]), np.float32)
+
+        logger.info(f"글리프 세트 로드: {self.font} ({len(glyphs)}개, 숫자 {sorted(set(labels))})")
+        return np.array(labels, dtype=np.int32), self._normalize_vectors(np.stack(glyphs))
+
+    @staticmethod
+    def _normalize_vectors(glyphs: np.ndarray) -> np.ndarray:
+        """글리프 (N, H, W) → 평균 0, 노름 1 벡터 (N, H*W)"""
+        vectors = glyphs.reshape(len(glyphs), -1).astype(np.float32)
+        vectors -= vectors.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms > 0, norms, 1.0)
+        return vectors
+
+    # ========================================
+    # 글리프 분리
+    # ========================================
+
+    def binarize(self, roi: Union[np.ndarray, Image.Image]) -> np.ndarray:
+        """
+        흰색 숫자 마스크 생성
+
+        Args:
+            roi: 숫자 영역 (RGB/BGR 배열, 그레이스케일 배열 또는 PIL 이미지)
+
+        Returns:
+            이진 마스크 (255: 숫자)
+        """
+        if isinstance(roi, Image.Image):
+            roi = np.array(roi.convert("RGB"))
+
+        if roi.ndim == 2:
+            return cv2.inRange(roi, int(self.LOWER_WHITE[2]), 255)
+
+        # S/V는 채널 순서와 무관하므로 RGB 입력도 그대로 사용
+        hsv = cv2.cvtColor(roi[..., :3], cv2.COLOR_BGR2HSV)
+        return cv2.inRange(hsv, self.LOWER_WHITE, self.UPPER_WHITE)
+
+    def segment(self, mask: np.ndarray) -> Optional[List[Tuple[int, int, int, int]]]:
+        """
+        이진 마스크에서 글리프 영역 분리 (왼쪽부터)
+
+        Args:
+            mask: binarize() 결과
+
+        Returns:
+            [(x, y, w, h), ...] 글리프 경계 상자.
+            ROI 테두리에 걸려 잘린 숫자가 있으면 None (빼고 읽으면 "12345" → "2345"처럼
+            범위 안의 틀린 값이 되므로 인식하지 않음)
+        """
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+        height, width = mask.shape
+
+        boxes = []
+        for index in range(1, count):
+            x, y, w, h, _ = stats[index]
+            if x == 0 or y == 0 or x + w == width or y + h == height:
+                # 글리프 크기(ROI 전체 높이 미만, 너비 절반 미만)면 ROI에 잘린 숫자
+                if self.MIN_GLYPH_HEIGHT <= h < height and w < width / 2:
+                    logger.debug(f"ROI 테두리에 잘린 글리프: {(int(x), int(y), int(w), int(h))}")
+                    return None
+                # 그 밖의 테두리 요소는 숫자가 아님 (말풍선/원형 테두리, 잘린 배경)
+                continue
+            if h < self.MIN_GLYPH_HEIGHT:
+                continue
+            boxes.append((int(x), int(y), int(w), int(h)))
+
+        if not boxes:
+            return []
+
+        tallest = max(h for _, _, _, h in boxes)
+        boxes = [box for box in boxes if box[3] >= tallest * self.MIN_HEIGHT_RATIO]
+        return sorted(boxes, key=lambda box: box[0])
+
+    def normalize_glyph(self, mask: np.ndarray, box: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        글리프를 GLYPH_SIZE로 정규화 (높이 맞춤, 가로 비율 유지 후 가운데 정렬)
+
+        Args:
+            mask: 이진 마스크
+            box: (x, y, w, h) 글리프 경계 상자
+
+        Returns:
+            uint8 글리프 (height, width)
+        """
+        x, y, w, h = box
+        glyph_width, glyph_height = self.GLYPH_SIZE
+
+        scale = glyph_height / h
+        scaled_width = min(glyph_width, max(1, round(w * scale)))
+        resized = cv2.resize(
+            mask[y:y + h, x:x + w], (scaled_width, glyph_height), interpolation=cv2.INTER_AREA
+        )
+
+        glyph = np.zeros((glyph_height, glyph_width), dtype=np.uint8)
+        left = (glyph_width - scaled_width) // 2
+        glyph[:, left:left + scaled_width] = resized
+        return glyph
+
+    # ========================================
+    # 인식
+    # ========================================
+
+    def read_digits(self, roi: Union[np.ndarray, Image.Image]) -> Tuple[str, List[float]]:
+        """
+        ROI의 숫자 문자열 인식
+
+        Args:
+            roi: 숫자 영역
+
+        Returns:
+            (숫자 문자열, 글리프별 유사도 리스트). 글리프가 없거나 잘린 숫자가 있으면 ("", [])
+        """
+        if not self.loaded:
+            return "", []
+
+        mask = self.binarize(roi)
+        boxes = self.segment(mask)
+        if not boxes:
+            return "", []
+
+        glyphs = np.stack([self.normalize_glyph(mask, box) for box in boxes])
+        scores = self._normalize_vectors(glyphs) @ self.matrix.T  # (글리프 수, 세트 크기)
+
+        best = scores.argmax(axis=1)
+        digits = "".join(str(self.labels[index]) for index in best)
+        return digits, [float(scores[row, index]) for row, index in enumerate(best)]
+
+    def read(
+        self,
+        roi: Union[np.ndarray, Image.Image],
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        min_score: float = DIGIT_MIN_SCORE
+    ) -> Tuple[Optional[int], float]:
+        """
+        ROI의 정수 값 인식
+
+        Args:
+            roi: 숫자 영역 (RGB/BGR 배열 또는 PIL 이미지)
+            min_value: 최소값 (검증용)
+            max_value: 최대값 (검증용)
+            min_score: 모든 글리프가 넘어야 하는 최소 유사도
+
+        Returns:
+            (인식된 값, 신뢰도 = 가장 낮은 글리프 유사도)
+            글리프가 없거나, 신뢰도 부족, 범위 밖이면 (None, 신뢰도)
+        """
+        digits, scores = self.read_digits(roi)
+        if not digits:
+            return None, 0.0
+
+        confidence = min(scores)
+        if confidence < min_score:
+            logger.debug(f"숫자 인식 신뢰도 부족: {digits} ({confidence:.2f} < {min_score:.2f})")
+            return None, confidence
+
+        value = int(digits)
+        if (min_value is not None and value < min_value) or (max_value is not None and value > max_value):
+            logger.debug(f"숫자 인식 범위 밖: {value}")
+            return None, confidence
+
+        return value, confidence
@@ -0,0 +1,86 @@
+"""프레임 시그니처 모듈
+
+화면 변화 여부만 빠르게 판단하기 위한 축소 프레임 시그니처.
+전체 프레임을 작은 크기(기본 64x36)의 그레이스케일로 축소(영역 평균)해서 비교하므로
+캐릭터 대기 모션 같은 작은 움직임은 무시되고, 화면 전환/팝업 같은 큰 변화만 감지됩니다.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from config.settings import STABLE_SIGNATURE_SIZE
+
+# OpenCV 사용 가능 여부 확인 (없으면 numpy 블록 평균 사용)
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+
+def frame_signature(
+    frame: np.ndarray,
+    size: Tuple[int, int] = STABLE_SIGNATURE_SIZE
+) -> np.ndarray:
+    """
+    프레임의 축소 시그니처 계산
+
+    Args:
+        frame: BGR(H, W, 3) 또는 그레이스케일(H, W) 프레임
+        size: 시그니처 크기 (width, height)
+
+    Returns:
+        float32 배열 (height, width), 값 범위 0.0 ~ 1.0
+    """
+    if frame.ndim == 3:
+        if OPENCV_AVAILABLE:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        else:
+            frame = frame[..., 0] * 0.114 + frame[..., 1] * 0.587 + frame[..., 2] * 0.299
+
+    width = min(size[0], frame.shape[1])
+    height = min(size[1], frame.shape[0])
+
+    if OPENCV_AVAILABLE:
+        small = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+    else:
+        # 블록 평균 (나누어 떨어지지 않는 가장자리는 버림)
+        block_h = frame.shape[0] // height
+        block_w = frame.shape[1] // width
+        cropped = frame[:block_h * height, :block_w * width].astype(np.float32)
+        small = cropped.reshape(height, block_h, width, block_w).mean(axis=(1, 3))
+
+    return small.astype(np.float32) / 255.0
+
+
+def signature_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    두 시그니처의 차이 (평균 절대 차이)
+
+    Args:
+        a: frame_signature 결과
+        b: frame_signature 결과
+
+    Returns:
+        0.0 (동일) ~ 1.0. 크기가 다르면 1.0
+    """
+    if a.shape != b.shape:
+        return 1.0
+    return float(np.mean(np.abs(a - b)))
+
+
+def signature_max_difference(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    두 시그니처에서 가장 많이 바뀐 블록의 차이 (작은 영역의 변화도 감지)
+
+    Args:
+        a: frame_signature 결과
+        b: frame_signature 결과
+
+    Returns:
+        0.0 (동일) ~ 1.0. 크기가 다르면 1.0
+    """
+    if a.shape != b.shape:
+        return 1.0
+    return float(np.max(np.abs(a - b))) if a.size else 0.0
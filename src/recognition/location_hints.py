@@ -0,0 +1,183 @@
+"""템플릿 위치 힌트 모듈
+
+버튼/UI처럼 같은 해상도에서 위치가 변하지 않는 템플릿은 마지막으로 발견된
+위치 주변만 먼저 검색하면 전체 화면 매칭을 생략할 수 있습니다.
+
+- 힌트 키: (템플릿 경로, 화면 해상도)
+- 선택적으로 JSON 파일에 저장/복원 (실행 간 유지)
+- 빠른 경로 적중/실패 횟수 통계 제공
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any
+
+from config.settings import (
+    TEMPLATES_DIR,
+    TEMPLATE_HINTS_PERSIST,
+    TEMPLATE_HINTS_FILE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _template_key(template_path: Path | str) -> str:
+    """템플릿 경로를 힌트 키로 변환 (가능하면 TEMPLATES_DIR 기준 상대 경로)"""
+    template_path = Path(template_path).resolve()
+    try:
+        return template_path.relative_to(TEMPLATES_DIR.resolve()).as_posix()
+    except ValueError:
+        return template_path.as_posix()
+
+
+class LocationHintStore:
+    """템플릿별 마지막 발견 위치 저장소 (스레드 안전)"""
+
+    def __init__(self, persist_path: Optional[Path | str] = None):
+        """
+        Args:
+            persist_path: 힌트 저장 파일 경로 (None이면 메모리에만 보관)
+        """
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._hints: Dict[str, Tuple[int, int, int, int]] = {}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0  # 힌트 창에서 발견 (빠른 경로 성공)
+        self.misses = 0  # 힌트 창에서 실패 → 전체 검색
+        self.no_hint = 0  # 힌트 없음 → 전체 검색
+
+        if self.persist_path:
+            self.load()
+
+    def get(
+        self,
+        template_path: Path | str,
+        screen_resolution: str
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        템플릿의 마지막 발견 위치 반환
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            screen_resolution: 화면 해상도 (예: "2560x1440")
+
+        Returns:
+            (left, top, width, height) 또는 None
+        """
+        key = f"{screen_resolution}|{_template_key(template_path)}"
+        with self._lock:
+            return self._hints.get(key)
+
+    def update(
+        self,
+        template_path: Path | str,
+        screen_resolution: str,
+        location: Tuple[int, int, int, int]
+    ) -> None:
+        """
+        템플릿 발견 위치 기록 (위치가 바뀐 경우에만 저장)
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            screen_resolution: 화면 해상도
+            location: 발견 위치 (left, top, width, height)
+        """
+        key = f"{screen_resolution}|{_template_key(template_path)}"
+        location = tuple(int(v) for v in location)
+
+        with self._lock:
+            if self._hints.get(key) == location:
+                return
+            self._hints[key] = location
+
+        if self.persist_path:
+            self.save()
+
+    def record_hit(self) -> None:
+        """힌트 창 검색 성공 기록"""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """힌트 창 검색 실패 기록"""
+        with self._lock:
+            self.misses += 1
+
+    def record_no_hint(self) -> None:
+        """힌트 없음 기록"""
+        with self._lock:
+            self.no_hint += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        힌트 통계 반환
+
+        Returns:
+            {"hints", "hits", "misses", "no_hint", "hit_rate"}
+            hit_rate: 힌트가 있었던 검색 중 빠른 경로 성공 비율
+        """
+        with self._lock:
+            attempts = self.hits + self.misses
+            return {
+                "hints": len(self._hints),
+                "hits": self.hits,
+                "misses": self.misses,
+                "no_hint": self.no_hint,
+                "hit_rate": self.hits / attempts if attempts else 0.0,
+            }
+
+    def clear(self) -> None:
+        """힌트 및 통계 초기화"""
+        with self._lock:
+            self._hints.clear()
+            self.hits = 0
+            self.misses = 0
+            self.no_hint = 0
+
+    def load(self) -> None:
+        """저장 파일에서 힌트 복원"""
+        if not self.persist_path or not self.persist_path.exists():
+            return
+
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                self._hints = {key: tuple(value) for key, value in data.items()}
+            logger.info(f"템플릿 위치 힌트 로드: {len(data)}개 ({self.persist_path})")
+        except Exception as e:
+            logger.warning(f"템플릿 위치 힌트 로드 실패: {e}")
+
+    def save(self) -> None:
+        """힌트를 저장 파일에 기록"""
+        if not self.persist_path:
+            return
+
+        try:
+            with self._lock:
+                data = {key: list(value) for key, value in self._hints.items()}
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.persist_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"템플릿 위치 힌트 저장 실패: {e}")
+
+
+# 프로세스 전역 힌트 저장소
+_shared_store: Optional[LocationHintStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_location_hints() -> LocationHintStore:
+    """프로세스 전역 위치 힌트 저장소 반환 (설정에 따라 디스크 저장)"""
+    global _shared_store
+    if _shared_store is None:
+        with _shared_store_lock:
+            if _shared_store is None:
+                _shared_store = LocationHintStore(
+                    TEMPLATE_HINTS_FILE if TEMPLATE_HINTS_PERSIST else None
+                )
+    return _shared_store
@@ -0,0 +1,288 @@
+"""캐릭터 마커 추적 모듈
+
+마스크 기반 매칭(TM_CCORR_NORMED + 마스크)을 전체 화면에 수행하면 가장 느린 매칭이 됩니다.
+MarkerTracker는 처음 한 번만 전체 화면에서 마커를 찾고 (피라미드 매칭),
+이후 프레임에서는 마지막 이동량으로 예측한 위치 주변의 작은 창만 캡처/매칭합니다.
+창 안의 신뢰도가 임계값 또는 전체 검색 때의 신뢰도보다 크게 떨어지면
+(급격한 이동, 화면 전환 등) 전체 화면 검색으로 되돌아갑니다.
+"""
+
+import time
+import logging
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any
+
+import numpy as np
+
+from src.recognition.template_matcher import TemplateMatcher
+from config.settings import (
+    ICONS_DIR,
+    TEMPLATE_PYRAMID_SCALE,
+    MARKER_TRACK_MARGIN,
+    MARKER_TRACK_SCORE_DROP,
+    MARKER_TRACK_INTERVAL,
+    MARKER_MOVE_MIN_DISTANCE,
+    MARKER_MOVE_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _center(location: Tuple[int, int, int, int]) -> Tuple[int, int]:
+    """위치 (left, top, width, height)의 중심점"""
+    return location[0] + location[2] // 2, location[1] + location[3] // 2
+
+
+class MarkerTracker:
+    """캐릭터 마커 추적 (전체 검색 1회 + 프레임 간 국소 검색)"""
+
+    def __init__(
+        self,
+        matcher: Optional[TemplateMatcher] = None,
+        template_path: Path | str = ICONS_DIR / "character_marker.png",
+        mask_path: Optional[Path | str] = None,
+        threshold: Optional[float] = None,
+        margin: int = MARKER_TRACK_MARGIN,
+        pyramid_scale: Optional[float] = TEMPLATE_PYRAMID_SCALE
+    ):
+        """
+        Args:
+            matcher: 템플릿 매칭 객체 (캡처 백엔드/템플릿 캐시 공유, None이면 기본값 생성)
+            template_path: 마커 템플릿 경로
+            mask_path: 마스크 이미지 경로 (None이면 템플릿의 알파 채널 사용)
+            threshold: 매칭 임계값. None이면 matcher.confidence 사용
+            margin: 예측 위치 주변 검색 여백 (픽셀)
+            pyramid_scale: 전체 화면 검색의 피라미드 배율 (None이면 원본 해상도 매칭)
+        """
+        self.matcher = matcher or TemplateMatcher()
+        self.template_path = Path(template_path)
+        self.mask_path = Path(mask_path) if mask_path is not None else None
+        self.threshold = self.matcher.confidence if threshold is None else threshold
+        self.margin = margin
+        self.pyramid_scale = pyramid_scale
+
+        self.location: Optional[Tuple[int, int, int, int]] = None  # 마지막 마커 위치
+        self.score = 0.0
+        self.velocity = (0, 0)  # 마지막 프레임 간 이동량 (dx, dy)
+        self.reference_score = 0.0  # 마지막 전체 화면 검색의 신뢰도
+
+        self._available: Optional[bool] = None
+
+        # 통계
+        self.global_searches = 0
+        self.local_searches = 0
+        self.fallbacks = 0
+
+    def _load(self) -> bool:
+        """마스크 매칭 사용 가능 여부 (템플릿/마스크 전처리는 템플릿 캐시가 담당)"""
+        if self._available is None:
+            self._available = self.matcher._check_masked_paths(self.template_path, self.mask_path)
+        return self._available
+
+    def _grab(
+        self,
+        frame: Optional[np.ndarray],
+        region: Optional[Tuple[int, int, int, int]]
+    ) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        검색 영역 프레임 (frame이 없으면 해당 영역만 캡처)
+
+        Returns:
+            (BGR 프레임, 프레임 좌상단의 화면 절대 좌표)
+        """
+        if frame is None:
+            image = self.matcher.capture.grab(region, grayscale=False)
+            return image, ((region[0], region[1]) if region else (0, 0))
+
+        if region is None:
+            return frame, (0, 0)
+
+        x, y, width, height = region
+        return frame[y:y + height, x:x + width], (x, y)
+
+    def _match(
+        self,
+        frame: Optional[np.ndarray],
+        region: Optional[Tuple[int, int, int, int]],
+        threshold: float,
+        pyramid_scale: float = 0
+    ) -> Optional[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        영역 안에서 마스크 매칭 (캐시된 스케일링/이진화 마스크 사용)
+
+        Args:
+            threshold: 매칭 임계값
+            pyramid_scale: 피라미드 배율 (0이면 원본 해상도 매칭)
+
+        Returns:
+            ((left, top, width, height), 신뢰도) 또는 None (임계값 미만 / 영역이 템플릿보다 작음)
+        """
+        image, origin = self._grab(frame, region)
+        return self.matcher.find_template_with_mask_in_frame(
+            image, self.template_path, self.mask_path, threshold,
+            pyramid_scale=pyramid_scale, origin=origin
+        )
+
+    def _predicted_window(self) -> Tuple[int, int, int, int]:
+        """마지막 위치 + 이동량으로 예측한 검색 창 (화면 안으로 잘라냄)"""
+        left, top, width, height = self.location
+        screen_w, screen_h = map(int, self.matcher.screen_resolution.split('x'))
+
+        x1 = max(0, left + self.velocity[0] - self.margin)
+        y1 = max(0, top + self.velocity[1] - self.margin)
+        x2 = min(screen_w, left + self.velocity[0] + width + self.margin)
+        y2 = min(screen_h, top + self.velocity[1] + height + self.margin)
+        return x1, y1, max(0, x2 - x1), max(0, y2 - y1)
+
+    def locate(
+        self,
+        frame: Optional[np.ndarray] = None,
+        region: Optional[Tuple[int, int, int, int]] = None
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        전체 화면(또는 region)에서 마커 찾기 (느림, 추적 상태 초기화)
+
+        Args:
+            frame: 전체 화면 BGR 프레임 (None이면 캡처)
+            region: 검색할 화면 영역 (None이면 전체 화면)
+
+        Returns:
+            마커 위치 (left, top, width, height) 또는 None
+        """
+        if not self._load():
+            return None
+
+        self.global_searches += 1
+        self.velocity = (0, 0)
+
+        try:
+            match = self._match(frame, region, self.threshold, self.pyramid_scale or 0)
+        except Exception as e:
+            logger.error(f"마커 검색 중 오류 발생: {e}")
+            match = None
+
+        if match is None:
+            logger.debug(f"마커를 찾지 못함: {self.template_path.name}")
+            self.location = None
+            self.score = 0.0
+            return None
+
+        self.location, self.score = match
+        self.reference_score = self.score
+        logger.info(f"마커 발견: {self.template_path.name} at {self.location} (신뢰도: {self.score:.3f})")
+        return self.location
+
+    def track(self, frame: Optional[np.ndarray] = None) -> Optional[Tuple[int, int, int, int]]:
+        """
+        예측 위치 주변에서 마커 추적 (실패하면 전체 화면 검색)
+
+        Args:
+            frame: 전체 화면 BGR 프레임 (None이면 검색 창만 캡처)
+
+        Returns:
+            마커 위치 (left, top, width, height) 또는 None
+        """
+        if self.location is None:
+            return self.locate(frame)
+
+        if not self._load():
+            return None
+
+        self.local_searches += 1
+
+        # 임계값 미만이거나 전체 검색 때보다 신뢰도가 크게 떨어지면 (다른 위치 오검출 가능) 전체 검색
+        min_score = max(self.threshold, self.reference_score - MARKER_TRACK_SCORE_DROP)
+        try:
+            # 작은 창이므로 피라미드 없이 원본 해상도로 매칭
+            match = self._match(frame, self._predicted_window(), min_score, pyramid_scale=0)
+        except Exception as e:
+            logger.error(f"마커 추적 중 오류 발생: {e}")
+            match = None
+
+        if match is None:
+            self.fallbacks += 1
+            logger.debug("마커 국소 검색 실패, 전체 화면 검색으로 전환")
+            return self.locate(frame)
+
+        location, self.score = match
+        self.velocity = (location[0] - self.location[0], location[1] - self.location[1])
+        self.location = location
+        return location
+
+    def distance_from(self, location: Tuple[int, int, int, int]) -> Optional[float]:
+        """현재 마커 중심과 주어진 위치 중심 사이 거리 (현재 위치를 모르면 None)"""
+        if self.location is None:
+            return None
+        (x1, y1), (x2, y2) = _center(self.location), _center(location)
+        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+
+    def wait_for_move(
+        self,
+        origin: Tuple[int, int, int, int],
+        min_distance: float = MARKER_MOVE_MIN_DISTANCE,
+        timeout: float = MARKER_MOVE_TIMEOUT,
+        interval: float = MARKER_TRACK_INTERVAL
+    ) -> Tuple[bool, Optional[Tuple[int, int, int, int]]]:
+        """
+        마커가 origin에서 min_distance 이상 이동한 뒤 멈출 때까지 프레임마다 추적
+
+        Args:
+            origin: 이동 전 마커 위치
+            min_distance: 이동으로 판단할 최소 거리 (픽셀)
+            timeout: 최대 대기 시간 (초)
+            interval: 프레임 간격 (초)
+
+        Returns:
+            (이동 여부, 마지막 마커 위치 또는 None)
+        """
+        if self.location is None:
+            self.location = origin
+
+        start_time = time.time()
+        moved = False
+
+        # 재생 백엔드는 대기 없이 프레임을 넘기므로 벽시계 대신 확인 횟수로 제한
+        # (GameController.wait_until_stable의 max_checks와 같은 방식)
+        max_checks = max(1, int(timeout / interval) + 1) if interval > 0 else 1
+        checks = 0
+
+        while True:
+            if self.matcher.realtime:
+                if time.time() - start_time >= timeout:
+                    break
+            elif checks >= max_checks:
+                break
+            checks += 1
+
+            previous = self.location
+            location = self.track()
+
+            if location is not None:
+                distance = self.distance_from(origin)
+                if distance is not None and distance >= min_distance:
+                    moved = True
+                # 이동 후 프레임 간 변화가 없으면 도착
+                if moved and previous is not None and location[:2] == previous[:2]:
+                    break
+
+            if self.matcher.realtime:
+                time.sleep(interval)
+
+        return moved, self.location
+
+    def reset(self) -> None:
+        """추적 상태 초기화 (다음 track()은 전체 화면 검색)"""
+        self.location = None
+        self.score = 0.0
+        self.velocity = (0, 0)
+        self.reference_score = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """추적 통계"""
+        return {
+            "global_searches": self.global_searches,
+            "local_searches": self.local_searches,
+            "fallbacks": self.fallbacks,
+            "location": self.location,
+            "score": self.score,
+        }
@@ -0,0 +1,178 @@
+"""폴링 스케줄러 모듈
+
+템플릿 대기/재시도 루프의 폴링 시점을 한 곳에서 결정합니다.
+
+- 절대 마감 시각: 시작 시각 + timeout (폴링/대기 시간이 누적되어도 넘지 않음)
+- 적응형 간격: 처음에는 캡처 지연 수준(POLL_MIN_INTERVAL)으로 빠르게, 놓칠 때마다
+  POLL_BACKOFF 배씩 늘려 최대 간격까지
+- 출현 시간 사전 정보(선택): 템플릿이 보통 대기 시작 후 E초에 나타난다면
+  E × (1 - POLL_PRIOR_MARGIN) 전까지는 최대 간격으로 폴링하고, 그 시점부터 다시 빠르게 폴링
+
+출현 시간은 AppearanceTimes가 템플릿별 지수 이동 평균으로 학습합니다.
+
+재생 백엔드(realtime=False)는 실제로 대기하지 않으므로 가상 시계를 사용합니다.
+next_delay()가 돌려준 대기 시간만큼 가상 시계가 진행되어, 폴링 횟수가 CPU 속도와 무관하게
+timeout과 간격만으로 정해집니다 (벽시계 기준이면 timeout 내내 쉬지 않고 폴링).
+"""
+
+import time
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict
+
+from config.settings import (
+    POLL_MIN_INTERVAL,
+    POLL_MAX_INTERVAL,
+    POLL_BACKOFF,
+    POLL_PRIOR_MARGIN,
+    POLL_PRIOR_ALPHA,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """절대 마감 시각 + 적응형 간격 폴링 스케줄"""
+
+    def __init__(
+        self,
+        timeout: float,
+        max_interval: float = POLL_MAX_INTERVAL,
+        min_interval: float = POLL_MIN_INTERVAL,
+        backoff: float = POLL_BACKOFF,
+        expected_after: Optional[float] = None,
+        realtime: bool = True
+    ):
+        """
+        Args:
+            timeout: 전체 대기 시간 (초)
+            max_interval: 최대 폴링 간격 (초)
+            min_interval: 첫 폴링 간격 (초)
+            backoff: 놓칠 때마다 간격 증가 배율
+            expected_after: 예상 출현 시간 (대기 시작 기준, 초). None이면 사전 정보 없음
+            realtime: False면 가상 시계 사용 (재생 백엔드, next_delay()만큼 시간 진행)
+        """
+        self.realtime = realtime
+        self._virtual_elapsed = 0.0
+        self.start = self._now()
+        self.deadline = self.start + max(0.0, timeout)
+        self.max_interval = max(max_interval, 0.0)
+        self.min_interval = min(min_interval, self.max_interval)
+        self.backoff = backoff
+        self.expected_after = expected_after
+
+        self._interval = self.min_interval
+        self._in_window = expected_after is None
+        self.polls = 0
+
+    def _now(self) -> float:
+        """현재 시각 (실시간이면 time.monotonic, 아니면 가상 시계)"""
+        if self.realtime:
+            return time.monotonic()
+        return self._virtual_elapsed
+
+    @property
+    def elapsed(self) -> float:
+        """대기 시작 후 경과 시간 (초)"""
+        return self._now() - self.start
+
+    @property
+    def remaining(self) -> float:
+        """마감까지 남은 시간 (초)"""
+        return max(0.0, self.deadline - self._now())
+
+    @property
+    def expired(self) -> bool:
+        """마감 시각 경과 여부"""
+        return self._now() >= self.deadline
+
+    def _advance(self, delay: float) -> float:
+        """가상 시계 진행 (간격이 0이어도 POLL_MIN_INTERVAL씩은 진행해서 반드시 마감에 도달)"""
+        if not self.realtime:
+            self._virtual_elapsed += max(delay, POLL_MIN_INTERVAL)
+        return delay
+
+    def next_delay(self) -> float:
+        """
+        다음 폴링까지 대기 시간 (호출할 때마다 간격 증가, 마감 시각을 넘지 않음)
+
+        Returns:
+            대기 시간 (초)
+        """
+        self.polls += 1
+
+        if not self._in_window:
+            window_start = self.expected_after * (1.0 - POLL_PRIOR_MARGIN)
+            until_window = window_start - self.elapsed
+            if until_window > 0:
+                # 예상 출현 시각 전: 느리게 폴링 (빠른 폴링 구간 시작 시각은 넘지 않음)
+                return self._advance(min(self.max_interval, until_window, self.remaining))
+            # 예상 출현 구간 진입: 다시 가장 짧은 간격부터
+            self._in_window = True
+            self._interval = self.min_interval
+
+        delay = self._interval
+        self._interval = min(self.max_interval, self._interval * self.backoff)
+        return self._advance(min(delay, self.remaining))
+
+
+class AppearanceTimes:
+    """템플릿별 출현 시간 학습 (대기 시작 → 발견, 지수 이동 평균, 스레드 안전)"""
+
+    def __init__(self, alpha: float = POLL_PRIOR_ALPHA):
+        """
+        Args:
+            alpha: 새 관측값 가중치 (0~1)
+        """
+        self.alpha = alpha
+        self._times: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(template_path: Path | str) -> str:
+        return Path(template_path).as_posix()
+
+    def get(self, template_path: Path | str) -> Optional[float]:
+        """학습된 출현 시간 (초) 또는 None"""
+        with self._lock:
+            return self._times.get(self._key(template_path))
+
+    def record(self, template_path: Path | str, seconds: float) -> None:
+        """대기 시작 후 seconds초에 발견됨을 기록"""
+        key = self._key(template_path)
+        with self._lock:
+            previous = self._times.get(key)
+            if previous is None:
+                self._times[key] = seconds
+            else:
+                self._times[key] = previous + self.alpha * (seconds - previous)
+
+    def set(self, template_path: Path | str, seconds: Optional[float]) -> None:
+        """출현 시간 직접 지정 (None이면 삭제)"""
+        key = self._key(template_path)
+        with self._lock:
+            if seconds is None:
+                self._times.pop(key, None)
+            else:
+                self._times[key] = seconds
+
+    def clear(self) -> None:
+        """학습 내용 전체 삭제"""
+        with self._lock:
+            self._times.clear()
+
+
+# 프로세스 전역 출현 시간 저장소
+_shared_times: Optional[AppearanceTimes] = None
+_shared_times_lock = threading.Lock()
+
+
+def get_appearance_times() -> AppearanceTimes:
+    """프로세스 전역 출현 시간 저장소 반환"""
+    global _shared_times
+    if _shared_times is None:
+        with _shared_times_lock:
+            if _shared_times is None:
+                _shared_times = AppearanceTimes()
+    return _shared_times
@@ -0,0 +1,144 @@
+"""인식 결과 캐시 모듈
+
+대기 루프에서는 같은 코스트 게이지/데미지 영역을 픽셀 단위로 동일한 상태로 반복해서 읽습니다.
+크롭 이미지의 바이트 해시 + 읽기 파라미터를 키로 인식 결과를 캐싱해서
+같은 크롭은 OCR/템플릿 분류 없이 바로 결과를 반환합니다.
+
+캐시 키: (작업 이름, blake2b(크롭 크기 + 형식 + 픽셀 바이트), 파라미터)
+- 항목 수가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- 인식 실패(None)도 캐싱 (같은 픽셀이면 같은 결과)
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Dict, Any, Callable, Union, Hashable
+
+import numpy as np
+from PIL import Image
+
+from config.settings import RESULT_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+
+def image_digest(image: Union[np.ndarray, Image.Image]) -> bytes:
+    """
+    크롭 이미지의 내용 해시 (크기/형식 포함)
+
+    Args:
+        image: numpy 배열 또는 PIL 이미지
+
+    Returns:
+        16바이트 blake2b 다이제스트
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    if isinstance(image, Image.Image):
+        digest.update(f"{image.mode}{image.size}".encode())
+        digest.update(image.tobytes())
+    else:
+        digest.update(f"{image.dtype}{image.shape}".encode())
+        digest.update(np.ascontiguousarray(image).data)
+
+    return digest.digest()
+
+
+class ResultCache:
+    """내용 기반 인식 결과 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = RESULT_CACHE_MAX_ENTRIES):
+        """
+        Args:
+            max_entries: 최대 항목 수 (0이면 캐싱하지 않음)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, bytes, Hashable], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(
+        self,
+        operation: str,
+        image: Union[np.ndarray, Image.Image],
+        params: Hashable,
+        compute: Callable[[], Any]
+    ) -> Any:
+        """
+        캐시된 결과 반환 (없으면 계산 후 캐싱)
+
+        Args:
+            operation: 작업 이름 (예: "read_integer")
+            image: 인식할 크롭 이미지
+            params: 결과에 영향을 주는 파라미터 (해시 가능한 값, 예: 튜플)
+            compute: 캐시에 없을 때 결과를 계산하는 함수
+
+        Returns:
+            인식 결과
+        """
+        if self.max_entries <= 0:
+            return compute()
+
+        key = (operation, image_digest(image), params)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        # 락 밖에서 계산 (느린 작업)
+        result = compute()
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return result
+
+    def clear(self) -> None:
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            {"entries", "max_entries", "hits", "misses", "evictions", "hit_rate"}
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# 프로세스 전역 캐시 인스턴스
+_shared_cache: Optional[ResultCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """프로세스 전역 인식 결과 캐시 반환"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = ResultCache()
+    return _shared_cache
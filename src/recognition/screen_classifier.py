@@ -0,0 +1,244 @@
+"""화면 상태 분류 모듈
+
+현재 화면이 어떤 UI 화면(편성 화면, 스테이지 맵, 보상 화면 등)인지
+템플릿을 하나씩 전체 화면 매칭하는 대신 프레임 한 장으로 한 번에 판별합니다.
+
+- 화면 설명자: 축소 그레이스케일 썸네일 + HSV 색상 히스토그램
+- 기준 화면: assets/templates/<해상도>/ui 의 전체 화면 크기 이미지
+  (파일 이름의 "_2" 같은 번호 접미사는 같은 상태의 추가 기준 화면으로 취급)
+- 최근접 이웃: 가장 가까운 기준 화면의 상태, 거리가 임계값을 넘으면 UNKNOWN_SCREEN
+
+썸네일 크기로 축소해서 비교하므로 화면 해상도와 무관하고, 분류는 수 밀리초 안에 끝납니다.
+"""
+
+import re
+import time
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any, List
+
+import numpy as np
+from PIL import Image
+
+from src.recognition.frame_signature import frame_signature, signature_distance
+from src.recognition.template_cache import parse_template_resolution
+from src.capture import CaptureBackend, get_capture_backend
+from config.settings import (
+    UI_DIR,
+    SCREEN_THUMBNAIL_SIZE,
+    SCREEN_HIST_BINS,
+    SCREEN_HIST_WEIGHT,
+    SCREEN_UNKNOWN_DISTANCE,
+)
+
+logger = logging.getLogger(__name__)
+
+# OpenCV 사용 가능 여부 확인 (없으면 썸네일만 비교)
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+# 알 수 없는 화면 (어느 기준 화면과도 충분히 가깝지 않음)
+UNKNOWN_SCREEN = "unknown"
+
+# 기준 화면 파일 이름의 번호 접미사 (stage_map_2.png → stage_map)
+_VARIANT_SUFFIX = re.compile(r"_\d+$")
+
+
+def screen_state_name(reference_path: Path | str) -> str:
+    """기준 화면 파일 경로 → 화면 상태 이름 (번호 접미사 제거)"""
+    return _VARIANT_SUFFIX.sub("", Path(reference_path).stem)
+
+
+def _describe(frame: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    화면 설명자 계산
+
+    Args:
+        frame: BGR(H, W, 3) 또는 그레이스케일(H, W) 프레임
+
+    Returns:
+        (그레이스케일 썸네일, 정규화된 HSV 히스토그램 또는 None(그레이스케일 / OpenCV 없음))
+    """
+    if not OPENCV_AVAILABLE:
+        return frame_signature(frame, SCREEN_THUMBNAIL_SIZE), None
+
+    # 썸네일 한 칸당 8x8 표본만 남기도록 먼저 간격 추출한 뒤 영역 평균 축소
+    # (전체 해상도 INTER_AREA보다 약 10배 빠름), 두 설명자 모두 축소 프레임에서 계산
+    width, height = SCREEN_THUMBNAIL_SIZE
+    step = max(1, min(frame.shape[0] // (height * 8), frame.shape[1] // (width * 8)))
+    small = cv2.resize(frame[::step, ::step], SCREEN_THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+    thumbnail = frame_signature(small, SCREEN_THUMBNAIL_SIZE)
+    if small.ndim != 3:
+        return thumbnail, None
+
+    hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+    histogram = cv2.calcHist([hsv], [0, 1], None, list(SCREEN_HIST_BINS), [0, 180, 0, 256]).ravel()
+    histogram /= max(float(histogram.sum()), 1.0)
+    return thumbnail, histogram
+
+
+class ScreenClassifier:
+    """프레임 한 장으로 현재 UI 화면 상태 판별 (전역 설명자 최근접 이웃)"""
+
+    def __init__(
+        self,
+        capture_backend: Optional[CaptureBackend] = None,
+        reference_dir: Path | str = UI_DIR,
+        unknown_distance: float = SCREEN_UNKNOWN_DISTANCE
+    ):
+        """
+        Args:
+            capture_backend: 화면 캡처 백엔드 (None이면 프로세스 전역 백엔드 사용)
+            reference_dir: 기준 화면 이미지 디렉토리 (전체 화면 크기 이미지만 사용)
+            unknown_distance: 가장 가까운 기준 화면과의 거리가 이 값을 넘으면 UNKNOWN_SCREEN
+        """
+        self.capture = capture_backend or get_capture_backend()
+        self.reference_dir = Path(reference_dir)
+        self.unknown_distance = unknown_distance
+
+        self._references: List[Tuple[str, np.ndarray, Optional[np.ndarray]]] = []
+        self._loaded = False
+        self._lock = threading.Lock()
+
+        # 통계
+        self.classifications = 0
+        self.unknowns = 0
+        self.total_time = 0.0
+
+    def _load(self) -> None:
+        """기준 화면 디렉토리에서 전체 화면 크기 이미지의 설명자 계산 (최초 1회)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            for path in sorted(self.reference_dir.glob("*.png")):
+                resolution = parse_template_resolution(path)
+                try:
+                    img = Image.open(path)
+                    if resolution and f"{img.width}x{img.height}" != resolution:
+                        continue  # 버튼/팝업 등 부분 템플릿은 제외
+                    frame = np.ascontiguousarray(np.array(img.convert("RGB"))[:, :, ::-1])
+                except Exception as e:
+                    logger.warning(f"기준 화면을 로드할 수 없습니다: {path} ({e})")
+                    continue
+
+                self._references.append((screen_state_name(path), *_describe(frame)))
+
+            logger.info(f"화면 분류 기준 화면 {len(self._references)}개 로드: {self.states}")
+
+    @property
+    def states(self) -> List[str]:
+        """판별 가능한 화면 상태 목록"""
+        return sorted({state for state, _, _ in self._references})
+
+    def add_reference(self, state: str, frame: np.ndarray) -> None:
+        """
+        기준 화면 추가 (캡처한 실제 화면 등)
+
+        Args:
+            state: 화면 상태 이름
+            frame: BGR 전체 화면 프레임
+        """
+        self._load()
+        with self._lock:
+            self._references.append((state, *_describe(frame)))
+
+    def _distance(
+        self,
+        descriptor: Tuple[np.ndarray, Optional[np.ndarray]],
+        reference: Tuple[np.ndarray, Optional[np.ndarray]]
+    ) -> float:
+        """설명자 거리 (0.0 ~ 1.0, 썸네일 평균 절대 차이 + 히스토그램 L1 거리의 가중 평균)"""
+        thumbnail_distance = signature_distance(descriptor[0], reference[0])
+        if descriptor[1] is None or reference[1] is None:
+            return thumbnail_distance
+
+        histogram_distance = 0.5 * float(np.abs(descriptor[1] - reference[1]).sum())
+        return (1.0 - SCREEN_HIST_WEIGHT) * thumbnail_distance + SCREEN_HIST_WEIGHT * histogram_distance
+
+    def classify(self, frame: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        현재 화면 상태 판별
+
+        Args:
+            frame: BGR 전체 화면 프레임 (None이면 캡처)
+
+        Returns:
+            {
+                "state": str (화면 상태 이름 또는 UNKNOWN_SCREEN),
+                "nearest": str (거리와 무관하게 가장 가까운 상태),
+                "distance": float (가장 가까운 기준 화면과의 거리),
+                "margin": float (두 번째로 가까운 다른 상태와의 거리 차이),
+                "distances": {상태: 거리} (상태별 최소 거리)
+            }
+        """
+        self._load()
+        start_time = time.perf_counter()
+
+        if frame is None:
+            frame = self.capture.grab(None, grayscale=False)
+
+        descriptor = _describe(frame)
+        distances: Dict[str, float] = {}
+        for state, thumbnail, histogram in self._references:
+            distance = self._distance(descriptor, (thumbnail, histogram))
+            if distance < distances.get(state, float("inf")):
+                distances[state] = distance
+
+        ranked = sorted(distances.items(), key=lambda item: item[1])
+        nearest, distance = ranked[0] if ranked else (UNKNOWN_SCREEN, 1.0)
+        margin = ranked[1][1] - distance if len(ranked) > 1 else 1.0
+        state = nearest if distance <= self.unknown_distance else UNKNOWN_SCREEN
+
+        self.classifications += 1
+        self.unknowns += state == UNKNOWN_SCREEN
+        self.total_time += time.perf_counter() - start_time
+
+        logger.debug(f"화면 분류: {state} (가장 가까운 상태: {nearest}, 거리: {distance:.3f}, 차이: {margin:.3f})")
+        return {
+            "state": state,
+            "nearest": nearest,
+            "distance": distance,
+            "margin": margin,
+            "distances": distances,
+        }
+
+    def is_screen(self, state: str, frame: Optional[np.ndarray] = None) -> Optional[bool]:
+        """
+        현재 화면이 주어진 상태인지 확인
+
+        Args:
+            state: 화면 상태 이름 (예: "stage_map")
+            frame: BGR 전체 화면 프레임 (None이면 캡처)
+
+        Returns:
+            True/False, 판별할 수 없으면 None (기준 화면 없는 상태 / 알 수 없는 화면)
+        """
+        self._load()
+        if state not in self.states:
+            return None
+
+        detected = self.classify(frame)["state"]
+        if detected == UNKNOWN_SCREEN:
+            return None
+        return detected == state
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        분류 통계
+
+        Returns:
+            {"references", "states", "classifications", "unknowns", "avg_time_ms"}
+        """
+        return {
+            "references": len(self._references),
+            "states": self.states,
+            "classifications": self.classifications,
+            "unknowns": self.unknowns,
+            "avg_time_ms": 1000.0 * self.total_time / self.classifications if self.classifications else 0.0,
+        }
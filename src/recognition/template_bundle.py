@@ -0,0 +1,205 @@
+"""사전 컴파일 템플릿 번들 모듈
+
+tools/build_template_bundle.py가 빌드 시점에 모든 템플릿을 디코딩/스케일링해서
+하나의 uint8 배열 파일(.npy)과 인덱스(.json)로 저장합니다.
+실행 시에는 번들을 메모리 맵으로 열어 필요한 부분만 페이지 단위로 읽으므로
+PNG 디코딩과 리사이즈 없이 템플릿 배열을 바로 사용할 수 있습니다.
+
+번들 항목 종류:
+- "gray": 그레이스케일 (H, W)
+- "bgr": BGR (H, W, 3)
+- "alpha": 알파 채널 마스크 (H, W), 원본 해상도만 (알파 채널이 없는 템플릿은 빈 배열)
+
+그레이스케일/BGR은 지원 해상도별로 스케일링된 배열과 피라미드 축소 배열을 함께 저장합니다.
+배열은 TemplateCache._load()로 생성하므로 PNG를 직접 디코딩한 결과와 동일합니다.
+
+원본 PNG가 번들 생성 이후 수정되면(크기/수정 시각 불일치) 해당 템플릿은 번들을 사용하지 않습니다.
+PyInstaller 빌드에서는 에셋이 바뀌지 않으므로 이 검사를 생략합니다.
+"""
+
+import sys
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+import numpy as np
+
+from config.settings import TEMPLATES_DIR, TEMPLATE_BUNDLE_FILE, TEMPLATE_BUNDLE_INDEX
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_VERSION = 1
+
+
+def bundle_key(relative_path: str, resolution: str, kind: str, scale: float = 1.0) -> str:
+    """
+    번들 인덱스 키
+
+    Args:
+        relative_path: TEMPLATES_DIR 기준 상대 경로 (예: "2560x1440/buttons/deploy_button.png")
+        resolution: 대상 해상도 (예: "1920x1080")
+        kind: "gray" | "bgr" | "alpha"
+        scale: 피라미드 축소 배율
+
+    Returns:
+        인덱스 키 문자열
+    """
+    return f"{relative_path}|{resolution}|{kind}|{scale:g}"
+
+
+class TemplateBundle:
+    """메모리 맵 템플릿 번들 (처음 접근 시 로드, 스레드 안전)"""
+
+    def __init__(
+        self,
+        bundle_file: Path = TEMPLATE_BUNDLE_FILE,
+        index_file: Path = TEMPLATE_BUNDLE_INDEX,
+        templates_dir: Path = TEMPLATES_DIR
+    ):
+        """
+        Args:
+            bundle_file: 번들 배열 파일 (.npy)
+            index_file: 번들 인덱스 파일 (.json)
+            templates_dir: 템플릿 루트 디렉토리 (인덱스의 상대 경로 기준)
+        """
+        self.bundle_file = Path(bundle_file)
+        self.index_file = Path(index_file)
+        self.templates_dir = Path(templates_dir)
+
+        self._data: Optional[np.ndarray] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._sources: Dict[str, Dict[str, int]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+        # 에셋이 바뀌지 않는 PyInstaller 빌드에서는 원본 변경 검사 생략
+        self.check_sources = not getattr(sys, "frozen", False)
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        """번들 인덱스 로드 + 배열 메모리 맵 (처음 한 번만)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            if not self.bundle_file.exists() or not self.index_file.exists():
+                logger.debug(f"템플릿 번들 없음, PNG에서 로드합니다: {self.bundle_file}")
+                return
+
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+
+                if index.get("version") != BUNDLE_VERSION:
+                    logger.warning(f"템플릿 번들 버전 불일치, 사용하지 않습니다: {index.get('version')}")
+                    return
+
+                self._data = np.load(self.bundle_file, mmap_mode='r')
+                self._entries = index["entries"]
+                self._sources = index["sources"]
+                logger.info(f"템플릿 번들 로드: {len(self._sources)}개 템플릿, {len(self._entries)}개 배열")
+            except Exception as e:
+                logger.warning(f"템플릿 번들을 로드할 수 없습니다: {e}")
+                self._data = None
+                self._entries = {}
+                self._sources = {}
+
+    @property
+    def available(self) -> bool:
+        """번들 사용 가능 여부"""
+        self._load()
+        return self._data is not None
+
+    def _relative_path(self, template_path: Path) -> Optional[str]:
+        """템플릿 경로 → 번들 상대 경로 (템플릿 디렉토리 밖이면 None)"""
+        try:
+            return Path(template_path).resolve().relative_to(self.templates_dir.resolve()).as_posix()
+        except ValueError:
+            return None
+
+    def get(
+        self,
+        template_path: Path | str,
+        resolution: Optional[str],
+        kind: str,
+        scale: float = 1.0
+    ) -> Optional[np.ndarray]:
+        """
+        번들의 템플릿 배열 반환 (디코딩 없음)
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            resolution: 대상 화면 해상도 (None이면 템플릿 원본 해상도)
+            kind: "gray" | "bgr" | "alpha"
+            scale: 피라미드 축소 배율
+
+        Returns:
+            읽기 전용 배열 (메모리 맵 뷰) 또는 None (번들에 없음 / 원본이 변경됨)
+        """
+        self._load()
+        if self._data is None:
+            return None
+
+        relative_path = self._relative_path(template_path)
+        source = self._sources.get(relative_path) if relative_path else None
+        if source is None:
+            self.misses += 1
+            return None
+
+        if resolution is None:
+            resolution = source["resolution"]
+
+        entry = self._entries.get(bundle_key(relative_path, resolution, kind, scale))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if self.check_sources:
+            try:
+                stat = Path(template_path).stat()
+            except OSError:
+                return None
+            if stat.st_size != source["size"] or stat.st_mtime_ns != source["mtime_ns"]:
+                logger.debug(f"템플릿이 번들 생성 이후 변경됨, PNG에서 로드: {relative_path}")
+                self.misses += 1
+                return None
+
+        offset = entry["offset"]
+        shape = tuple(entry["shape"])
+        size = int(np.prod(shape))
+
+        self.hits += 1
+        return self._data[offset:offset + size].reshape(shape)
+
+    def stats(self) -> Dict[str, Any]:
+        """번들 통계"""
+        self._load()
+        return {
+            "available": self._data is not None,
+            "templates": len(self._sources),
+            "arrays": len(self._entries),
+            "bytes": 0 if self._data is None else int(self._data.nbytes),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# 프로세스 전역 번들 인스턴스
+_shared_bundle: Optional[TemplateBundle] = None
+_shared_bundle_lock = threading.Lock()
+
+
+def get_template_bundle() -> TemplateBundle:
+    """프로세스 전역 템플릿 번들 반환"""
+    global _shared_bundle
+    if _shared_bundle is None:
+        with _shared_bundle_lock:
+            if _shared_bundle is None:
+                _shared_bundle = TemplateBundle()
+    return _shared_bundle
@@ -0,0 +1,337 @@
+"""템플릿 이미지 메모리 캐시 모듈
+
+템플릿 PNG를 매번 디스크에서 읽고 스케일링한 뒤 임시 파일로 저장하는 대신,
+디코딩 + 해상도 스케일링이 끝난 numpy 배열을 프로세스 전역으로 캐싱합니다.
+
+캐시 키: (템플릿 경로, 화면 해상도, 배열 종류(gray/bgr/alpha/mask), 추가 축소 배율)
+- 파일 수정 시각(mtime)이 바뀌면 자동으로 다시 로드
+- 전체 메모리 사용량이 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- 사전 컴파일 템플릿 번들에 있는 배열은 디코딩 없이 번들(메모리 맵)에서 가져옴
+"""
+
+import re
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any, Callable
+
+import numpy as np
+from PIL import Image
+
+from config.settings import TEMPLATE_CACHE_MAX_BYTES, TEMPLATE_MASK_THRESHOLD
+from src.recognition.template_bundle import TemplateBundle, get_template_bundle
+
+logger = logging.getLogger(__name__)
+
+# 경로 구성요소 중 해상도 폴더명 (예: "2560x1440")
+_RESOLUTION_PATTERN = re.compile(r"^(\d+)x(\d+)$")
+
+
+def parse_template_resolution(template_path: Path) -> Optional[str]:
+    """
+    템플릿 경로에서 기준 해상도 추출
+
+    Args:
+        template_path: 템플릿 경로 (예: assets/templates/2560x1440/buttons/...)
+
+    Returns:
+        해상도 문자열 (예: "2560x1440") 또는 None
+    """
+    for part in Path(template_path).parts:
+        if _RESOLUTION_PATTERN.match(part):
+            return part
+    return None
+
+
+class TemplateCache:
+    """디코딩 및 스케일링된 템플릿 배열 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        max_bytes: int = TEMPLATE_CACHE_MAX_BYTES,
+        bundle: Optional[TemplateBundle] = None
+    ):
+        """
+        Args:
+            max_bytes: 캐시 최대 메모리 사용량 (바이트)
+            bundle: 사전 컴파일 템플릿 번들 (None이면 프로세스 전역 번들)
+        """
+        self.max_bytes = max_bytes
+        self.bundle = bundle or get_template_bundle()
+        self._entries: "OrderedDict[Tuple[str, str, str, float], Tuple[float, np.ndarray]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        template_path: Path | str,
+        screen_resolution: Optional[str] = None,
+        grayscale: bool = True,
+        scale: float = 1.0
+    ) -> Optional[np.ndarray]:
+        """
+        캐시된 템플릿 배열 반환 (없으면 로드 후 캐싱)
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            screen_resolution: 대상 화면 해상도 (예: "1920x1080"). None이면 스케일링 안 함
+            grayscale: True면 그레이스케일(H, W), False면 BGR(H, W, 3) 배열
+            scale: 해상도 스케일링 후 추가 축소 배율 (피라미드 매칭용, 1.0이면 원본 크기)
+
+        Returns:
+            템플릿 배열 (읽기 전용) 또는 None (로드 실패)
+        """
+        kind = "gray" if grayscale else "bgr"
+        return self._get(
+            Path(template_path), screen_resolution, kind, scale,
+            lambda path: self._load(path, screen_resolution, grayscale, scale)
+        )
+
+    def get_mask(self, template_path: Path | str) -> Optional[np.ndarray]:
+        """
+        템플릿 알파 채널 마스크 반환 (원본 해상도, 없으면 로드 후 캐싱)
+
+        Args:
+            template_path: 템플릿 이미지 경로 (투명 PNG)
+
+        Returns:
+            알파 채널 배열 (H, W, 읽기 전용) 또는 None (알파 채널 없음 / 로드 실패)
+        """
+        mask = self._get(Path(template_path), None, "alpha", 1.0, self._load_alpha)
+        if mask is None or mask.size == 0:
+            return None
+        return mask
+
+    def get_masked(
+        self,
+        template_path: Path | str,
+        mask_path: Optional[Path | str] = None,
+        screen_resolution: Optional[str] = None,
+        grayscale: bool = False,
+        scale: float = 1.0
+    ) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """
+        마스크 매칭용 (템플릿, 이진 마스크) 반환 (없으면 로드 후 캐싱)
+
+        템플릿은 get()과 같은 배열(알파 채널 제거, BGR 또는 그레이스케일)이고,
+        마스크는 템플릿과 같은 크기로 스케일링한 뒤 0/255로 이진화한 배열입니다.
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            mask_path: 마스크 이미지 경로 (흰색=매칭). None이면 템플릿의 알파 채널 사용
+            screen_resolution: 대상 화면 해상도. None이면 스케일링 안 함
+            grayscale: 그레이스케일 템플릿 여부
+            scale: 피라미드 축소 배율
+
+        Returns:
+            (템플릿, 마스크 또는 None(알파 채널 없음 / 전부 불투명)) 또는 None (로드 실패)
+        """
+        template = self.get(template_path, screen_resolution, grayscale, scale)
+        if template is None:
+            return None
+
+        height, width = template.shape[:2]
+        if mask_path is None:
+            # 알파 채널 마스크는 get()처럼 번들의 alpha 배열에서 메모리 안에서 만듦 (PNG 디코딩 없음)
+            source = Path(template_path)
+            load = lambda path: self._mask_from_alpha(path, (width, height))
+        else:
+            source = Path(mask_path)
+            load = lambda path: self._load_mask(path, (width, height))
+
+        # 같은 마스크 파일을 크기가 다른 템플릿과 함께 쓸 수 있으므로 크기를 종류에 포함
+        mask = self._get(source, screen_resolution, f"mask_{width}x{height}", scale, load)
+        if mask is None:
+            return None
+        return template, (mask if mask.size else None)
+
+    def _get(
+        self,
+        template_path: Path,
+        screen_resolution: Optional[str],
+        kind: str,
+        scale: float,
+        load: Callable[[Path], Optional[np.ndarray]]
+    ) -> Optional[np.ndarray]:
+        """캐시 조회 → 번들 조회 → 디코딩 순서로 배열 반환"""
+        try:
+            mtime = template_path.stat().st_mtime
+        except OSError:
+            logger.error(f"템플릿 파일이 존재하지 않습니다: {template_path}")
+            return None
+
+        key = (str(template_path.resolve()), screen_resolution or "", kind, scale)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == mtime:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        # 번들에 있으면 디코딩 없이 사용, 없으면 락 밖에서 디코딩 (느린 작업)
+        array = self.bundle.get(template_path, screen_resolution, kind, scale)
+        if array is None:
+            array = load(template_path)
+        if array is None:
+            return None
+
+        with self._lock:
+            self.misses += 1
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1].nbytes
+            self._entries[key] = (mtime, array)
+            self._total_bytes += array.nbytes
+            self._evict()
+
+        return array
+
+    def _load(
+        self,
+        template_path: Path,
+        screen_resolution: Optional[str],
+        grayscale: bool,
+        scale: float = 1.0
+    ) -> Optional[np.ndarray]:
+        """템플릿 디코딩 + 해상도 스케일링 (+ 피라미드 축소)"""
+        try:
+            img = Image.open(template_path).convert("RGB")
+        except Exception as e:
+            logger.error(f"템플릿 이미지를 로드할 수 없습니다: {template_path} ({e})")
+            return None
+
+        template_resolution = parse_template_resolution(template_path)
+
+        # 해상도가 다르면 스케일링
+        if screen_resolution and template_resolution and template_resolution != screen_resolution:
+            try:
+                template_width, template_height = map(int, template_resolution.split('x'))
+                screen_width, screen_height = map(int, screen_resolution.split('x'))
+
+                scale_x = screen_width / template_width
+                scale_y = screen_height / template_height
+
+                new_width = max(1, int(img.width * scale_x))
+                new_height = max(1, int(img.height * scale_y))
+                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+                logger.debug(f"템플릿 스케일링: {template_resolution} → {screen_resolution} (비율: {scale_x:.2f}x)")
+            except Exception as e:
+                logger.warning(f"템플릿 스케일링 실패: {e}, 원본 사용")
+
+        # 피라미드 매칭용 추가 축소 (BOX = 영역 평균, cv2.INTER_AREA와 동일한 방식)
+        if scale != 1.0:
+            new_width = max(1, int(round(img.width * scale)))
+            new_height = max(1, int(round(img.height * scale)))
+            img = img.resize((new_width, new_height), Image.Resampling.BOX)
+
+        if grayscale:
+            array = np.array(img.convert("L"))
+        else:
+            # RGB → BGR (OpenCV 형식)
+            array = np.ascontiguousarray(np.array(img)[:, :, ::-1])
+
+        array.setflags(write=False)
+        return array
+
+    def _load_alpha(self, template_path: Path) -> Optional[np.ndarray]:
+        """템플릿 알파 채널 디코딩 (알파 채널이 없으면 빈 배열)"""
+        try:
+            img = Image.open(template_path)
+            if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+                array = np.array(img.convert("RGBA").getchannel("A"))
+            else:
+                array = np.zeros(0, dtype=np.uint8)  # 알파 채널 없음 (캐시에 "없음"으로 기록)
+        except Exception as e:
+            logger.error(f"템플릿 이미지를 로드할 수 없습니다: {template_path} ({e})")
+            return None
+
+        array.setflags(write=False)
+        return array
+
+    def _mask_from_alpha(self, template_path: Path, size: Tuple[int, int]) -> Optional[np.ndarray]:
+        """알파 채널(번들 또는 캐시된 배열)로 마스크 생성 (알파 채널이 없으면 빈 배열)"""
+        alpha = self._get(template_path, None, "alpha", 1.0, self._load_alpha)
+        if alpha is None:
+            return None
+        if alpha.size == 0:
+            return alpha  # 알파 채널 없음
+        return self._binarize_mask(Image.fromarray(alpha), size, template_path)
+
+    def _load_mask(self, mask_path: Path, size: Tuple[int, int]) -> Optional[np.ndarray]:
+        """별도 마스크 이미지 디코딩 + 이진화 (흰색=매칭)"""
+        try:
+            channel = Image.open(mask_path).convert("L")
+        except Exception as e:
+            logger.error(f"마스크 이미지를 로드할 수 없습니다: {mask_path} ({e})")
+            return None
+
+        return self._binarize_mask(channel, size, mask_path)
+
+    def _binarize_mask(self, channel: Image.Image, size: Tuple[int, int], source: Path) -> np.ndarray:
+        """마스크 채널을 템플릿 크기로 스케일링 + 이진화 (매칭에 쓸 수 없는 마스크는 빈 배열)"""
+        if channel.size != size:
+            channel = channel.resize(size, Image.Resampling.BOX)
+
+        array = np.where(np.array(channel) >= TEMPLATE_MASK_THRESHOLD, 255, 0).astype(np.uint8)
+        if array.all():
+            # 전부 불투명하면 마스크 없이 매칭 (마스크 매칭보다 훨씬 빠름)
+            array = np.zeros(0, dtype=np.uint8)
+        elif not array.any():
+            logger.warning(f"마스크가 전부 투명해서 사용할 수 없습니다: {source}")
+            array = np.zeros(0, dtype=np.uint8)
+
+        array.setflags(write=False)
+        return array
+
+    def _evict(self) -> None:
+        """메모리 상한 초과 시 LRU 항목 제거 (락 보유 상태에서 호출)"""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, array) = self._entries.popitem(last=False)
+            self._total_bytes -= array.nbytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            {"entries", "bytes", "max_bytes", "hits", "misses", "evictions"}
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# 프로세스 전역 캐시 인스턴스
+_shared_cache: Optional[TemplateCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> TemplateCache:
+    """프로세스 전역 템플릿 캐시 반환"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = TemplateCache()
+    return _shared_cache
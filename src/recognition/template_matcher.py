@@ -1,23 +1,47 @@
 """템플릿 매칭 모듈 - pyautogui.locateOnScreen 래퍼"""
 
 import time
-import pyautogui
+import asyncio
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict, Any, List
 import logging
 from PIL import Image
-import tempfile
 import numpy as np
 
 from config.settings import (
     TEMPLATE_MATCHING_CONFIDENCE,
     TEMPLATE_MATCHING_RETRY,
     TEMPLATE_MATCHING_TIMEOUT,
+    TEMPLATE_RETRY_WINDOW_PER_RETRY,
+    TEMPLATE_PYRAMID_CANDIDATES,
+    TEMPLATE_PYRAMID_COARSE_MARGIN,
+    TEMPLATE_PYRAMID_MIN_SIZE,
+    TEMPLATE_FIND_ALL_MAX_RESULTS,
+    TEMPLATE_HINT_PADDING,
+    TEMPLATE_HINT_CATEGORIES,
+    WAIT_GATE_BLOCK_SIZE,
+    WAIT_GATE_THRESHOLD,
     CURRENT_RESOLUTION,
 )
+from config.template_regions import get_template_region
+from src.recognition.template_cache import TemplateCache, get_template_cache
+from src.recognition.location_hints import LocationHintStore, get_location_hints
+from src.recognition.frame_signature import frame_signature, signature_max_difference
+from src.recognition.poll_scheduler import PollScheduler, AppearanceTimes, get_appearance_times
+from src.capture import (
+    CaptureBackend, FrameSource, get_capture_backend, get_frame_source, run_in_capture_executor
+)
 
 logger = logging.getLogger(__name__)
 
+# pyautogui 사용 가능 여부 확인 (헤드리스 환경에서는 import 시 디스플레이 연결 실패)
+try:
+    import pyautogui
+    PYAUTOGUI_AVAILABLE = True
+except Exception:
+    pyautogui = None
+    PYAUTOGUI_AVAILABLE = False
+
 # OpenCV 사용 가능 여부 확인
 try:
     import cv2
@@ -27,6 +51,69 @@ except ImportError:
     logger.warning("OpenCV를 사용할 수 없습니다. 마스크 기반 템플릿 매칭이 제한됩니다.")
 
 
+def _top_peaks(
+    result: np.ndarray,
+    max_peaks: int,
+    suppress_w: int,
+    suppress_h: int,
+    min_score: float
+) -> list:
+    """
+    매칭 결과 맵에서 점수가 높은 위치를 겹치지 않게 추출 (비최대 억제)
+
+    Args:
+        result: cv2.matchTemplate 결과 맵
+        max_peaks: 최대 추출 개수
+        suppress_w: 피크 주변 억제 폭 (보통 템플릿 너비)
+        suppress_h: 피크 주변 억제 높이 (보통 템플릿 높이)
+        min_score: 최소 점수
+
+    Returns:
+        [((x, y), score), ...] 점수 내림차순
+    """
+    peaks = []
+    result = result.copy()
+    height, width = result.shape[:2]
+
+    for _ in range(max_peaks):
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val < min_score:
+            break
+        peaks.append((max_loc, max_val))
+
+        x, y = max_loc
+        result[
+            max(0, y - suppress_h // 2):min(height, y + suppress_h // 2 + 1),
+            max(0, x - suppress_w // 2):min(width, x + suppress_w // 2 + 1)
+        ] = -1.0
+
+    return peaks
+
+
+def _match_map(
+    image: np.ndarray,
+    template: np.ndarray,
+    method: int,
+    mask: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    cv2.matchTemplate 결과 맵 (마스크 매칭은 분모가 0인 위치의 inf/nan을 0으로 치환)
+
+    Args:
+        image: 검색 대상 배열
+        template: 템플릿 배열
+        method: 매칭 방식 (cv2.TM_*)
+        mask: 이진 마스크 (템플릿과 같은 크기, 선택)
+
+    Returns:
+        매칭 결과 맵
+    """
+    if mask is None:
+        return cv2.matchTemplate(image, template, method)
+    result = cv2.matchTemplate(image, template, method, mask=mask)
+    return np.nan_to_num(result, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+
 class TemplateMatcher:
     """화면에서 템플릿 이미지를 찾는 클래스"""
 
@@ -36,6 +123,15 @@ class TemplateMatcher:
         retry_count: int = TEMPLATE_MATCHING_RETRY,
         timeout: int = TEMPLATE_MATCHING_TIMEOUT,
         auto_scale: bool = True,
+        template_cache: Optional[TemplateCache] = None,
+        pyramid_scale: Optional[float] = None,
+        location_hints: Optional[LocationHintStore] = None,
+        use_location_hints: bool = True,
+        use_default_regions: bool = True,
+        capture_backend: Optional[CaptureBackend] = None,
+        frame_source: Optional[FrameSource] = None,
+        appearance_times: Optional[AppearanceTimes] = None,
+        use_appearance_prior: bool = True,
     ):
         """
         Args:
@@ -43,83 +139,468 @@ class TemplateMatcher:
             retry_count: 매칭 실패 시 재시도 횟수
             timeout: 전체 작업 타임아웃 (초)
             auto_scale: 해상도에 맞게 템플릿 자동 스케일링 여부
+            template_cache: 템플릿 캐시 (None이면 프로세스 전역 캐시 사용)
+            pyramid_scale: 피라미드(coarse-to-fine) 매칭 축소 배율 (예: 0.5, 0.25).
+                           None이면 항상 원본 해상도로 매칭
+            location_hints: 위치 힌트 저장소 (None이면 프로세스 전역 저장소 사용)
+            use_location_hints: 마지막 발견 위치 주변 우선 검색 여부
+            use_default_regions: region=None일 때 config/template_regions.py의
+                                 템플릿별 기본 검색 영역 적용 여부
+            capture_backend: 화면 캡처 백엔드 (None이면 프로세스 전역 백엔드 사용)
+            frame_source: 백그라운드 캡처 프레임 소스. 실행 중이면 직접 캡처 대신
+                          이미 캡처된 프레임 사용 (None이면 설정에 따라 전역 소스 사용)
+            appearance_times: 템플릿별 출현 시간 저장소 (None이면 프로세스 전역 저장소 사용)
+            use_appearance_prior: wait_for_template에서 학습된 출현 시간 전까지 느리게 폴링할지 여부
         """
         self.confidence = confidence
         self.retry_count = retry_count
         self.timeout = timeout
         self.auto_scale = auto_scale
+        self.template_cache = template_cache or get_template_cache()
+        self.pyramid_scale = pyramid_scale
+        self.location_hints = (location_hints or get_location_hints()) if use_location_hints else None
+        self.appearance_times = (appearance_times or get_appearance_times()) if use_appearance_prior else None
+        self.use_default_regions = use_default_regions
+        self.capture = capture_backend or get_capture_backend()
+        self.frame_source = frame_source or get_frame_source()
+        self._last_frame_seq = 0  # 마지막으로 매칭한 백그라운드 프레임 번호
+        self.realtime = self.capture.realtime  # False(재생 백엔드)면 폴링 대기 생략
+
+        # 대기 루프 프레임 변화 게이트 통계
+        self.gate_matches = 0  # 화면이 바뀌어 실제로 매칭한 폴링 수
+        self.gate_skips = 0  # 화면 변화가 없어 이전 결과를 재사용한 폴링 수
 
         # 현재 화면 해상도
-        screen_size = pyautogui.size()
-        self.screen_resolution = f"{screen_size.width}x{screen_size.height}"
+        screen_width, screen_height = self.capture.size()
+        self.screen_resolution = f"{screen_width}x{screen_height}"
 
-    def _scale_template(self, template_path: Path) -> Optional[str]:
+    def _load_template(self, template_path: Path, grayscale: bool) -> Optional[np.ndarray]:
         """
-        템플릿을 현재 해상도에 맞게 스케일링
+        현재 해상도에 맞게 스케일링된 템플릿 배열 로드 (프로세스 전역 캐시 사용)
 
         Args:
             template_path: 원본 템플릿 경로
+            grayscale: 그레이스케일 배열 여부
 
         Returns:
-            스케일링된 템플릿의 임시 파일 경로 또는 None
+            템플릿 배열 (그레이스케일 또는 BGR) 또는 None
         """
-        if not self.auto_scale:
-            return str(template_path)
+        target_resolution = self.screen_resolution if self.auto_scale else None
+        return self.template_cache.get(template_path, target_resolution, grayscale)
 
-        # 템플릿 경로에서 해상도 추출 (예: assets/templates/2560x1440/buttons/...)
-        path_parts = template_path.parts
-        template_resolution = None
+    def _load_coarse_template(
+        self,
+        template_path: Path,
+        grayscale: bool,
+        scale: float
+    ) -> Optional[np.ndarray]:
+        """피라미드 매칭용 축소 템플릿 로드 (캐시)"""
+        target_resolution = self.screen_resolution if self.auto_scale else None
+        return self.template_cache.get(template_path, target_resolution, grayscale, scale)
+
+    def _sleep(self, seconds: float) -> None:
+        """폴링 간 대기 (재생 백엔드에서는 생략해서 CPU 속도로 진행)"""
+        if self.realtime:
+            time.sleep(seconds)
+
+    def _scheduler(
+        self,
+        timeout: float,
+        check_interval: float,
+        template_path: Optional[Path] = None,
+        expected_after: Optional[float] = None
+    ) -> PollScheduler:
+        """
+        대기 루프 폴링 스케줄 (check_interval은 최대 폴링 간격)
 
-        for part in path_parts:
-            if 'x' in part and part.replace('x', '').replace('0', '').replace('1', '').replace('2', '').replace('3', '').replace('4', '').replace('5', '').replace('6', '').replace('7', '').replace('8', '').replace('9', '') == '':
-                template_resolution = part
-                break
+        재생 백엔드는 가상 시계 스케줄이므로 대기 루프가 timeout/간격으로 정해진 횟수만 폴링합니다.
 
-        # 해상도가 같으면 스케일링 불필요
-        if template_resolution == self.screen_resolution or template_resolution is None:
-            return str(template_path)
+        template_path가 주어지고 expected_after가 None이면 학습된 출현 시간을 사전 정보로 사용합니다.
+        """
+        if expected_after is None and template_path is not None and self.appearance_times is not None:
+            expected_after = self.appearance_times.get(template_path)
+        return PollScheduler(
+            timeout, max_interval=check_interval, expected_after=expected_after, realtime=self.realtime
+        )
+
+    def _record_appearance(self, template_path: Path, scheduler: PollScheduler) -> None:
+        """대기 시작 후 템플릿 발견까지 걸린 시간 기록 (재생 백엔드는 실제 시간이 아니므로 제외)"""
+        if self.appearance_times is not None and self.realtime:
+            self.appearance_times.record(template_path, scheduler.elapsed)
+
+    def _default_region(self, template_path: Path) -> Optional[Tuple[int, int, int, int]]:
+        """
+        템플릿의 기본 검색 영역 (config/template_regions.py, 현재 해상도 기준)
 
-        # 스케일 비율 계산
-        try:
-            template_width, template_height = map(int, template_resolution.split('x'))
-            screen_width, screen_height = map(int, self.screen_resolution.split('x'))
+        Returns:
+            (left, top, width, height) 또는 None (미등록 템플릿 / 기능 비활성화)
+        """
+        if not self.use_default_regions:
+            return None
+
+        screen_width, screen_height = map(int, self.screen_resolution.split('x'))
+        return get_template_region(template_path, screen_width, screen_height)
+
+    def _crop_to_region(
+        self,
+        frame: np.ndarray,
+        origin: Tuple[int, int],
+        region: Tuple[int, int, int, int]
+    ) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        프레임을 화면 절대 좌표 영역으로 잘라내기 (프레임 밖은 제외)
+
+        Returns:
+            (잘라낸 프레임, 잘라낸 프레임 좌상단의 화면 절대 좌표)
+        """
+        frame_h, frame_w = frame.shape[:2]
+        x1 = min(frame_w, max(0, region[0] - origin[0]))
+        y1 = min(frame_h, max(0, region[1] - origin[1]))
+        x2 = min(frame_w, max(x1, region[0] + region[2] - origin[0]))
+        y2 = min(frame_h, max(y1, region[1] + region[3] - origin[1]))
+        return frame[y1:y2, x1:x2], (origin[0] + x1, origin[1] + y1)
+
+    def _grab_frame(
+        self,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = True
+    ) -> np.ndarray:
+        """
+        화면 한 프레임 캡처 (OpenCV 배열)
 
-            scale_x = screen_width / template_width
-            scale_y = screen_height / template_height
+        Args:
+            region: 캡처할 화면 영역 (left, top, width, height). None이면 전체 화면
+            grayscale: True면 그레이스케일, False면 BGR
 
-            # 이미지 로드 및 스케일링
-            img = Image.open(template_path)
-            new_width = int(img.width * scale_x)
-            new_height = int(img.height * scale_y)
+        Returns:
+            캡처된 프레임 배열 (캡처 백엔드 버퍼일 수 있으므로 보관 시 copy 필요)
+        """
+        if self.frame_source is not None and self.frame_source.running:
+            # 이전 폴링에서 매칭한 프레임보다 새로운 프레임 (이미 있으면 대기 없음)
+            # 링 슬롯은 약 (CAPTURE_RING_SIZE - 1) / CAPTURE_FPS 초 뒤 덮어쓰이는데 전체 화면 다중 매칭은
+            # 그보다 오래 걸릴 수 있으므로 항상 복사본으로 매칭 (복사는 수 ms, 매칭은 수백 ms)
+            frame = self.frame_source.next_frame(
+                self._last_frame_seq, region=region, grayscale=grayscale, copy=True
+            )
+            if frame is not None:
+                self._last_frame_seq = frame.seq
+                return frame.image
+            logger.debug("백그라운드 프레임을 받지 못해 직접 캡처합니다")
+
+        return self.capture.grab(region, grayscale)
+
+    def _match_in_frame(
+        self,
+        frame: np.ndarray,
+        template: np.ndarray,
+        origin: Tuple[int, int] = (0, 0),
+        confidence: Optional[float] = None,
+        coarse_template: Optional[np.ndarray] = None,
+        pyramid_scale: Optional[float] = None
+    ) -> Optional[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        캡처된 프레임 안에서 템플릿 매칭 (TM_CCOEFF_NORMED)
 
-            scaled_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        coarse_template과 pyramid_scale이 주어지면 축소 프레임에서 후보를 찾은 뒤
+        후보 주변의 작은 창에서만 원본 해상도로 재검증합니다 (coarse-to-fine).
 
-            # 임시 파일로 저장
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-            scaled_img.save(temp_file.name, 'PNG')
-            temp_file.close()
+        Args:
+            frame: 검색 대상 프레임
+            template: 템플릿 배열 (frame과 같은 채널 수)
+            origin: frame 좌상단의 화면 절대 좌표
+            confidence: 신뢰도 임계값. None이면 self.confidence 사용
+            coarse_template: pyramid_scale로 축소된 템플릿 (선택)
+            pyramid_scale: 축소 배율 (선택)
 
-            logger.debug(f"템플릿 스케일링: {template_resolution} → {self.screen_resolution} (비율: {scale_x:.2f}x)")
+        Returns:
+            ((left, top, width, height), 신뢰도) 또는 None
+        """
+        confidence = self.confidence if confidence is None else confidence
+        template_h, template_w = template.shape[:2]
 
-            return temp_file.name
+        if frame.shape[0] < template_h or frame.shape[1] < template_w:
+            return None
 
-        except Exception as e:
-            logger.warning(f"템플릿 스케일링 실패: {e}, 원본 사용")
-            return str(template_path)
+        if (
+            coarse_template is not None
+            and pyramid_scale
+            and min(coarse_template.shape[:2]) >= TEMPLATE_PYRAMID_MIN_SIZE
+        ):
+            return self._match_pyramid(
+                frame, template, coarse_template, pyramid_scale, origin, confidence
+            )
+
+        result = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+
+        if max_val < confidence:
+            return None
+
+        location = (origin[0] + max_loc[0], origin[1] + max_loc[1], template_w, template_h)
+        return location, max_val
+
+    def _match_pyramid(
+        self,
+        frame: np.ndarray,
+        template: np.ndarray,
+        coarse_template: np.ndarray,
+        scale: float,
+        origin: Tuple[int, int],
+        confidence: float,
+        method: Optional[int] = None,
+        mask: Optional[np.ndarray] = None,
+        coarse_mask: Optional[np.ndarray] = None
+    ) -> Optional[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        피라미드 매칭: 축소 프레임에서 후보 추출 → 원본 해상도 소형 창에서 재검증
+
+        Args:
+            method: 매칭 방식. None이면 TM_CCOEFF_NORMED (마스크 매칭은 TM_CCORR_NORMED)
+            mask: 원본 크기 템플릿 마스크 (선택)
+            coarse_mask: 축소 템플릿 마스크 (선택)
+
+        Returns:
+            ((left, top, width, height), 신뢰도) 또는 None
+        """
+        method = cv2.TM_CCOEFF_NORMED if method is None else method
+        template_h, template_w = template.shape[:2]
+        coarse_h, coarse_w = coarse_template.shape[:2]
+
+        coarse_frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        if coarse_frame.shape[0] < coarse_h or coarse_frame.shape[1] < coarse_w:
+            return None
+
+        # 1. 축소 단계: 임계값을 완화해서 후보 추출 (축소로 인한 점수 하락 보정)
+        coarse_result = _match_map(coarse_frame, coarse_template, method, coarse_mask)
+        candidates = _top_peaks(
+            coarse_result,
+            TEMPLATE_PYRAMID_CANDIDATES,
+            coarse_w,
+            coarse_h,
+            confidence - TEMPLATE_PYRAMID_COARSE_MARGIN
+        )
+
+        # 2. 정밀 단계: 후보 주변 창에서만 원본 해상도로 매칭
+        pad = int(np.ceil(1.0 / scale)) + 2
+        frame_h, frame_w = frame.shape[:2]
+        best = None
+
+        for (coarse_x, coarse_y), _ in candidates:
+            x = int(round(coarse_x / scale))
+            y = int(round(coarse_y / scale))
+
+            x1 = max(0, x - pad)
+            y1 = max(0, y - pad)
+            x2 = min(frame_w, x + template_w + pad)
+            y2 = min(frame_h, y + template_h + pad)
+
+            window = frame[y1:y2, x1:x2]
+            if window.shape[0] < template_h or window.shape[1] < template_w:
+                continue
+
+            result = _match_map(window, template, method, mask)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+
+            if best is None or max_val > best[1]:
+                best = ((x1 + max_loc[0], y1 + max_loc[1]), max_val)
+
+        if best is None or best[1] < confidence:
+            return None
+
+        (x, y), score = best
+        return (origin[0] + x, origin[1] + y, template_w, template_h), score
+
+    def find_template_in_frame(
+        self,
+        frame: np.ndarray,
+        template_path: Path | str,
+        grayscale: bool = True,
+        pyramid_scale: Optional[float] = None,
+        origin: Tuple[int, int] = (0, 0)
+    ) -> Optional[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        이미 캡처된 프레임(녹화 화면 등)에서 템플릿 찾기
+
+        Args:
+            frame: BGR 또는 그레이스케일 프레임
+            template_path: 템플릿 이미지 경로
+            grayscale: 그레이스케일 매칭 여부
+            pyramid_scale: 피라미드 매칭 배율. None이면 self.pyramid_scale 사용
+            origin: frame 좌상단의 화면 절대 좌표
+
+        Returns:
+            ((left, top, width, height), 신뢰도) 또는 None
+        """
+        template_path = Path(template_path)
+        template = self._load_template(template_path, grayscale)
+        if template is None:
+            return None
+
+        if grayscale and frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        pyramid_scale = self.pyramid_scale if pyramid_scale is None else pyramid_scale
+        coarse_template = None
+        if pyramid_scale:
+            coarse_template = self._load_coarse_template(template_path, grayscale, pyramid_scale)
+
+        return self._match_in_frame(
+            frame,
+            template,
+            origin,
+            coarse_template=coarse_template,
+            pyramid_scale=pyramid_scale
+        )
+
+    def _search_frame(
+        self,
+        frame: np.ndarray,
+        origin: Tuple[int, int],
+        template_path: Path,
+        template: np.ndarray,
+        grayscale: bool,
+        pyramid_scale: Optional[float] = None
+    ) -> Optional[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        캡처된 프레임에서 템플릿 검색 (위치 힌트 우선)
+
+        1. 마지막 발견 위치 주변(여백 포함) 소형 창에서 먼저 매칭 (buttons/ui 템플릿만)
+        2. 실패하거나 힌트가 없으면 프레임 전체 매칭 (피라미드 옵션 적용)
+        3. 발견 위치를 힌트로 기록
+
+        Args:
+            frame: 검색 대상 프레임
+            origin: frame 좌상단의 화면 절대 좌표
+            template_path: 템플릿 경로 (힌트/축소 템플릿 조회용)
+            template: 템플릿 배열
+            grayscale: 그레이스케일 여부
+            pyramid_scale: 전체 매칭 시 피라미드 배율 (선택)
+
+        Returns:
+            ((left, top, width, height), 신뢰도) 또는 None
+        """
+        # 위치가 고정된 UI 템플릿만 힌트 사용
+        hints = self.location_hints
+        if template_path.parent.name not in TEMPLATE_HINT_CATEGORIES:
+            hints = None
+
+        if hints is not None:
+            window = self._hint_window(template_path, template.shape, frame.shape, origin)
+            if window is None:
+                hints.record_no_hint()
+            else:
+                x1, y1, x2, y2 = window
+                match = self._match_in_frame(
+                    frame[y1:y2, x1:x2],
+                    template,
+                    (origin[0] + x1, origin[1] + y1)
+                )
+                if match:
+                    hints.record_hit()
+                    return match
+                hints.record_miss()
+
+        coarse_template = None
+        if pyramid_scale:
+            coarse_template = self._load_coarse_template(template_path, grayscale, pyramid_scale)
+
+        match = self._match_in_frame(
+            frame,
+            template,
+            origin,
+            coarse_template=coarse_template,
+            pyramid_scale=pyramid_scale
+        )
+
+        if match and hints is not None:
+            hints.update(template_path, self.screen_resolution, match[0])
+
+        return match
+
+    def _hint_window(
+        self,
+        template_path: Path,
+        template_shape: Tuple[int, ...],
+        frame_shape: Tuple[int, ...],
+        origin: Tuple[int, int]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        위치 힌트 기반 검색 창 계산 (프레임 좌표계)
+
+        Returns:
+            (x1, y1, x2, y2) 또는 None (힌트 없음 / 창이 프레임 밖)
+        """
+        hint = self.location_hints.get(template_path, self.screen_resolution)
+        if hint is None:
+            return None
+
+        template_h, template_w = template_shape[:2]
+        frame_h, frame_w = frame_shape[:2]
+        pad = TEMPLATE_HINT_PADDING
+
+        x1 = max(0, hint[0] - origin[0] - pad)
+        y1 = max(0, hint[1] - origin[1] - pad)
+        x2 = min(frame_w, hint[0] - origin[0] + template_w + pad)
+        y2 = min(frame_h, hint[1] - origin[1] + template_h + pad)
+
+        if x2 - x1 < template_w or y2 - y1 < template_h:
+            return None
+
+        return x1, y1, x2, y2
+
+    def _locate_once(
+        self,
+        template_path: Path,
+        template: np.ndarray,
+        region: Optional[Tuple[int, int, int, int]],
+        grayscale: bool,
+        pyramid_scale: Optional[float] = None
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        템플릿 1회 검색 (재시도 없음)
+
+        OpenCV가 있으면 직접 캡처 + 매칭, 없으면 pyautogui.locateOnScreen 사용
+        """
+        if OPENCV_AVAILABLE:
+            frame = self._grab_frame(region, grayscale)
+            origin = (region[0], region[1]) if region else (0, 0)
+            match = self._search_frame(frame, origin, template_path, template, grayscale, pyramid_scale)
+            if match:
+                logger.debug(f"템플릿 매칭 신뢰도: {template_path.name} = {match[1]:.3f}")
+                return match[0]
+            return None
+
+        if not PYAUTOGUI_AVAILABLE:
+            logger.error("OpenCV와 pyautogui를 모두 사용할 수 없어 템플릿 매칭을 할 수 없습니다")
+            return None
+
+        # OpenCV 없을 때 confidence 없이 매칭 (Pillow 경로는 PIL 이미지 필요)
+        logger.warning("OpenCV가 설치되지 않아 confidence 없이 템플릿 매칭합니다. 'pip install opencv-python' 실행 권장")
+        try:
+            return pyautogui.locateOnScreen(
+                Image.fromarray(template if grayscale else template[:, :, ::-1]),
+                region=region,
+                grayscale=grayscale
+            )
+        except pyautogui.ImageNotFoundException:
+            return None
 
     def find_template(
         self,
         template_path: Path | str,
         region: Optional[Tuple[int, int, int, int]] = None,
-        grayscale: bool = True
+        grayscale: bool = True,
+        pyramid_scale: Optional[float] = None
     ) -> Optional[Tuple[int, int, int, int]]:
         """
         화면에서 템플릿 이미지 찾기
 
         Args:
             template_path: 템플릿 이미지 경로
-            region: 검색할 화면 영역 (left, top, width, height). None이면 전체 화면
+            region: 검색할 화면 영역 (left, top, width, height).
+                    None이면 템플릿별 기본 검색 영역, 미등록 템플릿은 전체 화면
             grayscale: 그레이스케일 변환 여부 (성능 향상)
+            pyramid_scale: 피라미드 매칭 배율 (예: 0.5). None이면 self.pyramid_scale 사용
 
         Returns:
             찾은 위치 (left, top, width, height) 또는 None
@@ -130,65 +611,50 @@ class TemplateMatcher:
             logger.error(f"템플릿 파일이 존재하지 않습니다: {template_path}")
             return None
 
-        # 템플릿 스케일링
-        scaled_template_path = self._scale_template(template_path)
-        if scaled_template_path is None:
+        # 스케일링된 템플릿 로드 (캐시)
+        template = self._load_template(template_path, grayscale)
+        if template is None:
             return None
 
-        start_time = time.time()
-        temp_file_to_cleanup = None if scaled_template_path == str(template_path) else scaled_template_path
+        if region is None:
+            region = self._default_region(template_path)
 
-        try:
-            for attempt in range(self.retry_count):
-                if time.time() - start_time > self.timeout:
-                    logger.warning(f"템플릿 검색 타임아웃: {template_path.name}")
-                    return None
-
-                try:
-                    # OpenCV가 설치되어 있으면 confidence 사용
-                    try:
-                        location = pyautogui.locateOnScreen(
-                            scaled_template_path,
-                            confidence=self.confidence,
-                            region=region,
-                            grayscale=grayscale
-                        )
-                    except TypeError as te:
-                        # OpenCV 없을 때 confidence 없이 재시도
-                        if "confidence" in str(te):
-                            logger.warning("OpenCV가 설치되지 않아 confidence 없이 템플릿 매칭합니다. 'pip install opencv-python' 실행 권장")
-                            location = pyautogui.locateOnScreen(
-                                scaled_template_path,
-                                region=region,
-                                grayscale=grayscale
-                            )
-                        else:
-                            raise
-
-                    if location:
-                        logger.info(f"템플릿 발견: {template_path.name} at {location}")
-                        return location
-
-                except pyautogui.ImageNotFoundException:
-                    pass
-                except Exception as e:
-                    logger.error(f"템플릿 매칭 중 오류 발생: {e}")
-
-                # 재시도 전 짧은 대기
-                if attempt < self.retry_count - 1:
-                    time.sleep(0.5)
-
-            logger.debug(f"템플릿을 찾지 못함: {template_path.name}")
-            return None
+        pyramid_scale = self.pyramid_scale if pyramid_scale is None else pyramid_scale
+
+        # 재시도 창: 기존 재시도 간격(0.5초 × (횟수 - 1)) 안에서 짧은 간격부터 재검색
+        retry_window = min(max(0, self.retry_count - 1) * TEMPLATE_RETRY_WINDOW_PER_RETRY, self.timeout)
+        scheduler = PollScheduler(retry_window, max_interval=TEMPLATE_RETRY_WINDOW_PER_RETRY)
+        attempts = 0
+
+        while True:
+            attempts += 1
+            try:
+                location = self._locate_once(template_path, template, region, grayscale, pyramid_scale)
+                if location:
+                    logger.info(f"템플릿 발견: {template_path.name} at {location}")
+                    return location
+
+            except Exception as e:
+                logger.error(f"템플릿 매칭 중 오류 발생: {e}")
+
+            # 재생 백엔드는 대기 없이 진행하므로 재시도 횟수로 제한
+            if scheduler.expired or (not self.realtime and attempts >= self.retry_count):
+                break
+            self._sleep(scheduler.next_delay())
 
-        finally:
-            # 임시 파일 정리
-            if temp_file_to_cleanup:
-                try:
-                    import os
-                    os.unlink(temp_file_to_cleanup)
-                except:
-                    pass
+        logger.debug(f"템플릿을 찾지 못함: {template_path.name}")
+        return None
+
+    def get_hint_stats(self) -> Dict[str, Any]:
+        """
+        위치 힌트 빠른 경로 통계 반환
+
+        Returns:
+            {"hints", "hits", "misses", "no_hint", "hit_rate"} (힌트 비활성화 시 빈 딕셔너리)
+        """
+        if self.location_hints is None:
+            return {}
+        return self.location_hints.stats()
 
     def find_template_center(
         self,
@@ -216,39 +682,133 @@ class TemplateMatcher:
 
         return None
 
+    def _gate_signature(self, frame: np.ndarray) -> np.ndarray:
+        """프레임 변화 게이트용 블록 평균 시그니처 (WAIT_GATE_BLOCK_SIZE 픽셀 블록)"""
+        height, width = frame.shape[:2]
+        size = (
+            max(1, -(-width // WAIT_GATE_BLOCK_SIZE)),
+            max(1, -(-height // WAIT_GATE_BLOCK_SIZE))
+        )
+        return frame_signature(frame, size)
+
+    def _poll_template(
+        self,
+        template_path: Path,
+        template: np.ndarray,
+        region: Optional[Tuple[int, int, int, int]],
+        grayscale: bool,
+        gate: Dict[str, Any]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        대기 루프용 1회 검색 (프레임 변화 게이트)
+
+        검색 영역을 캡처해서 블록 평균 시그니처만 계산하고,
+        마지막으로 매칭한 프레임과 비교해 바뀐 블록이 없으면 매칭 없이 이전 결과를 반환합니다.
+
+        Args:
+            template_path: 템플릿 경로
+            template: 템플릿 배열
+            region: 검색할 화면 영역
+            grayscale: 그레이스케일 여부
+            gate: 폴링 간 유지되는 게이트 상태 (첫 폴링에는 빈 딕셔너리)
+
+        Returns:
+            찾은 위치 (left, top, width, height) 또는 None
+        """
+        if not OPENCV_AVAILABLE:
+            return self._locate_once(template_path, template, region, grayscale, self.pyramid_scale)
+
+        frame = self._grab_frame(region, grayscale)
+        signature = self._gate_signature(frame)
+
+        previous = gate.get("signature")
+        if previous is not None and signature_max_difference(signature, previous) < WAIT_GATE_THRESHOLD:
+            self.gate_skips += 1
+            return gate["location"]
+
+        origin = (region[0], region[1]) if region else (0, 0)
+        match = self._search_frame(frame, origin, template_path, template, grayscale, self.pyramid_scale)
+        self.gate_matches += 1
+
+        gate["signature"] = signature
+        gate["location"] = match[0] if match else None
+        return gate["location"]
+
+    def _prepare_wait(
+        self,
+        template_path: Path,
+        region: Optional[Tuple[int, int, int, int]],
+        grayscale: bool
+    ) -> Tuple[Optional[np.ndarray], Optional[Tuple[int, int, int, int]]]:
+        """
+        대기 루프 준비 (템플릿 로드 + 기본 검색 영역)
+
+        Returns:
+            (템플릿 배열 또는 None, 검색 영역)
+        """
+        if not template_path.exists():
+            logger.error(f"템플릿 파일이 존재하지 않습니다: {template_path}")
+            return None, region
+
+        template = self._load_template(template_path, grayscale)
+        if region is None:
+            region = self._default_region(template_path)
+        return template, region
+
     def wait_for_template(
         self,
         template_path: Path | str,
         timeout: Optional[int] = None,
         region: Optional[Tuple[int, int, int, int]] = None,
         check_interval: float = 0.5,
-        grayscale: bool = True
+        grayscale: bool = True,
+        expected_after: Optional[float] = None
     ) -> Optional[Tuple[int, int, int, int]]:
         """
         템플릿이 화면에 나타날 때까지 대기
 
+        검색 영역이 마지막 매칭 이후 바뀌지 않은 폴링은 매칭을 생략합니다 (프레임 변화 게이트).
+        폴링 간격은 POLL_MIN_INTERVAL부터 check_interval까지 점점 늘어나며,
+        예상 출현 시간이 있으면 그 전까지는 check_interval 간격으로 폴링합니다.
+
         Args:
             template_path: 템플릿 이미지 경로
             timeout: 대기 시간 (초). None이면 기본값 사용
             region: 검색할 화면 영역
-            check_interval: 확인 간격 (초)
+            check_interval: 최대 확인 간격 (초)
             grayscale: 그레이스케일 변환 여부
+            expected_after: 예상 출현 시간 (초). None이면 학습된 출현 시간 사용
 
         Returns:
             찾은 위치 또는 None (타임아웃)
         """
         timeout = timeout or self.timeout
-        start_time = time.time()
+        template_path = Path(template_path)
+        scheduler = self._scheduler(timeout, check_interval, template_path, expected_after)
+
+        logger.info(f"템플릿 대기 중: {template_path.name}")
+
+        template, region = self._prepare_wait(template_path, region, grayscale)
+        if template is None:
+            return None
 
-        logger.info(f"템플릿 대기 중: {Path(template_path).name}")
+        gate: Dict[str, Any] = {}
+        while True:
+            try:
+                location = self._poll_template(template_path, template, region, grayscale, gate)
+            except Exception as e:
+                logger.error(f"템플릿 매칭 중 오류 발생: {e}")
+                location = None
 
-        while time.time() - start_time < timeout:
-            location = self.find_template(template_path, region, grayscale)
             if location:
+                logger.info(f"템플릿 발견: {template_path.name} at {location}")
+                self._record_appearance(template_path, scheduler)
                 return location
-            time.sleep(check_interval)
+            if scheduler.expired:
+                break
+            self._sleep(scheduler.next_delay())
 
-        logger.warning(f"템플릿 대기 타임아웃: {Path(template_path).name}")
+        logger.warning(f"템플릿 대기 타임아웃: {template_path.name}")
         return None
 
     def wait_for_template_disappear(
@@ -262,31 +822,62 @@ class TemplateMatcher:
         """
         템플릿이 화면에서 사라질 때까지 대기
 
+        검색 영역이 마지막 매칭 이후 바뀌지 않은 폴링은 매칭을 생략합니다 (프레임 변화 게이트).
+
         Args:
             template_path: 템플릿 이미지 경로
             timeout: 대기 시간 (초)
             region: 검색할 화면 영역
-            check_interval: 확인 간격 (초)
+            check_interval: 최대 확인 간격 (초)
             grayscale: 그레이스케일 변환 여부
 
         Returns:
             성공적으로 사라졌으면 True, 타임아웃이면 False
         """
         timeout = timeout or self.timeout
-        start_time = time.time()
+        template_path = Path(template_path)
+        scheduler = self._scheduler(timeout, check_interval)
+
+        logger.info(f"템플릿 소멸 대기 중: {template_path.name}")
+
+        template, region = self._prepare_wait(template_path, region, grayscale)
+        if template is None:
+            # 템플릿을 로드할 수 없으면 화면에서 찾을 수도 없음 (기존 동작과 동일)
+            logger.info(f"템플릿 사라짐: {template_path.name}")
+            return True
 
-        logger.info(f"템플릿 소멸 대기 중: {Path(template_path).name}")
+        gate: Dict[str, Any] = {}
+        while True:
+            try:
+                location = self._poll_template(template_path, template, region, grayscale, gate)
+            except Exception as e:
+                logger.error(f"템플릿 매칭 중 오류 발생: {e}")
+                location = None
 
-        while time.time() - start_time < timeout:
-            location = self.find_template(template_path, region, grayscale)
             if not location:
-                logger.info(f"템플릿 사라짐: {Path(template_path).name}")
+                logger.info(f"템플릿 사라짐: {template_path.name}")
                 return True
-            time.sleep(check_interval)
+            if scheduler.expired:
+                break
+            self._sleep(scheduler.next_delay())
 
-        logger.warning(f"템플릿 소멸 대기 타임아웃: {Path(template_path).name}")
+        logger.warning(f"템플릿 소멸 대기 타임아웃: {template_path.name}")
         return False
 
+    def get_gate_stats(self) -> Dict[str, Any]:
+        """
+        대기 루프 프레임 변화 게이트 통계
+
+        Returns:
+            {"matches", "skips", "skip_rate"}
+        """
+        polls = self.gate_matches + self.gate_skips
+        return {
+            "matches": self.gate_matches,
+            "skips": self.gate_skips,
+            "skip_rate": self.gate_skips / polls if polls else 0.0,
+        }
+
     def template_exists(
         self,
         template_path: Path | str,
@@ -307,12 +898,507 @@ class TemplateMatcher:
         location = self.find_template(template_path, region, grayscale)
         return location is not None
 
+    def find_many(
+        self,
+        templates: Dict[str, Path | str],
+        region: Optional[Tuple[int, int, int, int]] = None,
+        grayscale: bool = True
+    ) -> Dict[str, Optional[Tuple[int, int, int, int]]]:
+        """
+        화면을 한 번만 캡처해서 여러 템플릿을 동시에 찾기 (재시도 없음)
+
+        모든 결과가 같은 시점의 프레임에서 나오므로 조건 간 시차가 없습니다.
+
+        Args:
+            templates: {이름: 템플릿 경로} 딕셔너리
+            region: 캡처/검색할 화면 영역 (left, top, width, height).
+                    None이면 전체 화면을 캡처하고 템플릿별 기본 검색 영역만 매칭
+            grayscale: 그레이스케일 변환 여부
+
+        Returns:
+            {이름: 찾은 위치 (left, top, width, height) 또는 None}
+        """
+        results: Dict[str, Optional[Tuple[int, int, int, int]]] = {}
+        loaded: Dict[str, Tuple[Path, np.ndarray]] = {}
+
+        for name, template_path in templates.items():
+            template_path = Path(template_path)
+            template = self._load_template(template_path, grayscale)
+            results[name] = None
+            if template is not None:
+                loaded[name] = (template_path, template)
+
+        if not loaded:
+            return results
+
+        if not OPENCV_AVAILABLE:
+            # 단일 프레임 매칭 불가 → 템플릿별 개별 검색
+            for name, (template_path, template) in loaded.items():
+                template_region = region or self._default_region(template_path)
+                results[name] = self._locate_once(template_path, template, template_region, grayscale)
+            return results
+
+        try:
+            frame = self._grab_frame(region, grayscale)
+        except Exception as e:
+            logger.error(f"화면 캡처 중 오류 발생: {e}")
+            return results
+
+        origin = (region[0], region[1]) if region else (0, 0)
+
+        for name, (template_path, template) in loaded.items():
+            search_frame, search_origin = frame, origin
+            if region is None:
+                default_region = self._default_region(template_path)
+                if default_region:
+                    search_frame, search_origin = self._crop_to_region(frame, origin, default_region)
+
+            try:
+                match = self._search_frame(
+                    search_frame, search_origin, template_path, template, grayscale, self.pyramid_scale
+                )
+            except Exception as e:
+                logger.error(f"템플릿 매칭 중 오류 발생 ({template_path.name}): {e}")
+                continue
+
+            if match:
+                results[name] = match[0]
+                logger.debug(f"템플릿 발견: {template_path.name} at {match[0]} (신뢰도: {match[1]:.3f})")
+
+        return results
+
+    def find_all_in_frame(
+        self,
+        frame: np.ndarray,
+        template_path: Path | str,
+        threshold: Optional[float] = None,
+        max_results: int = TEMPLATE_FIND_ALL_MAX_RESULTS,
+        grayscale: bool = True,
+        origin: Tuple[int, int] = (0, 0)
+    ) -> List[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        이미 캡처된 프레임에서 템플릿의 모든 인스턴스 찾기 (matchTemplate 1회 + 비최대 억제)
+
+        Args:
+            frame: BGR 또는 그레이스케일 프레임
+            template_path: 템플릿 이미지 경로
+            threshold: 신뢰도 임계값. None이면 self.confidence 사용
+            max_results: 최대 추출 개수
+            grayscale: 그레이스케일 매칭 여부
+            origin: frame 좌상단의 화면 절대 좌표
+
+        Returns:
+            [((left, top, width, height), 신뢰도), ...] 신뢰도 내림차순
+        """
+        template = self._load_template(Path(template_path), grayscale)
+        if template is None:
+            return []
+
+        if grayscale and frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        template_h, template_w = template.shape[:2]
+        if frame.shape[0] < template_h or frame.shape[1] < template_w:
+            return []
+
+        threshold = self.confidence if threshold is None else threshold
+        result = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
+        peaks = _top_peaks(result, max_results, template_w, template_h, threshold)
+
+        return [
+            ((origin[0] + x, origin[1] + y, template_w, template_h), float(score))
+            for (x, y), score in peaks
+        ]
+
+    def find_all(
+        self,
+        template_path: Path | str,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        threshold: Optional[float] = None,
+        max_results: int = TEMPLATE_FIND_ALL_MAX_RESULTS,
+        grayscale: bool = True
+    ) -> List[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        화면에서 템플릿의 모든 인스턴스 찾기 (캡처 1회, 매칭 1회, 재시도 없음)
+
+        발판처럼 같은 템플릿이 여러 개 보이는 경우 모든 위치를 점수와 함께 반환하므로
+        호출하는 쪽에서 조건(거리 등)에 맞는 인스턴스를 고를 수 있습니다.
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            region: 검색할 화면 영역 (left, top, width, height).
+                    None이면 템플릿별 기본 검색 영역, 미등록 템플릿은 전체 화면
+            threshold: 신뢰도 임계값. None이면 self.confidence 사용
+            max_results: 최대 추출 개수
+            grayscale: 그레이스케일 변환 여부
+
+        Returns:
+            [((left, top, width, height), 신뢰도), ...] 신뢰도 내림차순 (없으면 빈 리스트)
+        """
+        template_path = Path(template_path)
+
+        if not template_path.exists():
+            logger.error(f"템플릿 파일이 존재하지 않습니다: {template_path}")
+            return []
+
+        if not OPENCV_AVAILABLE:
+            logger.warning("OpenCV가 없어 다중 매칭을 할 수 없습니다")
+            return []
+
+        if region is None:
+            region = self._default_region(template_path)
+
+        try:
+            frame = self._grab_frame(region, grayscale)
+            origin = (region[0], region[1]) if region else (0, 0)
+            matches = self.find_all_in_frame(
+                frame, template_path, threshold, max_results, grayscale, origin
+            )
+        except Exception as e:
+            logger.error(f"템플릿 매칭 중 오류 발생: {e}")
+            return []
+
+        logger.debug(f"템플릿 {len(matches)}개 발견: {template_path.name}")
+        return matches
+
+    def wait_for_any(
+        self,
+        templates: Dict[str, Path | str],
+        timeout: Optional[int] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        check_interval: float = 0.5,
+        grayscale: bool = True
+    ) -> Optional[Tuple[str, Tuple[int, int, int, int]]]:
+        """
+        여러 템플릿 중 하나라도 나타날 때까지 대기 (폴링당 화면 캡처 1회)
+
+        Args:
+            templates: {이름: 템플릿 경로} 딕셔너리 (같은 프레임에서 동시에 발견되면 앞쪽 우선)
+            timeout: 대기 시간 (초). None이면 기본값 사용
+            region: 검색할 화면 영역
+            check_interval: 최대 확인 간격 (초)
+            grayscale: 그레이스케일 변환 여부
+
+        Returns:
+            (발견된 템플릿 이름, 위치) 또는 None (타임아웃)
+        """
+        timeout = timeout or self.timeout
+        scheduler = self._scheduler(timeout, check_interval)
+
+        logger.info(f"템플릿 대기 중 (하나 이상): {list(templates.keys())}")
+
+        while True:
+            locations = self.find_many(templates, region, grayscale)
+            for name, location in locations.items():
+                if location:
+                    logger.info(f"템플릿 발견: {name} at {location}")
+                    return name, location
+            if scheduler.expired:
+                break
+            self._sleep(scheduler.next_delay())
+
+        logger.warning(f"템플릿 대기 타임아웃: {list(templates.keys())}")
+        return None
+
+    def wait_for_all(
+        self,
+        templates: Dict[str, Path | str],
+        required_matches: Optional[int] = None,
+        timeout: Optional[int] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        check_interval: float = 0.5,
+        grayscale: bool = True
+    ) -> Tuple[bool, Dict[str, Optional[Tuple[int, int, int, int]]]]:
+        """
+        같은 프레임에서 템플릿 N개 중 k개 이상이 동시에 보일 때까지 대기
+
+        Args:
+            templates: {이름: 템플릿 경로} 딕셔너리
+            required_matches: 필요한 최소 매칭 개수 (k). None이면 전부
+            timeout: 대기 시간 (초). None이면 기본값 사용
+            region: 검색할 화면 영역
+            check_interval: 최대 확인 간격 (초)
+            grayscale: 그레이스케일 변환 여부
+
+        Returns:
+            (조건 충족 여부, 마지막 프레임의 {이름: 위치 또는 None})
+        """
+        timeout = timeout or self.timeout
+        required = len(templates) if required_matches is None else required_matches
+        scheduler = self._scheduler(timeout, check_interval)
+        locations: Dict[str, Optional[Tuple[int, int, int, int]]] = {name: None for name in templates}
+
+        logger.info(f"템플릿 대기 중 ({required}/{len(templates)}개 이상): {list(templates.keys())}")
+
+        while True:
+            locations = self.find_many(templates, region, grayscale)
+            match_count = sum(1 for location in locations.values() if location)
+            if match_count >= required:
+                return True, locations
+            if scheduler.expired:
+                break
+            self._sleep(scheduler.next_delay())
+
+        logger.warning(f"템플릿 대기 타임아웃 ({required}/{len(templates)}개 미충족): {list(templates.keys())}")
+        return False, locations
+
+    # ------------------------------------------------------------------
+    # asyncio API
+    # 캡처/매칭은 캡처 전용 단일 스레드 실행기에서 폴링 1회 단위로 실행하고,
+    # 폴링 간 대기는 asyncio.sleep이므로 이벤트 루프의 다른 코루틴이 함께 진행됩니다.
+    # 코루틴이 취소되면 진행 중인 폴링 1회가 끝난 뒤 더 이상 폴링하지 않습니다.
+    # ------------------------------------------------------------------
+
+    async def _async_sleep(self, seconds: float) -> None:
+        """폴링 간 비동기 대기 (재생 백엔드에서는 다른 코루틴에 양보만)"""
+        await asyncio.sleep(seconds if self.realtime else 0)
+
+    async def await_template(
+        self,
+        template_path: Path | str,
+        timeout: Optional[float] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        check_interval: float = 0.5,
+        grayscale: bool = True,
+        expected_after: Optional[float] = None
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        템플릿이 화면에 나타날 때까지 비동기 대기 (wait_for_template의 asyncio 버전)
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            timeout: 대기 시간 (초). None이면 기본값 사용
+            region: 검색할 화면 영역
+            check_interval: 최대 확인 간격 (초)
+            grayscale: 그레이스케일 변환 여부
+            expected_after: 예상 출현 시간 (초). None이면 학습된 출현 시간 사용
+
+        Returns:
+            찾은 위치 또는 None (타임아웃)
+        """
+        template_path = Path(template_path)
+        scheduler = self._scheduler(timeout or self.timeout, check_interval, template_path, expected_after)
+
+        logger.info(f"템플릿 대기 중 (async): {template_path.name}")
+
+        template, region = self._prepare_wait(template_path, region, grayscale)
+        if template is None:
+            return None
+
+        gate: Dict[str, Any] = {}
+        while True:
+            try:
+                location = await run_in_capture_executor(
+                    self._poll_template, template_path, template, region, grayscale, gate
+                )
+            except Exception as e:
+                logger.error(f"템플릿 매칭 중 오류 발생: {e}")
+                location = None
+
+            if location:
+                logger.info(f"템플릿 발견: {template_path.name} at {location}")
+                self._record_appearance(template_path, scheduler)
+                return location
+            if scheduler.expired:
+                break
+            await self._async_sleep(scheduler.next_delay())
+
+        logger.warning(f"템플릿 대기 타임아웃: {template_path.name}")
+        return None
+
+    async def await_disappear(
+        self,
+        template_path: Path | str,
+        timeout: Optional[float] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        check_interval: float = 0.5,
+        grayscale: bool = True
+    ) -> bool:
+        """
+        템플릿이 화면에서 사라질 때까지 비동기 대기 (wait_for_template_disappear의 asyncio 버전)
+
+        Args:
+            template_path: 템플릿 이미지 경로
+            timeout: 대기 시간 (초). None이면 기본값 사용
+            region: 검색할 화면 영역
+            check_interval: 최대 확인 간격 (초)
+            grayscale: 그레이스케일 변환 여부
+
+        Returns:
+            사라졌으면 True, 타임아웃이면 False
+        """
+        template_path = Path(template_path)
+        scheduler = self._scheduler(timeout or self.timeout, check_interval)
+
+        logger.info(f"템플릿 소멸 대기 중 (async): {template_path.name}")
+
+        template, region = self._prepare_wait(template_path, region, grayscale)
+        if template is None:
+            logger.info(f"템플릿 사라짐: {template_path.name}")
+            return True
+
+        gate: Dict[str, Any] = {}
+        while True:
+            try:
+                location = await run_in_capture_executor(
+                    self._poll_template, template_path, template, region, grayscale, gate
+                )
+            except Exception as e:
+                logger.error(f"템플릿 매칭 중 오류 발생: {e}")
+                location = None
+
+            if not location:
+                logger.info(f"템플릿 사라짐: {template_path.name}")
+                return True
+            if scheduler.expired:
+                break
+            await self._async_sleep(scheduler.next_delay())
+
+        logger.warning(f"템플릿 소멸 대기 타임아웃: {template_path.name}")
+        return False
+
+    async def await_any(
+        self,
+        templates: Dict[str, Path | str],
+        timeout: Optional[float] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        check_interval: float = 0.5,
+        grayscale: bool = True
+    ) -> Optional[Tuple[str, Tuple[int, int, int, int]]]:
+        """
+        여러 템플릿 중 하나라도 나타날 때까지 비동기 대기 (wait_for_any의 asyncio 버전)
+
+        Args:
+            templates: {이름: 템플릿 경로} 딕셔너리 (같은 프레임에서 동시에 발견되면 앞쪽 우선)
+            timeout: 대기 시간 (초). None이면 기본값 사용
+            region: 검색할 화면 영역
+            check_interval: 최대 확인 간격 (초)
+            grayscale: 그레이스케일 변환 여부
+
+        Returns:
+            (발견된 템플릿 이름, 위치) 또는 None (타임아웃)
+        """
+        scheduler = self._scheduler(timeout or self.timeout, check_interval)
+
+        logger.info(f"템플릿 대기 중 (async, 하나 이상): {list(templates.keys())}")
+
+        while True:
+            locations = await run_in_capture_executor(self.find_many, templates, region, grayscale)
+            for name, location in locations.items():
+                if location:
+                    logger.info(f"템플릿 발견: {name} at {location}")
+                    return name, location
+            if scheduler.expired:
+                break
+            await self._async_sleep(scheduler.next_delay())
+
+        logger.warning(f"템플릿 대기 타임아웃: {list(templates.keys())}")
+        return None
+
+    # ------------------------------------------------------------------
+    # 마스크 매칭 (TM_CCORR_NORMED)
+    # 템플릿/마스크는 템플릿 캐시에서 한 번만 전처리합니다
+    # (알파 채널 분리, 현재 해상도 스케일링, 마스크 이진화, 그레이스케일/축소 변형).
+    # ------------------------------------------------------------------
+
+    def _load_masked(
+        self,
+        template_path: Path,
+        mask_path: Optional[Path],
+        grayscale: bool,
+        scale: float = 1.0
+    ) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """마스크 매칭용 (템플릿, 이진 마스크) 로드 (캐시, 현재 해상도 스케일링)"""
+        target_resolution = self.screen_resolution if self.auto_scale else None
+        return self.template_cache.get_masked(template_path, mask_path, target_resolution, grayscale, scale)
+
+    def _check_masked_paths(self, template_path: Path, mask_path: Optional[Path]) -> bool:
+        """마스크 매칭 사용 가능 여부 (OpenCV, 템플릿/마스크 파일 존재)"""
+        if not OPENCV_AVAILABLE:
+            logger.error("OpenCV가 설치되지 않아 마스크 기반 매칭을 사용할 수 없습니다.")
+            return False
+
+        if not template_path.exists():
+            logger.error(f"템플릿 파일이 존재하지 않습니다: {template_path}")
+            return False
+
+        if mask_path is not None and not mask_path.exists():
+            logger.error(f"마스크 파일이 존재하지 않습니다: {mask_path}")
+            return False
+
+        return True
+
+    def find_template_with_mask_in_frame(
+        self,
+        frame: np.ndarray,
+        template_path: Path | str,
+        mask_path: Optional[Path | str] = None,
+        threshold: Optional[float] = None,
+        grayscale: bool = False,
+        pyramid_scale: Optional[float] = None,
+        origin: Tuple[int, int] = (0, 0)
+    ) -> Optional[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        이미 캡처된 프레임에서 마스크 기반 템플릿 찾기
+
+        Args:
+            frame: BGR 또는 그레이스케일 프레임
+            template_path: 템플릿 이미지 경로
+            mask_path: 마스크 이미지 경로 (None이면 템플릿의 알파 채널 사용)
+            threshold: 매칭 임계값. None이면 self.confidence 사용
+            grayscale: 그레이스케일 매칭 여부
+            pyramid_scale: 피라미드 매칭 배율. None이면 self.pyramid_scale 사용
+            origin: frame 좌상단의 화면 절대 좌표
+
+        Returns:
+            ((left, top, width, height), 신뢰도) 또는 None
+        """
+        template_path = Path(template_path)
+        mask_path = Path(mask_path) if mask_path is not None else None
+
+        loaded = self._load_masked(template_path, mask_path, grayscale)
+        if loaded is None:
+            logger.error(f"템플릿 이미지를 로드할 수 없습니다: {template_path}")
+            return None
+        template, mask = loaded
+
+        if grayscale and frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        template_h, template_w = template.shape[:2]
+        if frame.shape[0] < template_h or frame.shape[1] < template_w:
+            return None
+
+        threshold = self.confidence if threshold is None else threshold
+        pyramid_scale = self.pyramid_scale if pyramid_scale is None else pyramid_scale
+
+        if pyramid_scale:
+            coarse = self._load_masked(template_path, mask_path, grayscale, pyramid_scale)
+            if coarse is not None and min(coarse[0].shape[:2]) >= TEMPLATE_PYRAMID_MIN_SIZE:
+                return self._match_pyramid(
+                    frame, template, coarse[0], pyramid_scale, origin, threshold,
+                    cv2.TM_CCORR_NORMED, mask, coarse[1]
+                )
+
+        result = _match_map(frame, template, cv2.TM_CCORR_NORMED, mask)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+
+        if max_val < threshold:
+            logger.debug(f"마스크 기반 템플릿 매칭 실패: {template_path.name} "
+                         f"(최고 신뢰도: {max_val:.3f} < {threshold:.3f})")
+            return None
+
+        location = (origin[0] + max_loc[0], origin[1] + max_loc[1], template_w, template_h)
+        return location, float(max_val)
+
     def find_template_with_mask(
         self,
         template_path: Path | str,
         mask_path: Optional[Path | str] = None,
         region: Optional[Tuple[int, int, int, int]] = None,
-        threshold: Optional[float] = None
+        threshold: Optional[float] = None,
+        grayscale: bool = False,
+        pyramid_scale: Optional[float] = None
     ) -> Optional[Tuple[int, int, int, int]]:
         """
         마스크를 사용한 템플릿 매칭 (OpenCV 필요)
@@ -324,91 +1410,130 @@ class TemplateMatcher:
             template_path: 템플릿 이미지 경로
             mask_path: 마스크 이미지 경로 (흰색=매칭, 검은색=무시)
                        None이면 템플릿의 알파 채널을 마스크로 사용
-            region: 검색할 화면 영역 (left, top, width, height)
+            region: 검색할 화면 영역 (left, top, width, height).
+                    None이면 템플릿별 기본 검색 영역, 미등록 템플릿은 전체 화면
             threshold: 매칭 임계값 (0.0 ~ 1.0). None이면 self.confidence 사용
+            grayscale: 그레이스케일 매칭 여부 (빠르지만 색상 구분력 감소)
+            pyramid_scale: 피라미드 매칭 배율 (예: 0.5). None이면 self.pyramid_scale 사용
 
         Returns:
             찾은 위치 (left, top, width, height) 또는 None
         """
-        if not OPENCV_AVAILABLE:
-            logger.error("OpenCV가 설치되지 않아 마스크 기반 매칭을 사용할 수 없습니다.")
-            return None
-
         template_path = Path(template_path)
+        mask_path = Path(mask_path) if mask_path is not None else None
 
-        if not template_path.exists():
-            logger.error(f"템플릿 파일이 존재하지 않습니다: {template_path}")
+        if not self._check_masked_paths(template_path, mask_path):
             return None
 
-        threshold = threshold or self.confidence
+        if region is None:
+            region = self._default_region(template_path)
 
         try:
-            # 화면 캡처
-            screenshot = pyautogui.screenshot(region=region)
-            screenshot_np = np.array(screenshot)
-            screenshot_cv = cv2.cvtColor(screenshot_np, cv2.COLOR_RGB2BGR)
-
-            # 템플릿 로드 (알파 채널 포함)
-            template_with_alpha = cv2.imread(str(template_path), cv2.IMREAD_UNCHANGED)
-
-            if template_with_alpha is None:
-                logger.error(f"템플릿 이미지를 로드할 수 없습니다: {template_path}")
-                return None
-
-            # 마스크 처리
-            mask = None
-            if mask_path is not None:
-                # 명시적으로 마스크 파일이 제공된 경우
-                mask_path = Path(mask_path)
-                if not mask_path.exists():
-                    logger.error(f"마스크 파일이 존재하지 않습니다: {mask_path}")
-                    return None
-                mask = cv2.imread(str(mask_path), cv2.IMREAD_GRAYSCALE)
-                if mask is None:
-                    logger.error(f"마스크 이미지를 로드할 수 없습니다: {mask_path}")
-                    return None
-                logger.debug(f"외부 마스크 파일 사용: {mask_path.name}")
-            elif template_with_alpha.shape[2] == 4:
-                # 템플릿에 알파 채널이 있는 경우 (투명 PNG)
-                # 알파 채널을 마스크로 사용
-                mask = template_with_alpha[:, :, 3]
-                logger.debug("템플릿의 알파 채널을 마스크로 사용")
-            else:
-                # 마스크 없음
-                logger.warning("마스크가 제공되지 않았고 템플릿에 알파 채널도 없습니다. 일반 매칭으로 진행합니다.")
+            frame = self._grab_frame(region, grayscale)
+            origin = (region[0], region[1]) if region else (0, 0)
+            match = self.find_template_with_mask_in_frame(
+                frame, template_path, mask_path, threshold, grayscale, pyramid_scale, origin
+            )
+        except Exception as e:
+            logger.error(f"마스크 기반 템플릿 매칭 중 오류 발생: {e}")
+            return None
 
-            # 템플릿을 BGR로 변환 (알파 채널 제거)
-            if template_with_alpha.shape[2] == 4:
-                template = cv2.cvtColor(template_with_alpha, cv2.COLOR_BGRA2BGR)
-            else:
-                template = template_with_alpha
+        if match is None:
+            return None
 
-            # 템플릿 매칭 (TM_CCORR_NORMED 방식, 마스크 지원)
-            result = cv2.matchTemplate(screenshot_cv, template, cv2.TM_CCORR_NORMED, mask=mask)
+        location, score = match
+        logger.info(f"마스크 기반 템플릿 발견: {template_path.name} at {location} (신뢰도: {score:.3f})")
+        return location
 
-            # 최대값 위치 찾기
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+    def find_all_with_mask_in_frame(
+        self,
+        frame: np.ndarray,
+        template_path: Path | str,
+        mask_path: Optional[Path | str] = None,
+        threshold: Optional[float] = None,
+        max_results: int = TEMPLATE_FIND_ALL_MAX_RESULTS,
+        grayscale: bool = False,
+        origin: Tuple[int, int] = (0, 0)
+    ) -> List[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        이미 캡처된 프레임에서 마스크 기반 템플릿의 모든 인스턴스 찾기 (매칭 1회 + 비최대 억제)
 
-            # 임계값 확인
-            if max_val >= threshold:
-                # 템플릿 크기
-                h, w = template.shape[:2]
+        Args:
+            frame: BGR 또는 그레이스케일 프레임
+            template_path: 템플릿 이미지 경로
+            mask_path: 마스크 이미지 경로 (None이면 템플릿의 알파 채널 사용)
+            threshold: 매칭 임계값. None이면 self.confidence 사용
+            max_results: 최대 추출 개수
+            grayscale: 그레이스케일 매칭 여부
+            origin: frame 좌상단의 화면 절대 좌표
 
-                # region이 지정되어 있으면 절대 좌표로 변환
-                if region:
-                    left = region[0] + max_loc[0]
-                    top = region[1] + max_loc[1]
-                else:
-                    left = max_loc[0]
-                    top = max_loc[1]
+        Returns:
+            [((left, top, width, height), 신뢰도), ...] 신뢰도 내림차순
+        """
+        loaded = self._load_masked(
+            Path(template_path), Path(mask_path) if mask_path is not None else None, grayscale
+        )
+        if loaded is None:
+            return []
+        template, mask = loaded
+
+        if grayscale and frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        template_h, template_w = template.shape[:2]
+        if frame.shape[0] < template_h or frame.shape[1] < template_w:
+            return []
+
+        threshold = self.confidence if threshold is None else threshold
+        result = _match_map(frame, template, cv2.TM_CCORR_NORMED, mask)
+        peaks = _top_peaks(result, max_results, template_w, template_h, threshold)
+
+        return [
+            ((origin[0] + x, origin[1] + y, template_w, template_h), float(score))
+            for (x, y), score in peaks
+        ]
+
+    def find_all_with_mask(
+        self,
+        template_path: Path | str,
+        mask_path: Optional[Path | str] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        threshold: Optional[float] = None,
+        max_results: int = TEMPLATE_FIND_ALL_MAX_RESULTS,
+        grayscale: bool = False
+    ) -> List[Tuple[Tuple[int, int, int, int], float]]:
+        """
+        화면에서 마스크 기반 템플릿의 모든 인스턴스 찾기 (캡처 1회, 매칭 1회)
 
-                location = (left, top, w, h)
-                logger.info(f"마스크 기반 템플릿 발견: {template_path.name} at {location} (신뢰도: {max_val:.3f})")
-                return location
-            else:
-                logger.debug(f"마스크 기반 템플릿 매칭 실패: {template_path.name} (최고 신뢰도: {max_val:.3f} < {threshold:.3f})")
-                return None
+        Args:
+            template_path: 템플릿 이미지 경로
+            mask_path: 마스크 이미지 경로 (None이면 템플릿의 알파 채널 사용)
+            region: 검색할 화면 영역. None이면 템플릿별 기본 검색 영역, 미등록 템플릿은 전체 화면
+            threshold: 매칭 임계값. None이면 self.confidence 사용
+            max_results: 최대 추출 개수
+            grayscale: 그레이스케일 매칭 여부
+
+        Returns:
+            [((left, top, width, height), 신뢰도), ...] 신뢰도 내림차순 (없으면 빈 리스트)
+        """
+        template_path = Path(template_path)
+        mask_path = Path(mask_path) if mask_path is not None else None
+
+        if not self._check_masked_paths(template_path, mask_path):
+            return []
+
+        if region is None:
+            region = self._default_region(template_path)
 
+        try:
+            frame = self._grab_frame(region, grayscale)
+            origin = (region[0], region[1]) if region else (0, 0)
+            matches = self.find_all_with_mask_in_frame(
+                frame, template_path, mask_path, threshold, max_results, grayscale, origin
+            )
         except Exception as e:
             logger.error(f"마스크 기반 템플릿 매칭 중 오류 발생: {e}")
-            return None
+            return []
+
+        logger.debug(f"마스크 기반 템플릿 {len(matches)}개 발견: {template_path.name}")
+        return matches
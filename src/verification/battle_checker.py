@@ -160,34 +160,30 @@ class BattleChecker:
         if defeat_template is None:
             defeat_template = UI_DIR / "defeat.png"
 
-        # 전투 종료 대기
-        check_interval = 2.0  # 2초마다 확인
-        elapsed = 0
-
-        while elapsed < timeout:
-            # 승리 화면 확인
-            if self.matcher.template_exists(victory_template):
-                result["battle_ended"] = True
-                result["success"] = True
-                result["result"] = "victory"
-                result["duration"] = time.time() - start_time
+        # 전투 종료 대기 (승리/패배 화면을 같은 프레임에서 동시에 확인)
+        ended = self.matcher.wait_for_any(
+            {
+                "victory": victory_template,
+                "defeat": defeat_template,
+            },
+            timeout=timeout,
+            check_interval=2.0  # 2초마다 확인
+        )
+
+        if ended:
+            outcome, _ = ended
+            result["battle_ended"] = True
+            result["success"] = True
+            result["result"] = outcome
+            result["duration"] = time.time() - start_time
+
+            if outcome == "victory":
                 result["message"] = "전투 승리"
                 logger.info(f"{result['message']} (소요시간: {result['duration']:.1f}초)")
-                return result
-
-            # 패배 화면 확인
-            if self.matcher.template_exists(defeat_template):
-                result["battle_ended"] = True
-                result["success"] = True
-                result["result"] = "defeat"
-                result["duration"] = time.time() - start_time
+            else:
                 result["message"] = "전투 패배"
                 logger.warning(f"{result['message']} (소요시간: {result['duration']:.1f}초)")
-                return result
-
-            time.sleep(check_interval)
-            elapsed = time.time() - start_time
-            logger.debug(f"전투 진행 중... ({elapsed:.0f}/{timeout}초)")
+            return result
 
         # 타임아웃
         result["duration"] = timeout
@@ -260,52 +256,45 @@ class BattleChecker:
             "pause_button": BUTTONS_DIR / "pause_button.png"
         }
 
-        # 시작 시간
-        start_time = time.time()
-        check_interval = 0.5  # 0.5초마다 확인
-
-        while time.time() - start_time < timeout:
-            conditions_met = {}
-            match_count = 0
-
-            # 각 UI 요소 확인
-            for element_name, template_path in battle_elements.items():
-                try:
-                    # 템플릿 파일 존재 확인
-                    if not Path(template_path).exists():
-                        logger.warning(f"템플릿 파일 없음: {template_path} (건너뜀)")
-                        conditions_met[element_name] = None  # 파일 없음
-                        continue
-
-                    # 템플릿 매칭 시도
-                    exists = self.matcher.template_exists(template_path)
-                    conditions_met[element_name] = exists
-
-                    if exists:
-                        match_count += 1
-                        logger.info(f"✓ {element_name} 인식 성공")
-                    else:
-                        logger.debug(f"✗ {element_name} 인식 실패")
-
-                except Exception as e:
-                    logger.warning(f"{element_name} 확인 중 오류: {e}")
-                    conditions_met[element_name] = False
-
-            # 결과 업데이트
-            result["conditions_met"] = conditions_met
-            result["match_count"] = match_count
-
-            # 충분한 조건 충족 시 성공
-            if match_count >= required_matches:
-                result["battle_started"] = True
-                result["success"] = True
-                result["message"] = f"전투 진입 확인 ({match_count}/{len(battle_elements)}개 조건 충족)"
-                logger.info(result["message"])
-                logger.info(f"충족 조건: {[k for k, v in conditions_met.items() if v is True]}")
-                return result
+        # 템플릿 파일 존재 확인
+        conditions_met = {}
+        available_elements = {}
+        for element_name, template_path in battle_elements.items():
+            if not Path(template_path).exists():
+                logger.warning(f"템플릿 파일 없음: {template_path} (건너뜀)")
+                conditions_met[element_name] = None  # 파일 없음
+            else:
+                available_elements[element_name] = template_path
+
+        # 각 UI 요소를 같은 프레임에서 동시에 확인 (0.5초마다)
+        matched, locations = self.matcher.wait_for_all(
+            available_elements,
+            required_matches=required_matches,
+            timeout=timeout,
+            check_interval=0.5
+        )
+
+        for element_name, location in locations.items():
+            conditions_met[element_name] = location is not None
+            if location:
+                logger.info(f"✓ {element_name} 인식 성공")
+            else:
+                logger.debug(f"✗ {element_name} 인식 실패")
+
+        match_count = sum(1 for v in conditions_met.values() if v is True)
 
-            # 재시도 대기
-            time.sleep(check_interval)
+        # 결과 업데이트
+        result["conditions_met"] = conditions_met
+        result["match_count"] = match_count
+
+        # 충분한 조건 충족 시 성공
+        if matched:
+            result["battle_started"] = True
+            result["success"] = True
+            result["message"] = f"전투 진입 확인 ({match_count}/{len(battle_elements)}개 조건 충족)"
+            logger.info(result["message"])
+            logger.info(f"충족 조건: {[k for k, v in conditions_met.items() if v is True]}")
+            return result
 
         # 타임아웃
         result["message"] = f"전투 진입 확인 실패 (타임아웃: {match_count}/{required_matches}개 조건만 충족)"
@@ -209,7 +209,7 @@ class SkillChecker:
 
             # 순차 실행이면 다음 스킬까지 대기
             if sequential:
-                time.sleep(SKILL_CHECK_INTERVAL)
+                self.controller.wait(SKILL_CHECK_INTERVAL)
 
         # 전체 성공 여부
         result["success"] = result["failed_skills"] == 0
@@ -251,7 +251,7 @@ class SkillChecker:
             screenshot: 화면 이미지 (None이면 자동 캡처)
 
         Returns:
-            코스트 값 (2~5) 또는 None (읽기 실패 시)
+            코스트 값 (2~5) 또는 None (읽기 실패 시, 템플릿이 없는 0, 1, 6~10 포함)
         """
         if not self.enable_cost_check or not self.cost_recognizer:
             logger.warning("코스트 인식이 비활성화되어 있습니다")
@@ -262,11 +262,12 @@ class SkillChecker:
             if screenshot is None:
                 screenshot = self.controller.screenshot()
 
-            # 템플릿 매칭으로 코스트 인식
+            # 템플릿 매칭으로 코스트 인식 (템플릿이 없는 값은 가장 비슷한 2~5로 분류하지 않고 거부)
             cost, confidence = self.cost_recognizer.recognize_cost_from_screenshot(
                 screenshot,
                 region=BATTLE_COST_VALUE_REGION,
-                confidence_threshold=0.6
+                confidence_threshold=CostRecognizer.GAUGE_CONFIDENCE_THRESHOLD,
+                min_margin=CostRecognizer.GAUGE_MIN_MARGIN
             )
 
             if cost is not None:
@@ -441,7 +442,7 @@ class SkillChecker:
 
         # 3. 스킬 사용 후 코스트 검증
         if self.enable_cost_check:
-            time.sleep(0.5)  # 코스트 UI 업데이트 대기
+            self.controller.wait(0.5)  # 코스트 UI 업데이트 대기
             after_screen = self.controller.screenshot()
 
             cost_check = self.verify_cost_consumption(
@@ -635,7 +636,7 @@ class SkillChecker:
                 end_y=SCREEN_CENTER_Y,
                 duration=0.5  # 0.5초 동안 드래그
             )
-            time.sleep(TARGET_CLICK_TO_COST_UPDATE_WAIT)
+            self.controller.wait(TARGET_CLICK_TO_COST_UPDATE_WAIT)
 
             # 6. 사용 후 코스트 읽기
             screenshot_after = self.controller.screenshot()
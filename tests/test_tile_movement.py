@@ -19,6 +19,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.recognition.template_matcher import TemplateMatcher
+from src.recognition.marker_tracker import MarkerTracker
 from src.automation.game_controller import GameController
 from src.verification.battle_checker import BattleChecker
 from src.logger.test_logger import TestLogger
@@ -63,19 +64,12 @@ def check_templates():
     return True, use_mask_file
 
 
-def find_character_marker(matcher, use_mask_file, logger):
-    """캐릭터 마커 위치 확인"""
+def find_character_marker(tracker, logger):
+    """캐릭터 마커 위치 확인 (전체 화면 검색 1회, 이후 추적 기준)"""
     print(f"\n[1단계] 캐릭터 마커 위치 확인...")
     print("신뢰도: 0.6")
 
-    character_marker = ICONS_DIR / "character_marker.png"
-    character_marker_mask = ICONS_DIR / "character_marker_mask.png"
-
-    # 마스크 파일이 있으면 사용, 없으면 알파 채널 또는 일반 매칭
-    if use_mask_file:
-        initial_marker_pos = matcher.find_template_with_mask(character_marker, character_marker_mask)
-    else:
-        initial_marker_pos = matcher.find_template_with_mask(character_marker)
+    initial_marker_pos = tracker.locate()
 
     character_x = None
     character_y = None
@@ -109,8 +103,22 @@ def is_within_range(tile_location, char_x, char_y, max_distance=300):
     return distance <= max_distance
 
 
+def find_nearest_tile(tiles, char_x, char_y):
+    """find_all 결과 중 캐릭터 주변 반경 내에서 가장 가까운 발판 (캐릭터 위치를 모르면 최고 신뢰도)"""
+    nearby = [location for location, _ in tiles if is_within_range(location, char_x, char_y)]
+    if not nearby or char_x is None or char_y is None:
+        return nearby[0] if nearby else None
+
+    def distance(location):
+        center_x = location[0] + location[2] // 2
+        center_y = location[1] + location[3] // 2
+        return (center_x - char_x) ** 2 + (center_y - char_y) ** 2
+
+    return min(nearby, key=distance)
+
+
 def find_nearby_tile(matcher, character_x, character_y, logger):
-    """캐릭터 주변 발판 찾기 (적 우선 탐색)"""
+    """캐릭터 주변 발판 찾기 (적 우선 탐색, 화면의 모든 발판 중 가장 가까운 발판)"""
     print(f"\n[2단계] 캐릭터 주변 발판 찾기 (적 우선 탐색)...")
     if character_x is not None:
         print(f"  캐릭터 위치: ({character_x}, {character_y})")
@@ -123,31 +131,33 @@ def find_nearby_tile(matcher, character_x, character_y, logger):
     tile_to_click = None
 
     # 1. 먼저 적이 있는 발판 찾기
-    enemy_location = matcher.find_template(enemy_tile)
+    enemy_tiles = matcher.find_all(enemy_tile)
+    enemy_location = find_nearest_tile(enemy_tiles, character_x, character_y)
 
-    if enemy_location and is_within_range(enemy_location, character_x, character_y):
-        print(f"✓ 캐릭터 주변 적 발판 발견: {enemy_location}")
+    if enemy_location:
+        print(f"✓ 캐릭터 주변 적 발판 발견: {enemy_location} (화면 내 적 발판 {len(enemy_tiles)}개)")
         has_enemy = True
         tile_to_click = enemy_location
         logger.log_check("발판_탐색", True, f"적 발판 발견: {enemy_location}")
     else:
-        if enemy_location:
-            print(f"ℹ 적 발판이 있지만 캐릭터 주변 범위 밖: {enemy_location}")
+        if enemy_tiles:
+            print(f"ℹ 적 발판 {len(enemy_tiles)}개가 있지만 모두 캐릭터 주변 범위 밖")
         else:
             print("ℹ 적 발판 없음")
 
         # 2. 적이 없거나 범위 밖이면 빈 발판 찾기
         print("  → 빈 발판 찾는 중...")
-        empty_location = matcher.find_template(empty_tile)
+        empty_tiles = matcher.find_all(empty_tile)
+        empty_location = find_nearest_tile(empty_tiles, character_x, character_y)
 
-        if empty_location and is_within_range(empty_location, character_x, character_y):
-            print(f"✓ 캐릭터 주변 빈 발판 발견: {empty_location}")
+        if empty_location:
+            print(f"✓ 캐릭터 주변 빈 발판 발견: {empty_location} (화면 내 빈 발판 {len(empty_tiles)}개)")
             has_enemy = False
             tile_to_click = empty_location
             logger.log_check("발판_탐색", True, f"빈 발판 발견: {empty_location}")
         else:
-            if empty_location:
-                print(f"✗ 빈 발판이 있지만 캐릭터 주변 범위 밖: {empty_location}")
+            if empty_tiles:
+                print(f"✗ 빈 발판 {len(empty_tiles)}개가 있지만 모두 캐릭터 주변 범위 밖")
             else:
                 print("✗ 빈 발판 없음")
             logger.log_check("발판_탐색", False, "캐릭터 주변에 이동 가능한 발판 없음")
@@ -189,21 +199,17 @@ def click_tile(controller, tile_to_click, has_enemy, logger):
         return False
 
 
-def verify_character_moved(matcher, use_mask_file, initial_marker_pos, logger):
-    """캐릭터 이동 확인 (마커 위치 변경 검증)"""
+def verify_character_moved(tracker, initial_marker_pos, logger):
+    """캐릭터 이동 확인 (마커 위치 변경 검증, 프레임마다 마커 주변만 추적)"""
     if initial_marker_pos is None:
         return True  # 마커를 찾지 못했으면 검증 스킵
 
     print("\n[3.5단계] 캐릭터 이동 확인 중...")
 
-    character_marker = ICONS_DIR / "character_marker.png"
-    character_marker_mask = ICONS_DIR / "character_marker_mask.png"
-
-    # 새로운 마커 위치 찾기 (마스크 파일 또는 알파 채널 사용)
-    if use_mask_file:
-        final_marker_pos = matcher.find_template_with_mask(character_marker, character_marker_mask)
-    else:
-        final_marker_pos = matcher.find_template_with_mask(character_marker)
+    # 마커가 이동을 마칠 때까지 추적 (예측 위치 주변만 검색, 놓치면 전체 화면 재검색)
+    _, final_marker_pos = tracker.wait_for_move(initial_marker_pos)
+    stats = tracker.stats()
+    print(f"  추적: 국소 검색 {stats['local_searches']}회, 전체 검색 {stats['global_searches']}회")
 
     if not final_marker_pos:
         print("⚠ 이동 후 캐릭터 마커를 찾을 수 없습니다.")
@@ -307,6 +313,7 @@ def test_tile_movement():
     # 매처 및 컨트롤러 생성
     matcher = TemplateMatcher(confidence=0.6)
     controller = GameController()
+    tracker = MarkerTracker(matcher, mask_path=ICONS_DIR / "character_marker_mask.png" if use_mask_file else None)
     battle_checker = BattleChecker(matcher, controller)
     logger = TestLogger("tile_movement_test")
 
@@ -318,7 +325,7 @@ def test_tile_movement():
     time.sleep(1)
 
     # [1단계] 캐릭터 마커 위치 확인
-    initial_marker_pos, character_x, character_y = find_character_marker(matcher, use_mask_file, logger)
+    initial_marker_pos, character_x, character_y = find_character_marker(tracker, logger)
 
     # [2단계] 캐릭터 주변 발판 찾기
     has_enemy, tile_to_click = find_nearby_tile(matcher, character_x, character_y, logger)
@@ -333,7 +340,7 @@ def test_tile_movement():
         return False
 
     # [3.5단계] 캐릭터 이동 확인
-    verify_character_moved(matcher, use_mask_file, initial_marker_pos, logger)
+    verify_character_moved(tracker, initial_marker_pos, logger)
 
     # [4단계] 전투 진입 확인
     result = verify_battle_entry(battle_checker, logger)
@@ -0,0 +1,67 @@
+"""화면 캡처 백엔드 벤치마크
+
+사용 가능한 캡처 백엔드(pyautogui, xshm)별로 프레임 1장 캡처 시간을 비교합니다.
+- 전체 화면 BGR / 전체 화면 그레이스케일 / 우측 하단 버튼 영역 그레이스케일
+
+사용법:
+    python tools/benchmark_capture.py
+"""
+
+import sys
+import time
+import statistics
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.capture import create_capture_backend
+
+BACKENDS = ["pyautogui", "xshm"]
+REPEATS = 20
+
+
+def time_grab(backend, region, grayscale):
+    """캡처 시간 측정 (중앙값, 초)"""
+    backend.grab(region, grayscale)  # 워밍업 (버퍼 할당)
+
+    durations = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        backend.grab(region, grayscale)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def run_benchmark():
+    """벤치마크 실행"""
+    print("\n" + "="*60)
+    print("화면 캡처 백엔드 벤치마크")
+    print("="*60)
+
+    for name in BACKENDS:
+        try:
+            backend = create_capture_backend(name)
+        except Exception as e:
+            print(f"\n[{name}] 사용 불가: {e}")
+            continue
+
+        width, height = backend.size()
+        button_region = (int(width * 0.65), int(height * 0.78), int(width * 0.35), int(height * 0.22))
+
+        cases = [
+            ("전체 화면 BGR", None, False),
+            ("전체 화면 그레이스케일", None, True),
+            ("버튼 영역 그레이스케일", button_region, True),
+        ]
+
+        print(f"\n[{name}] {width}x{height}")
+        for label, region, grayscale in cases:
+            duration = time_grab(backend, region, grayscale)
+            print(f"  {label:24s} {duration * 1000:7.2f}ms ({1 / max(duration, 1e-9):6.1f} fps)")
+
+        backend.close()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,154 @@
+"""피라미드(coarse-to-fine) 템플릿 매칭 벤치마크
+
+녹화된 전체 화면 프레임에 대해 원본 해상도 매칭과 피라미드 매칭을 비교합니다.
+- 속도: 템플릿 1회 검색 소요 시간 (중앙값)
+- 정확도: 발견 여부 및 위치 일치율 (원본 매칭 결과 기준)
+
+사용법:
+    python tools/benchmark_pyramid.py [프레임 디렉토리]
+
+프레임 디렉토리를 지정하지 않으면 현재 해상도 ui 폴더의 전체 화면 캡처 이미지
+(formation_screen.png, stage_map.png 등)와 logs/recorded_frames/*.png를 사용합니다.
+"""
+
+import sys
+import time
+import statistics
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import cv2
+
+from config.settings import BUTTONS_DIR, ICONS_DIR, UI_DIR, LOGS_DIR
+from src.recognition.template_matcher import TemplateMatcher
+
+# StageRunner에서 전체 화면으로 검색하는 템플릿
+BENCHMARK_TEMPLATES = [
+    BUTTONS_DIR / "deploy_button.png",
+    BUTTONS_DIR / "mission_start_button.png",
+    BUTTONS_DIR / "phase_end_button.png",
+    ICONS_DIR / "start_tile.png",
+    ICONS_DIR / "enemy_tile.png",
+    ICONS_DIR / "empty_tile.png",
+]
+
+PYRAMID_SCALES = [0.5, 0.25]
+REPEATS = 5
+POSITION_TOLERANCE = 2  # 위치 일치 허용 오차 (픽셀)
+
+
+def collect_frames(frames_dir=None):
+    """벤치마크용 프레임 목록 수집"""
+    if frames_dir:
+        return sorted(Path(frames_dir).glob("*.png"))
+
+    frames = []
+    for path in sorted(UI_DIR.glob("*.png")):
+        image = cv2.imread(str(path))
+        # 전체 화면 캡처만 사용 (부분 UI 템플릿 제외)
+        if image is not None and image.shape[1] >= 1920:
+            frames.append(path)
+
+    recorded_dir = LOGS_DIR / "recorded_frames"
+    if recorded_dir.exists():
+        frames += sorted(recorded_dir.glob("*.png"))
+
+    return frames
+
+
+def time_match(matcher, frame, template_path, pyramid_scale):
+    """템플릿 검색 시간 측정 (중앙값, 초) 및 결과 반환"""
+    durations = []
+    match = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        match = matcher.find_template_in_frame(frame, template_path, pyramid_scale=pyramid_scale)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), match
+
+
+def same_result(reference, candidate):
+    """원본 매칭 결과와 피라미드 결과 일치 여부"""
+    if reference is None or candidate is None:
+        return reference is None and candidate is None
+    ref_loc, cand_loc = reference[0], candidate[0]
+    return (
+        abs(ref_loc[0] - cand_loc[0]) <= POSITION_TOLERANCE
+        and abs(ref_loc[1] - cand_loc[1]) <= POSITION_TOLERANCE
+    )
+
+
+def run_benchmark(frames_dir=None):
+    """벤치마크 실행"""
+    print("\n" + "="*70)
+    print("피라미드 템플릿 매칭 벤치마크")
+    print("="*70)
+
+    frames = collect_frames(frames_dir)
+    if not frames:
+        print("✗ 벤치마크할 프레임이 없습니다")
+        return
+
+    matcher = TemplateMatcher()
+
+    totals = {0: 0.0}
+    totals.update({scale: 0.0 for scale in PYRAMID_SCALES})
+    parity = {scale: 0 for scale in PYRAMID_SCALES}
+    hits = {0: 0}
+    hits.update({scale: 0 for scale in PYRAMID_SCALES})
+    cases = 0
+
+    for frame_path in frames:
+        frame = cv2.cvtColor(cv2.imread(str(frame_path)), cv2.COLOR_BGR2GRAY)
+
+        # 프레임 해상도 기준으로 템플릿 스케일링
+        matcher.screen_resolution = f"{frame.shape[1]}x{frame.shape[0]}"
+
+        print(f"\n[프레임] {frame_path.name} ({matcher.screen_resolution})")
+
+        for template_path in BENCHMARK_TEMPLATES:
+            if not template_path.exists():
+                continue
+
+            # 캐시 워밍업 (디코딩 시간 제외)
+            matcher.find_template_in_frame(frame, template_path, pyramid_scale=0)
+            for scale in PYRAMID_SCALES:
+                matcher.find_template_in_frame(frame, template_path, pyramid_scale=scale)
+
+            full_time, reference = time_match(matcher, frame, template_path, 0)
+            totals[0] += full_time
+            hits[0] += reference is not None
+            cases += 1
+
+            line = f"  {template_path.name:28s} 원본 {full_time * 1000:7.1f}ms {'HIT ' if reference else 'MISS'}"
+
+            for scale in PYRAMID_SCALES:
+                pyramid_time, match = time_match(matcher, frame, template_path, scale)
+                totals[scale] += pyramid_time
+                hits[scale] += match is not None
+                same = same_result(reference, match)
+                parity[scale] += same
+                line += (
+                    f" | 1/{int(1 / scale)} {pyramid_time * 1000:6.1f}ms"
+                    f" x{full_time / max(pyramid_time, 1e-9):4.1f} {'✓' if same else '✗'}"
+                )
+
+            print(line)
+
+    print("\n" + "="*70)
+    print("요약")
+    print("="*70)
+    print(f"측정 케이스: {cases}개 (프레임 {len(frames)}개)")
+    print(f"원본 매칭: 총 {totals[0] * 1000:.1f}ms, 발견 {hits[0]}/{cases}")
+    for scale in PYRAMID_SCALES:
+        speedup = totals[0] / max(totals[scale], 1e-9)
+        print(
+            f"피라미드 1/{int(1 / scale)}: 총 {totals[scale] * 1000:.1f}ms (x{speedup:.1f}), "
+            f"발견 {hits[scale]}/{cases}, 결과 일치 {parity[scale]}/{cases}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1] if len(sys.argv) > 1 else None)
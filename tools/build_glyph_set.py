@@ -0,0 +1,155 @@
+"""숫자 글리프 세트 생성 도구 (DigitRecognizer 보정)
+
+캡처 화면의 숫자 영역과 정답 값을 받아 글리프를 분리하고
+assets/glyphs/<폰트>/<숫자>_<번호>.png 로 저장합니다.
+이미 있는 글리프와 거의 같은 글리프(유사도 ≥ DUPLICATE_SCORE)는 저장하지 않으므로
+새 캡처로 여러 번 실행해서 글리프 세트를 보강할 수 있습니다.
+
+사용법:
+    python tools/build_glyph_set.py <폰트> <스크린샷> <x1,y1,x2,y2=값> [<x1,y1,x2,y2=값> ...]
+        예: python tools/build_glyph_set.py damage result.png 400,200,550,240=12345
+
+    python tools/build_glyph_set.py --verify <폰트> <스크린샷> <x1,y1,x2,y2=값> [...]
+        → 글리프를 저장하지 않고 검증만 (글리프를 뽑지 않은 캡처로 검증할 때 사용)
+
+저장 후 모든 샘플을 다시 읽어서 정답과 비교합니다. 같은 샘플에서 뽑은 글리프이므로
+실제 정확도는 --verify로 다른 캡처에서 확인하세요.
+0~9 중 빠진 숫자가 있으면 OCRReader는 이 세트를 쓰지 않고 Tesseract로 읽습니다.
+(템플릿 폴더의 damage_report.png, cost_N.png에는 1, 8, 9 등이 없어 완전한 세트를 만들 수 없으므로
+ 0~9가 모두 나오는 캡처로 생성하세요)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from PIL import Image
+
+from src.recognition.digit_recognizer import DigitRecognizer
+
+DUPLICATE_SCORE = 0.98  # 이 값 이상이면 같은 글리프로 보고 저장하지 않음
+
+
+def parse_samples(font, screenshot, specs):
+    """명령행 샘플 파싱 (x1,y1,x2,y2=값)"""
+    samples = []
+    for spec in specs:
+        region, value = spec.split("=")
+        bbox = tuple(int(v) for v in region.split(","))
+        samples.append((font, Path(screenshot), bbox, value))
+    return samples
+
+
+def load_roi(path, bbox):
+    """스크린샷에서 영역 잘라내기 (RGB 배열)"""
+    image = Image.open(path).convert("RGB")
+    if bbox:
+        image = image.crop(bbox)
+    return np.array(image)
+
+
+def extract_glyphs(recognizer, samples):
+    """
+    샘플에서 정답 숫자별 글리프 추출
+
+    Returns:
+        [(숫자, 정규화 글리프), ...]
+    """
+    glyphs = []
+    for _, path, bbox, value in samples:
+        roi = load_roi(path, bbox)
+        mask = recognizer.binarize(roi)
+        boxes = recognizer.segment(mask)
+
+        if boxes is None:
+            print(f"  ✗ {path.name} {bbox}: ROI 테두리에 잘린 숫자가 있음 ('{value}'), 건너뜀")
+            continue
+        if len(boxes) != len(value):
+            print(f"  ✗ {path.name} {bbox}: 글리프 {len(boxes)}개 ≠ 정답 자릿수 {len(value)} ('{value}'), 건너뜀")
+            continue
+
+        for digit, box in zip(value, boxes):
+            glyphs.append((int(digit), recognizer.normalize_glyph(mask, box)))
+        print(f"  ✓ {path.name} {bbox or ''}: '{value}' 글리프 {len(boxes)}개")
+
+    return glyphs
+
+
+def save_glyphs(recognizer, glyphs):
+    """기존 글리프와 중복되지 않는 글리프만 저장 (저장 개수 반환)"""
+    recognizer.glyph_dir.mkdir(parents=True, exist_ok=True)
+
+    saved = 0
+    for digit, glyph in glyphs:
+        vector = DigitRecognizer._normalize_vectors(glyph[np.newaxis])[0]
+
+        same_digit = recognizer.matrix[recognizer.labels == digit]
+        if len(same_digit) and float((same_digit @ vector).max()) >= DUPLICATE_SCORE:
+            continue
+
+        index = len(list(recognizer.glyph_dir.glob(f"{digit}_*.png")))
+        Image.fromarray(glyph).save(recognizer.glyph_dir / f"{digit}_{index}.png")
+
+        # 다음 글리프의 중복 검사에 포함
+        recognizer.labels = np.append(recognizer.labels, digit)
+        recognizer.matrix = np.vstack([recognizer.matrix, vector])
+        saved += 1
+
+    return saved
+
+
+def verify(recognizer, samples):
+    """저장한 글리프 세트로 샘플 다시 읽기"""
+    correct = 0
+    durations = []
+    for _, path, bbox, value in samples:
+        roi = load_roi(path, bbox)
+
+        start = time.perf_counter()
+        result, confidence = recognizer.read(roi)
+        durations.append(time.perf_counter() - start)
+
+        ok = result is not None and str(result) == value
+        correct += ok
+        print(f"  {'✓' if ok else '✗'} 정답 {value} → 인식 {result} (신뢰도 {confidence:.2f})")
+
+    print(f"  정확도: {correct}/{len(samples)}, 평균 {np.mean(durations) * 1000:.3f}ms")
+
+
+def build(samples):
+    """폰트별 글리프 세트 생성 및 검증"""
+    fonts = sorted({font for font, _, _, _ in samples})
+
+    for font in fonts:
+        font_samples = [sample for sample in samples if sample[0] == font]
+
+        print("\n" + "="*60)
+        print(f"글리프 세트: {font} (샘플 {len(font_samples)}개)")
+        print("="*60)
+
+        recognizer = DigitRecognizer(font)
+        glyphs = extract_glyphs(recognizer, font_samples)
+        saved = save_glyphs(recognizer, glyphs)
+
+        recognizer = DigitRecognizer(font)  # 저장된 파일로 다시 로드
+        print(f"\n저장: {saved}개 추가 → {recognizer.glyph_dir} (전체 {len(recognizer.labels)}개, "
+              f"숫자 {sorted(set(recognizer.labels.tolist()))})")
+        if recognizer.missing_digits:
+            print(f"⚠ 없는 숫자 {recognizer.missing_digits}: 모든 숫자를 포함한 캡처를 추가하기 전까지 "
+                  f"OCRReader는 이 세트를 사용하지 않습니다")
+
+        print("\n검증:")
+        verify(recognizer, font_samples)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 5 and sys.argv[1] == "--verify":
+        verify(DigitRecognizer(sys.argv[2]), parse_samples(sys.argv[2], sys.argv[3], sys.argv[4:]))
+    elif len(sys.argv) >= 4:
+        build(parse_samples(sys.argv[1], sys.argv[2], sys.argv[3:]))
+    else:
+        print(__doc__)
@@ -0,0 +1,126 @@
+"""템플릿 번들 생성 도구 (빌드 시 실행)
+
+assets/templates/<해상도>/{buttons,icons,ui}의 템플릿을 미리 디코딩/스케일링해서
+하나의 uint8 배열 파일(assets/template_bundle.npy)과 인덱스(assets/template_bundle.json)로 저장합니다.
+실행 시에는 TemplateBundle이 번들을 메모리 맵으로 열어 PNG 디코딩 없이 사용합니다.
+
+각 템플릿마다 저장하는 배열:
+- 지원 해상도별 그레이스케일 / BGR (원본 크기 + 피라미드 축소 배율)
+- 알파 채널 마스크 (원본 해상도, 투명 PNG만)
+
+전체 화면 캡처 같은 큰 참조 이미지(TEMPLATE_BUNDLE_MAX_PIXELS 초과)는 번들에 포함하지 않습니다.
+BlueArchiveAutoTest.spec이 PyInstaller 빌드 전에 자동으로 실행합니다.
+
+사용법:
+    python tools/build_template_bundle.py
+"""
+
+import sys
+import json
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from PIL import Image
+
+from config.settings import (
+    TEMPLATES_DIR, SUPPORTED_RESOLUTIONS, TEMPLATE_PYRAMID_SCALE,
+    TEMPLATE_BUNDLE_FILE, TEMPLATE_BUNDLE_INDEX, TEMPLATE_BUNDLE_MAX_PIXELS
+)
+from src.recognition.template_cache import TemplateCache, parse_template_resolution
+from src.recognition.template_bundle import BUNDLE_VERSION, bundle_key
+
+TEMPLATE_SUBDIRS = ("buttons", "icons", "ui")
+SCALES = sorted({1.0, TEMPLATE_PYRAMID_SCALE}, reverse=True)
+
+
+def find_templates():
+    """번들 대상 템플릿 목록 (해상도 폴더의 buttons/icons/ui PNG)"""
+    templates = []
+    skipped = []
+
+    for resolution_dir in sorted(TEMPLATES_DIR.iterdir()):
+        if not resolution_dir.is_dir() or parse_template_resolution(resolution_dir) is None:
+            continue
+
+        for subdir in TEMPLATE_SUBDIRS:
+            for path in sorted((resolution_dir / subdir).glob("*.png")):
+                with Image.open(path) as image:
+                    pixels = image.width * image.height
+
+                if pixels > TEMPLATE_BUNDLE_MAX_PIXELS:
+                    skipped.append(path)
+                else:
+                    templates.append(path)
+
+    return templates, skipped
+
+
+def build_bundle():
+    """번들 생성"""
+    print("\n" + "="*60)
+    print("템플릿 번들 생성")
+    print("="*60)
+
+    start = time.perf_counter()
+    templates, skipped = find_templates()
+
+    # _load()/_load_alpha()는 번들을 거치지 않고 PNG를 직접 디코딩
+    cache = TemplateCache()
+
+    chunks = []
+    entries = {}
+    sources = {}
+    offset = 0
+
+    def add(key, array):
+        nonlocal offset
+        array = np.ascontiguousarray(array, dtype=np.uint8)
+        entries[key] = {"offset": offset, "shape": list(array.shape)}
+        chunks.append(array.ravel())
+        offset += array.size
+
+    for path in templates:
+        relative_path = path.relative_to(TEMPLATES_DIR).as_posix()
+        stat = path.stat()
+        sources[relative_path] = {
+            "resolution": parse_template_resolution(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+        for resolution in SUPPORTED_RESOLUTIONS:
+            for scale in SCALES:
+                for grayscale, kind in ((True, "gray"), (False, "bgr")):
+                    array = cache._load(path, resolution, grayscale, scale)
+                    if array is not None:
+                        add(bundle_key(relative_path, resolution, kind, scale), array)
+
+        # 알파 채널이 없는 템플릿도 빈 배열로 기록 (get_masked()가 "알파 없음"을 확인하려고 PNG를 열지 않도록)
+        alpha = cache._load_alpha(path)
+        if alpha is not None:
+            add(bundle_key(relative_path, sources[relative_path]["resolution"], "alpha"), alpha)
+
+        print(f"  ✓ {relative_path}")
+
+    data = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8)
+
+    TEMPLATE_BUNDLE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    np.save(TEMPLATE_BUNDLE_FILE, data)
+    with open(TEMPLATE_BUNDLE_INDEX, 'w', encoding='utf-8') as f:
+        json.dump({"version": BUNDLE_VERSION, "sources": sources, "entries": entries}, f)
+
+    for path in skipped:
+        print(f"  - 제외 (참조 이미지, {TEMPLATE_BUNDLE_MAX_PIXELS}픽셀 초과): {path.relative_to(TEMPLATES_DIR).as_posix()}")
+
+    print(f"\n템플릿 {len(templates)}개, 배열 {len(entries)}개, {data.nbytes / 1024 / 1024:.1f}MB "
+          f"({time.perf_counter() - start:.1f}초)")
+    print(f"저장: {TEMPLATE_BUNDLE_FILE}")
+    print(f"      {TEMPLATE_BUNDLE_INDEX}")
+
+
+if __name__ == "__main__":
+    build_bundle()
@@ -0,0 +1,129 @@
+"""녹화 화면 재생 벤치마크 (라이브 게임 없이 실행)
+
+ReplayBackend로 녹화 프레임을 화면처럼 재생하면서 TemplateMatcher / GameController를
+실제와 같은 방식으로 실행하고, 단계별 인식 지연과 처리량을 측정합니다.
+
+각 단계에서:
+1. 모든 버튼 템플릿을 한 프레임에서 검색 (find_many)
+2. 발견된 버튼을 클릭 → 타임라인이 다음 화면으로 진행
+3. 버튼이 없으면 타임라인을 직접 진행
+
+결과 요약의 digest는 발견 위치 전체의 해시입니다. 같은 프레임/타임라인이면 항상
+같은 값이 나와야 합니다 (결정성 확인용).
+
+사용법:
+    python tools/replay_benchmark.py [프레임 디렉토리 또는 동영상] [타임라인 JSON]
+
+프레임을 지정하지 않으면 현재 해상도 ui 폴더의 전체 화면 캡처 이미지를 순서대로 재생합니다.
+헤드리스 Linux에서도 실행할 수 있도록 캡처 백엔드로 ReplayBackend를 직접 사용합니다.
+"""
+
+import sys
+import time
+import hashlib
+import statistics
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+
+from config.settings import BUTTONS_DIR, UI_DIR
+from src.capture.replay import ReplayBackend
+from src.recognition.template_matcher import TemplateMatcher
+from src.automation.game_controller import GameController
+
+REPEATS = 3  # 단계별 반복 측정 횟수 (중앙값 사용)
+
+
+def default_timeline():
+    """ui 폴더의 전체 화면 캡처로 기본 타임라인 생성 (클릭마다 진행)"""
+    frames = []
+    for path in sorted(UI_DIR.glob("*.png")):
+        with Image.open(path) as image:
+            if image.width >= 1920:
+                frames.append(path.name)
+
+    steps = [{"frame": name, "advance": "click"} for name in frames]
+    if steps:
+        steps[-1]["advance"] = "none"
+    return UI_DIR, {"frames": steps}
+
+
+def run_benchmark(source=None, timeline=None):
+    """벤치마크 실행"""
+    print("\n" + "="*70)
+    print("녹화 화면 재생 벤치마크")
+    print("="*70)
+
+    if source is None:
+        source, timeline = default_timeline()
+
+    backend = ReplayBackend(source, timeline)
+    matcher = TemplateMatcher(capture_backend=backend, use_location_hints=False)
+    controller = GameController(capture_backend=backend)
+
+    templates = {path.stem: path for path in sorted(BUTTONS_DIR.glob("*.png"))}
+
+    print(f"재생 소스: {source}")
+    print(f"단계: {len(backend.steps)}개, 화면: {backend.size()[0]}x{backend.size()[1]}")
+    print(f"버튼 템플릿: {len(templates)}개")
+
+    # 템플릿 캐시 워밍업 (디코딩/스케일링 시간 제외)
+    for path in templates.values():
+        matcher._load_template(path, grayscale=True)
+
+    digest = hashlib.blake2b(digest_size=8)
+    latencies = []
+    run_start = time.perf_counter()
+
+    while True:
+        step_index = backend.step_index
+        frame_name = backend.current_step["frame"]
+
+        durations = []
+        locations = {}
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            locations = matcher.find_many(templates)
+            durations.append(time.perf_counter() - start)
+
+        latency = statistics.median(durations)
+        latencies.append(latency)
+
+        found = {name: loc for name, loc in locations.items() if loc}
+        digest.update(f"{step_index}:{sorted(found.items())}".encode())
+
+        print(f"\n[{step_index}] {frame_name}: {latency * 1000:.1f}ms")
+        for name, location in found.items():
+            print(f"  ✓ {name} at {location}")
+
+        if backend.finished:
+            break
+
+        if found:
+            name, location = next(iter(found.items()))
+            controller.click_template(location, wait_after=1.0)
+            if backend.step_index == step_index:
+                backend.advance()  # 클릭 영역이 타임라인과 다르면 직접 진행
+        else:
+            backend.advance()
+
+    total = time.perf_counter() - run_start
+
+    print("\n" + "="*70)
+    print("요약")
+    print("="*70)
+    print(f"단계: {len(latencies)}개, 전체 {total:.2f}초 (반복 {REPEATS}회 포함)")
+    print(f"인식 지연: 중앙값 {statistics.median(latencies) * 1000:.1f}ms, 최대 {max(latencies) * 1000:.1f}ms")
+    print(f"처리량: {len(latencies) * REPEATS / total:.1f} 프레임/초 (버튼 {len(templates)}개 동시 검색)")
+    print(f"캡처: {backend.grabs}회, 시뮬레이션 입력: {len(backend.inputs)}회")
+    print(f"digest: {digest.hexdigest()}")
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        sys.argv[1] if len(sys.argv) > 1 else None,
+        sys.argv[2] if len(sys.argv) > 2 else None,
+    )